@@ -19,7 +19,15 @@ CREATE TABLE IF NOT EXISTS users (
                 description TEXT,
                 mongo_id VARCHAR(24) NULL, 
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                -- Browse list: status filter + ORDER BY status, date DESC, created_at DESC, id DESC
+                INDEX idx_items_browse (status, date DESC, created_at DESC, id DESC),
+                INDEX idx_items_category_browse (category, status, date DESC, created_at DESC, id DESC),
+                INDEX idx_items_location_browse (location, status, date DESC, created_at DESC, id DESC),
+                -- A user's own items, newest first
+                INDEX idx_items_owner (user_id, created_at DESC),
+                -- Keyword search
+                FULLTEXT INDEX ft_items_search (title, description)
             ) ENGINE=InnoDB;
             
  CREATE TABLE IF NOT EXISTS claims (
@@ -31,7 +39,49 @@ CREATE TABLE IF NOT EXISTS users (
                 mongo_detail_id VARCHAR(24) NULL, 
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
-                FOREIGN KEY (claimant_id) REFERENCES users(id) ON DELETE CASCADE
+                FOREIGN KEY (claimant_id) REFERENCES users(id) ON DELETE CASCADE,
+                -- Claims on an item / by a claimant, newest first
+                INDEX idx_claims_item (item_id, created_at DESC),
+                INDEX idx_claims_claimant (claimant_id, created_at DESC)
+            ) ENGINE=InnoDB;
+
+ -- Saved searches and the alerts raised when a new item matches one
+ CREATE TABLE IF NOT EXISTS saved_searches (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                user_id INT NOT NULL,
+                category VARCHAR(100) NULL,
+                location VARCHAR(255) NULL,
+                keywords VARCHAR(255) NULL,
+                status ENUM('lost', 'found') NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+            ) ENGINE=InnoDB;
+ CREATE TABLE IF NOT EXISTS search_alerts (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                user_id INT NOT NULL,
+                saved_search_id INT NOT NULL,
+                item_id INT NOT NULL,
+                seen BOOLEAN NOT NULL DEFAULT FALSE,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                FOREIGN KEY (saved_search_id) REFERENCES saved_searches(id) ON DELETE CASCADE,
+                FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
+                -- One alert per search and item
+                UNIQUE KEY uq_search_alerts (saved_search_id, item_id),
+                -- A user's unseen alerts, newest first
+                INDEX idx_search_alerts_user (user_id, seen, created_at DESC)
+            ) ENGINE=InnoDB;
+
+ -- Schema migrations applied so far (see migrate-schema in twadrlik maintenance.py);
+ -- this file already contains everything up to the version inserted below
+ CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                description VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             ) ENGINE=InnoDB;
+ INSERT IGNORE INTO schema_migrations (version, description) VALUES
+                (1, 'Browse, profile and claim indexes'),
+                (2, 'Keyword search index'),
+                (3, 'Saved searches and alerts');
 select * from items;
 select * from claims;
\ No newline at end of file
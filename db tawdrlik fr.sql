@@ -22,7 +22,15 @@ CREATE TABLE IF NOT EXISTS objets (
     description_meta TEXT,
     id_mongo_details VARCHAR(24) NULL, -- Lien vers les détails MongoDB (image, etc.)
     date_signalement TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    CONSTRAINT fk_objets_utilisateurs FOREIGN KEY (id_utilisateur_proprietaire) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE
+    CONSTRAINT fk_objets_utilisateurs FOREIGN KEY (id_utilisateur_proprietaire) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE,
+    -- Consultation : filtre sur le statut + ORDER BY statut_objet, date_evenement DESC, date_signalement DESC, id_objet DESC
+    INDEX idx_objets_consultation (statut_objet, date_evenement DESC, date_signalement DESC, id_objet DESC),
+    INDEX idx_objets_categorie_consultation (categorie, statut_objet, date_evenement DESC, date_signalement DESC, id_objet DESC),
+    INDEX idx_objets_lieu_consultation (lieu, statut_objet, date_evenement DESC, date_signalement DESC, id_objet DESC),
+    -- Objets d'un utilisateur, les plus récents d'abord
+    INDEX idx_objets_proprietaire (id_utilisateur_proprietaire, date_signalement DESC),
+    -- Recherche par mots-clés
+    FULLTEXT INDEX ft_objets_recherche (titre, description_meta)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Table pour les réclamations sur les objets
@@ -35,9 +43,53 @@ CREATE TABLE IF NOT EXISTS reclamations (
     id_mongo_preuve VARCHAR(24) NULL, -- Lien vers les détails de la preuve en MongoDB
     date_soumission_reclamation TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     CONSTRAINT fk_reclamations_objets FOREIGN KEY (id_objet_reclame) REFERENCES objets(id_objet) ON DELETE CASCADE,
-    CONSTRAINT fk_reclamations_utilisateurs FOREIGN KEY (id_utilisateur_reclamant) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE
+    CONSTRAINT fk_reclamations_utilisateurs FOREIGN KEY (id_utilisateur_reclamant) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE,
+    -- Réclamations sur un objet / d'un réclamant, les plus récentes d'abord
+    INDEX idx_reclamations_objet (id_objet_reclame, date_soumission_reclamation DESC),
+    INDEX idx_reclamations_reclamant (id_utilisateur_reclamant, date_soumission_reclamation DESC)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Table pour les recherches enregistrées
+CREATE TABLE IF NOT EXISTS recherches_enregistrees (
+    id_recherche INT AUTO_INCREMENT PRIMARY KEY,
+    id_utilisateur INT NOT NULL,
+    categorie VARCHAR(100) NULL,
+    lieu VARCHAR(255) NULL,
+    mots_cles VARCHAR(255) NULL,
+    statut_objet ENUM('lost', 'found') NULL,
+    date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_recherches_utilisateurs FOREIGN KEY (id_utilisateur) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Table pour les alertes levées quand un nouvel objet correspond à une recherche enregistrée
+CREATE TABLE IF NOT EXISTS alertes_recherche (
+    id_alerte INT AUTO_INCREMENT PRIMARY KEY,
+    id_utilisateur INT NOT NULL,
+    id_recherche INT NOT NULL,
+    id_objet INT NOT NULL,
+    vue BOOLEAN NOT NULL DEFAULT FALSE,
+    date_alerte TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_alertes_utilisateurs FOREIGN KEY (id_utilisateur) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE,
+    CONSTRAINT fk_alertes_recherches FOREIGN KEY (id_recherche) REFERENCES recherches_enregistrees(id_recherche) ON DELETE CASCADE,
+    CONSTRAINT fk_alertes_objets FOREIGN KEY (id_objet) REFERENCES objets(id_objet) ON DELETE CASCADE,
+    -- Une alerte par recherche et par objet
+    UNIQUE KEY uq_alertes_recherche (id_recherche, id_objet),
+    -- Alertes non vues d'un utilisateur, les plus récentes d'abord
+    INDEX idx_alertes_utilisateur (id_utilisateur, vue, date_alerte DESC)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Migrations de schéma déjà appliquées (voir migrate-schema dans twadrlik maintenance.py) ;
+-- ce fichier contient déjà tout jusqu'à la version insérée ci-dessous
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INT PRIMARY KEY,
+    description VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+INSERT IGNORE INTO schema_migrations (version, description) VALUES
+    (1, 'Browse, profile and claim indexes'),
+    (2, 'Keyword search index'),
+    (3, 'Saved searches and alerts');
+
 -- Les lignes SELECT * suivantes sont pour la vérification et ne font pas partie de la structure de création
 -- Vous pouvez les exécuter après la création pour voir les tables vides (si la base est nouvelle)
 -- SELECT * FROM objets;
@@ -1,9 +1,21 @@
 import sys
+import os
 import re 
 import datetime
+import time
 import hashlib 
+import threading
+import queue
+import json
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
 import mysql.connector
-from pymongo import MongoClient
+import numpy as np
+from pymongo import MongoClient, ReturnDocument, monitoring
+from pymongo.errors import DuplicateKeyError
+import gridfs
 from bson.objectid import ObjectId 
 from bson.binary import Binary 
 import base64       # <-- To handle potential large image data conversion if needed
@@ -14,14 +26,19 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QLineEd
                             QStackedWidget, QComboBox, QDateEdit, QTextEdit,
                             QListWidget, QListWidgetItem, QMessageBox, QGroupBox,
                             QScrollArea, QSizePolicy, QSpacerItem, QFileDialog,
-                            QDialog, QDialogButtonBox) 
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap
-from PyQt5.QtCore import Qt, QDate, QBuffer, QIODevice, QTimer, QSize 
+                            QDialog, QDialogButtonBox, QListView, QAbstractItemView,
+                            QStyledItemDelegate) 
+from PyQt5.QtGui import (QFont, QFontMetrics, QColor, QPalette, QIcon, QPixmap, QImage, QImageReader, QPainter,
+                         QTextLayout)
+from PyQt5.QtCore import (Qt, QDate, QBuffer, QByteArray, QIODevice, QTimer, QSize, QRect, QRectF,
+                          QPoint, QEvent, QModelIndex, QAbstractListModel, QObject, pyqtSignal)
 
 # Global variables for database connections 
-mysql_connection = None
+mysql_pool = None
 mongo_client = None
 mongo_db = None
+mongo_last_ok = 0.0 # time.monotonic() of the last successful MongoDB command
+thumbnail_disk_cache = None # ThumbnailDiskCache, or False once it turned out to be unusable
 
 # Database configuration
 MYSQL_CONFIG = {
@@ -31,8 +48,98 @@ MYSQL_CONFIG = {
     'database': 'tawdrlik_DB'
 }
 
+# MySQL connection pool: every data function checks out its own connection and returns it
+# when done, so background loaders and writes can run in parallel threads
+MYSQL_POOL_SIZE = 5
+MYSQL_POOL_TIMEOUT = 10 # Seconds to wait for a free connection
+
+# Connection health: liveness is inferred from the outcome of real queries. A connection is only
+# pinged when it has been idle longer than this, or after a query on it failed.
+HEALTH_CHECK_IDLE_SECONDS = 30
+MYSQL_RECONNECT_ATTEMPTS = 2
+
 MONGODB_URI = "mongodb://localhost:27017/"
 MONGODB_DB = "tawdrlikDB"
+MONGO_IN_BATCH_SIZE = 500 # Max ObjectIds per $in query when resolving details in bulk
+
+# Browse page: items are fetched in pages, seeking past the last row shown (no OFFSET scans),
+# and the next page is requested when the user scrolls within this many pixels of the bottom
+BROWSE_PAGE_SIZE = 50
+BROWSE_PREFETCH_MARGIN_PX = 600
+ITEM_STATUS_ORDER = ('lost', 'found', 'recovered') # ENUM order, which ORDER BY i.status follows
+
+# Keyword search runs on the FULLTEXT(title, description) index: every word must match, as a prefix, and
+# results come most relevant first. Words shorter than InnoDB's innodb_ft_min_token_size are not indexed.
+SEARCH_MIN_WORD_LENGTH = 3
+# Typo tolerance: a search word that no title contains is widened to the title words whose trigram similarity
+# reaches FUZZY_MIN_SIMILARITY (at most FUZZY_MAX_ALTERNATIVES of them); a typed location that matches no
+# known location is widened to the closest known ones the same way.
+FUZZY_MIN_SIMILARITY = 0.4
+FUZZY_MAX_ALTERNATIVES = 5
+
+# Lost-to-found matching: a new lost (found) item is scored against the open found (lost) items of the same
+# category dated within MATCH_DATE_WINDOW_DAYS of it, a range the category browse index serves directly.
+# The score weighs TF-IDF cosine similarity of title + description against location and date proximity.
+MATCH_DATE_WINDOW_DAYS = 30
+MATCH_MAX_CANDIDATES = 5000
+MATCH_WEIGHTS = {'text': 0.6, 'location': 0.25, 'date': 0.15}
+MATCH_MIN_SCORE = 0.35
+MATCH_MAX_RESULTS = 3
+
+# Look-alike photos: each item photo gets a 64-bit difference hash (dHash) when it is saved. Photos whose hashes
+# differ in at most IMAGE_MATCH_MAX_DISTANCE bits are taken to show the same object. Lookups go through a
+# BK-tree, which only visits the hashes that can be within that distance.
+IMAGE_MATCH_MAX_DISTANCE = 10
+IMAGE_MATCH_MAX_RESULTS = 3
+
+# Duplicate posts: title + description are reduced to a MinHash signature of their character shingles, split
+# into LSH bands. A new post is only compared with the same user's posts in the same category that share a band,
+# and is flagged when their estimated Jaccard similarity reaches DUPLICATE_MIN_SIMILARITY.
+DUPLICATE_SHINGLE_SIZE = 4
+DUPLICATE_MINHASH_PERMUTATIONS = 64
+DUPLICATE_LSH_BANDS = 16 # 4 rows per band: posts around 50% similar already share a band
+DUPLICATE_MIN_SIMILARITY = 0.7
+
+# Saved searches: each one is posted in an inverted index under its most selective term (its longest keyword,
+# else its location, category, status, or a catch-all bucket). A new item is then only checked against the
+# searches posted under its own words, location, category and status. With a TTL (seconds), the index is
+# reloaded to pick up searches saved by other app instances.
+SAVED_SEARCH_INDEX_TTL_SECONDS = None
+SEARCH_ALERTS_SHOWN = 10 # Alerts listed by name in the notification; the rest are counted
+
+# The browse filters' distinct categories and locations are loaded once, then kept current by save_item.
+# When several app instances write to the same database, set a TTL (seconds) so each one also picks up
+# the values added by the others.
+FACET_CACHE_TTL_SECONDS = None
+
+# List views never load image blobs; cards fetch them once they are actually on screen
+LAZY_IMAGE_DELAY_MS = 50
+
+# Thumbnails are generated at upload time, at 1x and 2x (HiDPI) of the on-screen preview size
+ITEM_THUMBNAIL_SIZE = 100     # Item card image
+EVIDENCE_THUMBNAIL_SIZE = 60  # Claim evidence preview
+THUMBNAIL_SCALES = (1, 2)
+THUMBNAIL_JPEG_QUALITY = 85
+# Decoded, display-sized pixmaps are kept in a process-wide LRU cache so that revisiting a page
+# does not decode and scale the same images again; bounded by the decoded size of its entries
+PIXMAP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Thumbnail bytes fetched from MongoDB are also kept on disk across sessions, in an append-only pack file
+# read through mmap. Past the size cap the pack is compacted down to its most recently used records.
+# Set THUMBNAIL_DISK_CACHE_DIR to None to disable it.
+THUMBNAIL_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".tawdrlik", "thumbnail_cache")
+THUMBNAIL_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+THUMBNAIL_DISK_CACHE_COMPACT_RATIO = 0.75 # Compaction keeps this fraction of the cap, leaving room to grow
+THUMBNAIL_DISK_CACHE_MAX_ENTRY_BYTES = 1024 * 1024 # Larger originals (documents without thumbnails) are not cached
+
+# Image storage: "embedded" keeps originals as Binary inside items_detail/claims_detail
+# (limited by the 16MB BSON document size), "gridfs" streams them into a GridFS bucket.
+IMAGE_STORAGE = "embedded"
+MAX_EMBEDDED_IMAGE_SIZE = 16 * 1024 * 1024
+GRIDFS_BUCKET = "images"
+GRIDFS_CHUNK_SIZE = 255 * 1024
+# Originals are stored once per distinct content in this collection, keyed by their SHA-256
+# and reference counted; item and claim documents only keep the hash.
+IMAGE_BLOBS_COLLECTION = "image_blobs"
 
 # App styling constants
 PRIMARY_COLOR = "#3BAFDA"
@@ -43,28 +150,170 @@ FONT_FAMILY = "Arial"
 
 # --- Database Connection Functions ---
 
+class MySQLPool:
+    """Fixed-size pool of MySQL connections, opened lazily up to size.
+       A connection is pinged on checkout only if it sat idle past HEALTH_CHECK_IDLE_SECONDS or its
+       last query failed; otherwise checkouts and returns cost no round trip.
+    """
+    def __init__(self, size, config):
+        self._config = config
+        self._size = size
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._idle = queue.LifoQueue() # Most recently used first, so the hot connections stay hot
+
+    def _open_connection(self):
+        with self._lock:
+            if self._opened >= self._size:
+                return None
+            self._opened += 1
+        try:
+            return mysql.connector.connect(**self._config)
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def checkout(self, timeout):
+        try:
+            raw, last_ok, healthy = self._idle.get_nowait()
+        except queue.Empty:
+            raw = self._open_connection()
+            if raw is not None:
+                return PooledMySQLConnection(self, raw)
+            try:
+                raw, last_ok, healthy = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise mysql.connector.errors.PoolError(f"No MySQL connection available after {timeout}s")
+        if not healthy or time.monotonic() - last_ok > HEALTH_CHECK_IDLE_SECONDS:
+            try:
+                raw.ping(reconnect=True, attempts=MYSQL_RECONNECT_ATTEMPTS, delay=1)
+            except Exception:
+                self._idle.put((raw, 0.0, False))
+                raise
+        return PooledMySQLConnection(self, raw)
+
+    def checkin(self, raw, healthy):
+        if healthy and raw.in_transaction:
+            # The caller neither committed nor rolled back
+            try:
+                raw.rollback()
+            except Exception:
+                healthy = False
+        self._idle.put((raw, time.monotonic(), healthy))
+
+    def close_all(self):
+        while True:
+            try:
+                raw, _, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+
+class PooledMySQLConnection:
+    """Connection checked out of a MySQLPool. close() hands it back to the pool."""
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self.healthy = True
+
+    def cursor(self, **kwargs):
+        return HealthTrackingCursor(self, kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def close(self):
+        if self._raw is not None:
+            self._pool.checkin(self._raw, self.healthy)
+            self._raw = None
+
+
+class HealthTrackingCursor:
+    """Cursor recording query outcomes on its connection. A query that fails because the
+       connection dropped is retried once after reconnecting, unless a transaction was open.
+    """
+    def __init__(self, connection, kwargs):
+        self._connection = connection
+        self._kwargs = kwargs
+        self._cursor = connection._raw.cursor(**kwargs)
+
+    def execute(self, operation, params=None):
+        raw = self._connection._raw
+        in_transaction = raw.in_transaction
+        try:
+            return self._cursor.execute(operation, params)
+        except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError):
+            self._connection.healthy = False
+            if in_transaction:
+                raise # Earlier statements of the transaction are lost, let the caller roll back
+        try:
+            self._cursor.close()
+        except Exception:
+            pass
+        raw.reconnect(attempts=MYSQL_RECONNECT_ATTEMPTS, delay=1)
+        self._cursor = raw.cursor(**self._kwargs)
+        result = self._cursor.execute(operation, params)
+        self._connection.healthy = True
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
 def connect_to_mysql():
-    global mysql_connection
-    if mysql_connection and mysql_connection.is_connected():
-        return True # Already connected
+    """Create the MySQL connection pool on first use. Returns False if the database is unreachable."""
+    global mysql_pool
+    if mysql_pool is not None:
+        return True # Pool already created
     try:
-        mysql_connection = mysql.connector.connect(**MYSQL_CONFIG, autocommit=False) 
-        # Test connection
-        cursor = mysql_connection.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchall() 
-        cursor.close()
+        # Autocommit: reads never hold a transaction open; writes call start_transaction() explicitly
+        pool = MySQLPool(MYSQL_POOL_SIZE, dict(MYSQL_CONFIG, autocommit=True))
+        pool.checkout(MYSQL_POOL_TIMEOUT).close() # Open a first connection to test the settings
+        mysql_pool = pool
         print("MySQL connected successfully")
         return True
     except mysql.connector.Error as err:
         print(f"MySQL Error: {err}")
         QMessageBox.critical(None, "Database Error", f"MySQL Connection Failed: {err}")
-        mysql_connection = None # Ensure it's None on failure
+        mysql_pool = None # Ensure it's None on failure
         return False
 
+def get_mysql_connection():
+    """Check a connection out of the pool, waiting up to MYSQL_POOL_TIMEOUT seconds for one to be returned.
+       Callers must close() it to hand it back to the pool (which also rolls back any open transaction).
+    """
+    return mysql_pool.checkout(MYSQL_POOL_TIMEOUT)
+
+def close_mysql_pool():
+    """Close the idle pooled connections (checked-out ones stay usable until returned)."""
+    global mysql_pool
+    if mysql_pool is not None:
+        mysql_pool.close_all()
+        mysql_pool = None
+
+class MongoHealthListener(monitoring.CommandListener):
+    """Records the outcome of every MongoDB command, so connect_to_mongodb only pings after idle periods or failures."""
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        global mongo_last_ok
+        mongo_last_ok = time.monotonic()
+
+    def failed(self, event):
+        global mongo_last_ok
+        mongo_last_ok = 0.0
+
 def connect_to_mongodb():
     global mongo_client, mongo_db
     if mongo_client is not None and mongo_db is not None:
+         if time.monotonic() - mongo_last_ok < HEALTH_CHECK_IDLE_SECONDS:
+              return True # Recent commands succeeded; the driver reconnects by itself if needed
          try:
               mongo_client.admin.command('ping')
               return True
@@ -73,7 +322,8 @@ def connect_to_mongodb():
               mongo_client = None
               mongo_db = None
     try:
-        mongo_client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000) 
+        mongo_client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000,
+                                   event_listeners=[MongoHealthListener()])
         mongo_client.admin.command('ismaster')
         mongo_db = mongo_client[MONGODB_DB]
         print("MongoDB connected successfully")
@@ -85,6 +335,192 @@ def connect_to_mongodb():
         mongo_db = None
         return False
 
+def decode_image_scaled(image_source, box_size):
+    """Decode an image (bytes or a file path) straight to a size fitting in box_size (a QSize).
+       QImageReader reads the dimensions from the header and lets the codec decode at the reduced
+       size (JPEG uses libjpeg's scaled IDCT), so a large photo is never decoded at full resolution.
+       Smaller images are never upscaled. Returns a null QImage if the data cannot be decoded.
+    """
+    if isinstance(image_source, str):
+        reader = QImageReader(image_source)
+    else:
+        buffer = QBuffer()
+        buffer.setData(bytes(image_source))
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+    original_size = reader.size()
+    if original_size.isValid() and (original_size.width() > box_size.width() or original_size.height() > box_size.height()):
+        reader.setScaledSize(original_size.scaled(box_size, Qt.KeepAspectRatio).expandedTo(QSize(1, 1)))
+    image = reader.read()
+    # Formats that do not report their size up front are decoded in full, then scaled
+    if not image.isNull() and (image.width() > box_size.width() or image.height() > box_size.height()):
+        image = image.scaled(box_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+def make_thumbnails(image_source, box_size):
+    """Produce pre-encoded thumbnails fitting in box_size (1x) and 2*box_size (2x).
+       image_source is either the image bytes or a file path (decoded straight from disk).
+       Returns a dict like {"1x": Binary, "2x": Binary}, or None if the image cannot be decoded.
+       Images with transparency are stored as PNG, everything else as JPEG.
+    """
+    largest_side = box_size * max(THUMBNAIL_SCALES)
+    image = decode_image_scaled(image_source, QSize(largest_side, largest_side))
+    if image.isNull():
+        return None
+    thumbnails = {}
+    for scale in THUMBNAIL_SCALES:
+        side = box_size * scale
+        if image.width() > side or image.height() > side:
+            thumb = image.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        else:
+            thumb = image # Never upscale small originals
+        encoded = QByteArray()
+        buffer = QBuffer(encoded)
+        buffer.open(QIODevice.WriteOnly)
+        if thumb.hasAlphaChannel():
+            saved = thumb.save(buffer, "PNG")
+        else:
+            saved = thumb.save(buffer, "JPEG", THUMBNAIL_JPEG_QUALITY)
+        buffer.close()
+        if not saved:
+            return None
+        thumbnails[f"{scale}x"] = Binary(bytes(encoded))
+    return thumbnails
+
+# --- Image Storage Functions ---
+
+def compute_image_dhash(image_source):
+    """64-bit difference hash of an image (bytes or a file path): the image is shrunk to 9x8 grey levels and
+       each bit tells whether a pixel is brighter than its right neighbour. Resizing, recompression and small
+       colour changes flip few bits. Returns None if the image cannot be decoded.
+    """
+    image = decode_image_scaled(image_source, QSize(64, 64))
+    if image.isNull():
+        return None
+    image = image.convertToFormat(QImage.Format_Grayscale8).scaled(9, 8, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    dhash = 0
+    for y in range(8):
+        for x in range(8):
+            dhash = (dhash << 1) | (image.pixelColor(x, y).red() > image.pixelColor(x + 1, y).red())
+    return dhash
+
+def image_size_limit():
+    """Maximum accepted upload size in bytes, or None when GridFS storage lifts the BSON limit."""
+    return MAX_EMBEDDED_IMAGE_SIZE if IMAGE_STORAGE == "embedded" else None
+
+def get_gridfs_bucket():
+    return gridfs.GridFSBucket(mongo_db, bucket_name=GRIDFS_BUCKET, chunk_size_bytes=GRIDFS_CHUNK_SIZE)
+
+def store_image(image_field, image_data=None, image_path=None, metadata=None):
+    """Store an original image according to IMAGE_STORAGE and return the document fields referencing it.
+       With GridFS, the image is streamed in GRIDFS_CHUNK_SIZE chunks (straight from disk when
+       image_path is given) and the document only keeps '<image_field>_file_id'.
+    """
+    if IMAGE_STORAGE == "gridfs":
+        bucket = get_gridfs_bucket()
+        filename = os.path.basename(image_path) if image_path else image_field
+        if image_path:
+            with open(image_path, 'rb') as f:
+                file_id = bucket.upload_from_stream(filename, f, metadata=metadata)
+        else:
+            file_id = bucket.upload_from_stream(filename, io.BytesIO(bytes(image_data)), metadata=metadata)
+        return {image_field: None, f"{image_field}_file_id": file_id}
+
+    if image_path:
+        with open(image_path, 'rb') as f:
+            image_data = f.read()
+    return {image_field: Binary(image_data)}
+
+def delete_stored_image(image_field, image_fields):
+    """Remove a GridFS file created by store_image (embedded images go away with their document)."""
+    file_id = (image_fields or {}).get(f"{image_field}_file_id")
+    if file_id is not None:
+        try:
+            get_gridfs_bucket().delete(file_id)
+        except Exception as e:
+            print(f"Error deleting GridFS file {file_id}: {e}")
+
+def read_stored_image(doc, image_field):
+    """Return the original image bytes of a document, reading GridFS files chunk by chunk.
+       Documents referencing a shared blob through '<image_field>_hash' are resolved through it.
+    """
+    if doc.get(image_field):
+        return doc[image_field]
+    content_hash = doc.get(f"{image_field}_hash")
+    if content_hash is not None:
+        blob = mongo_db[IMAGE_BLOBS_COLLECTION].find_one({"_id": content_hash}, {"thumbnails": 0})
+        return read_stored_image(blob, "data") if blob else None
+    file_id = doc.get(f"{image_field}_file_id")
+    if file_id is None:
+        return None
+    data = bytearray()
+    with get_gridfs_bucket().open_download_stream(file_id) as stream:
+        while True:
+            chunk = stream.readchunk()
+            if not chunk:
+                break
+            data.extend(chunk)
+    return bytes(data)
+
+def hash_image(image_data=None, image_path=None):
+    """SHA-256 of the image content; files are hashed in GRIDFS_CHUNK_SIZE blocks."""
+    digest = hashlib.sha256()
+    if image_path:
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(GRIDFS_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    else:
+        digest.update(bytes(image_data))
+    return digest.hexdigest()
+
+def acquire_image_blob(box_size, image_data=None, image_path=None, metadata=None):
+    """Take a reference on the shared blob holding this image, storing the image only if it is new.
+       Returns (content hash, thumbnails for box_size). A duplicate upload only bumps the refcount
+       and reuses the thumbnails already generated for that content.
+    """
+    content_hash = hash_image(image_data, image_path)
+    image_source = image_path or image_data
+    size_key = str(box_size)
+    blobs = mongo_db[IMAGE_BLOBS_COLLECTION]
+    while True:
+        blob = blobs.find_one_and_update(
+            {"_id": content_hash}, {"$inc": {"refcount": 1}}, projection={f"thumbnails.{size_key}": 1})
+        if blob is not None:
+            break
+        thumbnails = make_thumbnails(image_source, box_size)
+        image_fields = store_image("data", image_data, image_path, metadata)
+        try:
+            blobs.insert_one({"_id": content_hash, "refcount": 1,
+                              "thumbnails": {size_key: thumbnails}, **image_fields})
+            return content_hash, thumbnails
+        except DuplicateKeyError:
+            # The same image was stored concurrently: drop our copy and reference that one
+            delete_stored_image("data", image_fields)
+
+    stored_thumbnails = blob.get("thumbnails") or {}
+    if size_key in stored_thumbnails:
+        return content_hash, stored_thumbnails[size_key]
+    # Known image first used at another preview size (e.g. an item photo reused as claim evidence)
+    thumbnails = make_thumbnails(image_source, box_size)
+    blobs.update_one({"_id": content_hash}, {"$set": {f"thumbnails.{size_key}": thumbnails}})
+    return content_hash, thumbnails
+
+def release_image_blob(content_hash):
+    """Drop a reference taken by acquire_image_blob and delete the blob once nothing points at it."""
+    if content_hash is None:
+        return
+    try:
+        blobs = mongo_db[IMAGE_BLOBS_COLLECTION]
+        blob = blobs.find_one_and_update(
+            {"_id": content_hash}, {"$inc": {"refcount": -1}},
+            projection={"refcount": 1, "data_file_id": 1}, return_document=ReturnDocument.AFTER)
+        if blob and blob["refcount"] <= 0:
+            # Conditional delete: a concurrent upload of the same image may have re-referenced it
+            if blobs.delete_one({"_id": content_hash, "refcount": {"$lte": 0}}).deleted_count:
+                delete_stored_image("data", blob)
+    except Exception as e:
+        print(f"Error releasing image blob {content_hash}: {e}")
+
 def hash_password(password):
     """Hash a password using SHA-256"""
     return hashlib.sha256(password.encode()).hexdigest()
@@ -95,9 +531,12 @@ def register_user(username, email, password):
     """Register a new user in the MySQL database"""
     if not connect_to_mysql():
         return False, "Database not connected"
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         hashed_password = hash_password(password)
 
         # Check if email already exists
@@ -115,23 +554,28 @@ def register_user(username, email, password):
             "INSERT INTO users (username, email, password) VALUES (%s, %s, %s)",
             (username, email, hashed_password)
         )
-        mysql_connection.commit()   
+        connection.commit()   
         return True, "Registration successful!"
     except mysql.connector.Error as err:
         print(f"Registration error: {err}")
-        mysql_connection.rollback() 
+        if connection:
+            connection.rollback() 
         return False, f"Registration failed: {err}"
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 def login_user(email, password):
     """Authenticate a user against the MySQL database"""
     if not connect_to_mysql():
         return False, "Database not connected"
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True) # Get results as dicts
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True) # Get results as dicts
         hashed_password = hash_password(password)
 
         cursor.execute(
@@ -150,29 +594,42 @@ def login_user(email, password):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 # --- Item Management Functions ---
-def save_item(user_id, title, category, location, date, status, description, image_data=None):
-    """Save item metadata to MySQL and details (description + image) to MongoDB"""
+def save_item(user_id, title, category, location, date, status, description, image_data=None, image_path=None):
+    """Save item metadata to MySQL and details (description + image) to MongoDB.
+       The image is given either as bytes (image_data) or as a file path (image_path).
+    """
     if not connect_to_mysql() or not connect_to_mongodb():
         return False, "Database connection failed"
 
     mongo_id_obj = None
     mongo_id_str = None
+    image_hash = None
+    image_dhash = None
+    connection = None
     cursor = None
 
     try:
-        # 1. Save description and image to MongoDB
-        mongo_image_data = Binary(image_data) if image_data else None
-        mongo_result = mongo_db.items_detail.insert_one({
-            "description": description,
-            "image": mongo_image_data
-        })
+        # 1. Save description to MongoDB; the image goes to the shared blob store
+        item_detail = {"description": description, "image": None, "thumbnails": None}
+        if image_path or image_data:
+            image_hash, item_detail["thumbnails"] = acquire_image_blob(
+                ITEM_THUMBNAIL_SIZE, image_data, image_path, metadata={"kind": "item"})
+            item_detail["image_hash"] = image_hash
+            image_dhash = compute_image_dhash(image_path or image_data)
+            if image_dhash is not None:
+                item_detail["image_dhash"] = f"{image_dhash:016x}" # Hex: MongoDB integers are signed
+        mongo_result = mongo_db.items_detail.insert_one(item_detail)
         mongo_id_obj = mongo_result.inserted_id
         mongo_id_str = str(mongo_id_obj)
 
         # 2. Save metadata to MySQL, linking to the MongoDB document
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         cursor.execute(
             """INSERT INTO items (user_id, title, category, location, date, status, mongo_id, description)
                  VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
@@ -180,7 +637,24 @@ def save_item(user_id, title, category, location, date, status, description, ima
             )
    
 
-        mysql_connection.commit()
+        connection.commit()
+        item_category_facets.record(category)
+        item_location_facets.record(location)
+        item_title_words.record(title)
+        item_location_names.record(location)
+        image_similarity_index.record(cursor.lastrowid, status, image_dhash)
+        duplicate_post_index.record(cursor.lastrowid, user_id, category, title, description)
+        notify_saved_searches(cursor.lastrowid, user_id, title, category, location, status, description)
+        try:
+            matches = find_item_matches(cursor.lastrowid, title, category, location, date, status, description)
+            matched_ids = {match['id'] for match in matches}
+            matches += [match for match in find_look_alike_items(cursor.lastrowid, image_dhash, status)
+                        if match['id'] not in matched_ids]
+        except Exception as e:
+            print(f"Error matching item: {e}") # The item is saved; it just gets no suggestions
+            matches = []
+        if matches:
+            return True, "Item saved! Possible matches: " + ", ".join(match['title'] for match in matches)
         return True, "Item saved successfully!"
 
     except Exception as e:
@@ -191,9 +665,11 @@ def save_item(user_id, title, category, location, date, status, description, ima
                 print(f"Cleaned up MongoDB entry {mongo_id_str} due to error.")
             except Exception as mongo_del_err:
                 print(f"Error cleaning up MongoDB entry {mongo_id_str}: {mongo_del_err}")
+        release_image_blob(image_hash)
         # Rollback MySQL
         try:
-            mysql_connection.rollback()
+            if connection:
+                connection.rollback()
         except Exception as rollback_err:
             print(f"Error rolling back MySQL transaction: {rollback_err}")
 
@@ -201,17 +677,369 @@ def save_item(user_id, title, category, location, date, status, description, ima
     finally:
         if cursor:
             cursor.close()
-
-def get_all_items(filter_category=None, filter_location=None, include_recovered=False):
-    """Retrieve items (excluding recovered by default), join with user, fetch details from MongoDB"""
-    if not connect_to_mysql() or not connect_to_mongodb():
+        if connection:
+            connection.close()
+
+def fetch_details_by_ids(collection, mongo_id_strs, projection=None):
+    """Resolve MongoDB documents for a list of id strings using chunked $in queries.
+       Returns (details_by_id, invalid_ids): a dict of id string -> document and the
+       set of id strings that could not be parsed as ObjectIds.
+       An optional projection limits the fields transferred (e.g. to skip image blobs).
+    """
+    details_by_id = {}
+    invalid_ids = set()
+    object_ids = []
+    seen = set()
+    for mongo_id_str in mongo_id_strs:
+        if not mongo_id_str or mongo_id_str in seen:
+            continue
+        seen.add(mongo_id_str)
+        try:
+            object_ids.append(ObjectId(mongo_id_str))
+        except Exception as e:
+            print(f"Invalid MongoDB id ({mongo_id_str}): {e}")
+            invalid_ids.add(mongo_id_str)
+
+    for start in range(0, len(object_ids), MONGO_IN_BATCH_SIZE):
+        chunk = object_ids[start:start + MONGO_IN_BATCH_SIZE]
+        for doc in collection.find({"_id": {"$in": chunk}}, projection):
+            details_by_id[str(doc['_id'])] = doc
+    return details_by_id, invalid_ids
+
+def attach_item_details(items_mysql):
+    """Add 'description' from MongoDB to each MySQL item row.
+       All details are resolved in a constant number of round trips. Image blobs are
+       excluded; cards load thumbnails on demand through get_item_thumbnails.
+    """
+    try:
+        details_by_id, invalid_ids = fetch_details_by_ids(
+            mongo_db.items_detail, [item.get('mongo_id') for item in items_mysql], {"image": 0, "thumbnails": 0})
+    except Exception as e:
+        print(f"Error fetching MongoDB documents in bulk: {e}")
+        details_by_id, invalid_ids = None, set()
+
+    for item_mysql in items_mysql:
+        mongo_id_str = item_mysql.get('mongo_id')
+        description = 'Details unavailable'
+        if mongo_id_str:
+            if details_by_id is None or mongo_id_str in invalid_ids:
+                description = 'Error fetching details'
+            elif mongo_id_str in details_by_id:
+                item_detail = details_by_id[mongo_id_str]
+                description = item_detail.get('description', 'No description found')
+            else:
+                print(f"No MongoDB document found for mongo_id: {mongo_id_str}")
+                description = 'Details missing in secondary storage'
+
+        item_mysql['description'] = description
+    return items_mysql
+
+class ThumbnailDiskCache:
+    """Persistent thumbnail cache: an append-only pack file of (key, bytes) records read through mmap,
+       plus an index file mapping each key to its offset, length and last use.
+       The index is saved on close; if it is missing or does not match the pack (e.g. after a crash),
+       it is rebuilt by walking the record headers. Once the pack outgrows max_bytes it is rewritten
+       with only the most recently used live records. Empty records remember documents without an image.
+    """
+    RECORD_HEADER = struct.Struct("<HI") # key length, data length
+
+    def __init__(self, directory, name, max_bytes):
+        os.makedirs(directory, exist_ok=True)
+        self.pack_path = os.path.join(directory, f"{name}.pack")
+        self.index_path = os.path.join(directory, f"{name}.idx")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._lock_file = self._acquire_file_lock(os.path.join(directory, f"{name}.lock"))
+        self._pack = open(self.pack_path, 'ab+') # Writes always append; reads go through the mapping
+        self._map = None
+        self._index = {} # key -> [data offset, data length, last use]
+        self._clock = 0
+        self._dirty = False
+        self._load_index()
+
+    @staticmethod
+    def _acquire_file_lock(lock_path):
+        """Keep a second running instance from appending to the same pack; raises OSError if it is taken."""
+        lock_file = open(lock_path, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise
+        return lock_file
+
+    def _remap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        size = os.fstat(self._pack.fileno()).st_size
+        if size:
+            self._map = mmap.mmap(self._pack.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _load_index(self):
+        pack_size = os.fstat(self._pack.fileno()).st_size
+        self._remap()
+        try:
+            with open(self.index_path, encoding='utf-8') as index_file:
+                saved = json.load(index_file)
+            if saved['pack_size'] == pack_size:
+                self._index = {key: list(entry) for key, entry in saved['entries'].items()}
+                self._clock = saved['clock']
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Recover the index from the pack itself, dropping a torn record left at its end."""
+        self._index = {}
+        size = len(self._map) if self._map is not None else 0
+        offset = 0
+        while offset + self.RECORD_HEADER.size <= size:
+            key_length, data_length = self.RECORD_HEADER.unpack_from(self._map, offset)
+            data_offset = offset + self.RECORD_HEADER.size + key_length
+            if data_offset + data_length > size:
+                break
+            key = self._map[offset + self.RECORD_HEADER.size:data_offset].decode('utf-8')
+            self._index[key] = [data_offset, data_length, 0]
+            offset = data_offset + data_length
+        if offset < size:
+            self._map.close()
+            self._map = None
+            self._pack.truncate(offset)
+            self._remap()
+        self._dirty = True
+
+    def _save_index(self):
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as index_file:
+            json.dump({'pack_size': os.fstat(self._pack.fileno()).st_size, 'clock': self._clock,
+                       'entries': self._index}, index_file)
+        os.replace(temp_path, self.index_path)
+        self._dirty = False
+
+    def get_many(self, keys):
+        """Cached bytes for the keys that have a record (b'' for documents known to have no image)."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._index.get(key)
+                if entry is None:
+                    continue
+                data_offset, data_length, _ = entry
+                if self._map is None or data_offset + data_length > len(self._map):
+                    self._remap() # The pack grew since it was last mapped
+                found[key] = self._map[data_offset:data_offset + data_length] if data_length else b""
+                self._clock += 1
+                entry[2] = self._clock
+                self._dirty = True
+        return found
+
+    def put_many(self, data_by_key):
+        with self._lock:
+            offset = os.fstat(self._pack.fileno()).st_size
+            for key, data in data_by_key.items():
+                data = bytes(data)
+                if len(data) > THUMBNAIL_DISK_CACHE_MAX_ENTRY_BYTES:
+                    continue
+                key_bytes = key.encode('utf-8')
+                self._pack.write(self.RECORD_HEADER.pack(len(key_bytes), len(data)) + key_bytes + data)
+                data_offset = offset + self.RECORD_HEADER.size + len(key_bytes)
+                self._clock += 1
+                self._index[key] = [data_offset, len(data), self._clock]
+                offset = data_offset + len(data)
+            self._pack.flush()
+            self._dirty = True
+            if offset > self.max_bytes:
+                self._compact()
+
+    def _compact(self):
+        """Rewrite the pack with the most recently used live records, down to the compaction target."""
+        budget = int(self.max_bytes * THUMBNAIL_DISK_CACHE_COMPACT_RATIO)
+        kept = []
+        used = 0
+        for key, entry in sorted(self._index.items(), key=lambda pair: pair[1][2], reverse=True):
+            record_size = self.RECORD_HEADER.size + len(key.encode('utf-8')) + entry[1]
+            if used + record_size > budget:
+                break
+            kept.append((key, entry))
+            used += record_size
+        kept.sort(key=lambda pair: pair[1][0]) # Keep the original order so the copy reads sequentially
+
+        self._remap()
+        temp_path = self.pack_path + ".tmp"
+        new_index = {}
+        with open(temp_path, 'wb') as new_pack:
+            offset = 0
+            for key, (data_offset, data_length, last_use) in kept:
+                key_bytes = key.encode('utf-8')
+                new_pack.write(self.RECORD_HEADER.pack(len(key_bytes), data_length) + key_bytes)
+                new_pack.write(self._map[data_offset:data_offset + data_length])
+                new_index[key] = [offset + self.RECORD_HEADER.size + len(key_bytes), data_length, last_use]
+                offset += self.RECORD_HEADER.size + len(key_bytes) + data_length
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._pack.close()
+        os.replace(temp_path, self.pack_path)
+        self._pack = open(self.pack_path, 'ab+')
+        self._index = new_index
+        self._remap()
+        self._save_index()
+
+    def close(self):
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._pack.close()
+            self._lock_file.close()
+
+def get_thumbnail_disk_cache():
+    """Open the on-disk thumbnail cache on first use. Returns None when it is disabled or unusable."""
+    global thumbnail_disk_cache
+    if thumbnail_disk_cache is None:
+        thumbnail_disk_cache = False
+        if THUMBNAIL_DISK_CACHE_DIR:
+            try:
+                thumbnail_disk_cache = ThumbnailDiskCache(THUMBNAIL_DISK_CACHE_DIR, MONGODB_DB, THUMBNAIL_DISK_CACHE_MAX_BYTES)
+            except OSError as e:
+                print(f"Thumbnail disk cache unavailable (is another instance running?): {e}")
+    return thumbnail_disk_cache or None
+
+def close_thumbnail_disk_cache():
+    global thumbnail_disk_cache
+    if thumbnail_disk_cache:
+        thumbnail_disk_cache.close()
+    thumbnail_disk_cache = None
+
+def fetch_thumbnails_by_ids(collection_name, original_field, mongo_id_strs, scale):
+    """Fetch only the thumbnail bytes of the given documents for a scale ("1x" or "2x").
+       Documents stored before thumbnails existed fall back to their original image.
+       Thumbnails found in the on-disk cache are served from it; only the others are queried.
+       Returns a dict of id string -> bytes.
+    """
+    if not mongo_id_strs:
+        return {}
+    images = {}
+    disk_cache = get_thumbnail_disk_cache()
+    if disk_cache is not None:
+        cache_keys = {mongo_id: f"{collection_name}/{scale}/{mongo_id}" for mongo_id in mongo_id_strs}
+        cached = disk_cache.get_many(cache_keys.values())
+        for mongo_id, key in cache_keys.items():
+            if cached.get(key):
+                images[mongo_id] = cached[key]
+        mongo_id_strs = [mongo_id for mongo_id, key in cache_keys.items() if key not in cached]
+        if not mongo_id_strs:
+            return images
+    if not connect_to_mongodb():
+        return images
+    collection = mongo_db[collection_name]
+    thumbnail_field = f"thumbnails.{scale}"
+    try:
+        details_by_id, _ = fetch_details_by_ids(collection, mongo_id_strs, {thumbnail_field: 1})
+        for mongo_id, doc in details_by_id.items():
+            thumb = (doc.get('thumbnails') or {}).get(scale)
+            if thumb:
+                images[mongo_id] = thumb
+        missing = [mongo_id for mongo_id in details_by_id if mongo_id not in images]
+        if missing:
+            originals_by_id, _ = fetch_details_by_ids(
+                collection, missing,
+                {original_field: 1, f"{original_field}_file_id": 1, f"{original_field}_hash": 1})
+            for mongo_id, doc in originals_by_id.items():
+                original = read_stored_image(doc, original_field)
+                if original:
+                    images[mongo_id] = original
+        if disk_cache is not None:
+            # Documents without any image get an empty record, so they are not queried again either
+            disk_cache.put_many({f"{collection_name}/{scale}/{mongo_id}": images.get(mongo_id, b"")
+                                 for mongo_id in details_by_id})
+    except Exception as e:
+        print(f"Error fetching thumbnails from MongoDB: {e}")
+    return images
+
+def get_item_thumbnails(mongo_id_strs, scale="1x"):
+    """Load item card thumbnails on demand, keyed by the item's mongo_id."""
+    return fetch_thumbnails_by_ids('items_detail', 'image', mongo_id_strs, scale)
+
+def get_claim_evidence_thumbnails(mongo_detail_id_strs, scale="1x"):
+    """Load claim evidence thumbnails on demand, keyed by the claim's mongo_detail_id."""
+    return fetch_thumbnails_by_ids('claims_detail', 'evidence_image', mongo_detail_id_strs, scale)
+
+def browse_page_key(item):
+    """Keyset position of an item in the browse ordering, to pass as get_all_items(after=...)."""
+    return (item['status'], item['date'], item['created_at'], item['id'])
+
+def browse_seek_condition(after):
+    """SQL condition (and params) selecting the rows that follow `after` in
+       ORDER BY i.status, i.date DESC, i.created_at DESC, i.id DESC.
+       MySQL sorts NULLs first ascending, so NULL dates come last in the DESC columns.
+    """
+    status, date, created_at, item_id = after
+    condition, params = "i.id < %s", [item_id]
+    for column, value in (("i.created_at", created_at), ("i.date", date)):
+        if value is None:
+            condition = f"({column} IS NULL AND {condition})"
+        else:
+            condition = f"({column} < %s OR {column} IS NULL OR ({column} = %s AND {condition}))"
+            params = [value, value] + params
+    # ENUMs compare as strings against literals, so later statuses are listed explicitly
+    later_statuses = ITEM_STATUS_ORDER[ITEM_STATUS_ORDER.index(status) + 1:]
+    condition = f"(i.status = %s AND {condition})"
+    params = [status] + params
+    if later_statuses:
+        condition = f"(i.status IN ({', '.join(['%s'] * len(later_statuses))}) OR {condition})"
+        params = list(later_statuses) + params
+    return condition, params
+
+def get_search_words(search_text):
+    """Words of search_text that the FULLTEXT index can match. Only word characters are kept, so operators
+       typed by the user cannot change the meaning of the query.
+    """
+    return [word for word in re.findall(r"\w+", search_text or "") if len(word) >= SEARCH_MIN_WORD_LENGTH]
+
+def build_fulltext_query(search_text):
+    """Boolean-mode AGAINST string requiring every search word as a prefix, or None if there is none.
+       A word that no title contains may instead match one of its close spellings from item_title_words.
+    """
+    terms = []
+    for word in get_search_words(search_text):
+        try:
+            alternatives = [alt for alt in item_title_words.lookup(word) if fold_search_text(alt) != fold_search_text(word)]
+        except mysql.connector.Error as e:
+            print(f"Error loading the title word index: {e}")
+            alternatives = []
+        terms.append(f"+({word}* {' '.join(alternatives)})" if alternatives else f"+{word}*")
+    return " ".join(terms) or None
+
+def get_all_items(filter_category=None, filter_location=None, include_recovered=False, after=None, limit=None,
+                  search_text=None, connect=True):
+    """Retrieve items (excluding recovered by default), join with user, fetch details from MongoDB.
+       With limit, returns one page; pass browse_page_key() of the last item as `after` for the next one.
+       With search_text, only items matching its words are returned, most relevant first; relevance has no
+       stable keyset, so `after` is then the number of items already shown.
+       connect=False skips connect_to_mysql/connect_to_mongodb, which may show dialogs and replace the clients:
+       callers off the GUI thread check the connections there first and pass it. Errors are then raised
+       rather than logged, so those callers can report them.
+    """
+    if connect and (not connect_to_mysql() or not connect_to_mongodb()):
         print("Database connection failed in get_all_items")
         return []
 
     items = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
 
         query = """
         SELECT i.id, i.user_id, i.title, i.category, i.location, i.date, i.status, i.mongo_id, i.created_at,
@@ -222,6 +1050,10 @@ def get_all_items(filter_category=None, filter_location=None, include_recovered=
 
         params = []
         conditions = []
+        fulltext_query = build_fulltext_query(search_text)
+        if fulltext_query:
+            conditions.append("MATCH(i.title, i.description) AGAINST (%s IN BOOLEAN MODE)")
+            params.append(fulltext_query)
 
         # Exclude recovered items unless specified
         if not include_recovered:
@@ -233,50 +1065,58 @@ def get_all_items(filter_category=None, filter_location=None, include_recovered=
             params.append(filter_category)
 
         if filter_location and filter_location != "All Locations":
-            conditions.append("i.location = %s")
-            params.append(filter_location)
+            # Typed locations also match their other spellings, and close ones when none is known
+            try:
+                locations = item_location_names.lookup(filter_location) or [filter_location]
+            except mysql.connector.Error as e:
+                print(f"Error loading the location index: {e}")
+                locations = [filter_location]
+            conditions.append(f"i.location IN ({', '.join(['%s'] * len(locations))})")
+            params.extend(locations)
+
+        if after is not None and not fulltext_query:
+            seek_condition, seek_params = browse_seek_condition(after)
+            conditions.append(seek_condition)
+            params.extend(seek_params)
 
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
 
-        query += " ORDER BY i.status, i.date DESC, i.created_at DESC" 
+        if fulltext_query:
+            # MySQL evaluates the MATCH once and reuses it for the ranking
+            query += " ORDER BY MATCH(i.title, i.description) AGAINST (%s IN BOOLEAN MODE) DESC, i.id DESC"
+            params.append(fulltext_query)
+        else:
+            query += " ORDER BY i.status, i.date DESC, i.created_at DESC, i.id DESC"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+            if fulltext_query and after:
+                query += " OFFSET %s"
+                params.append(after)
 
         cursor.execute(query, tuple(params)) # Pass params as tuple
         items_mysql = cursor.fetchall()
 
-        # Fetch details from MongoDB for each item
-        for item_mysql in items_mysql:
-            mongo_id_str = item_mysql.get('mongo_id')
-            description = 'Details unavailable'
-            image_data = None
-            if mongo_id_str:
-                try:
-                    mongo_object_id = ObjectId(mongo_id_str)
-                    item_detail = mongo_db.items_detail.find_one({"_id": mongo_object_id})
-                    if item_detail:
-                        description = item_detail.get('description', 'No description found')
-                        image_data = item_detail.get('image') 
-                    else:
-                        print(f"No MongoDB document found for mongo_id: {mongo_id_str}")
-                        description = 'Details missing in secondary storage'
-                except Exception as e:
-                    print(f"Error fetching/parsing MongoDB document ({mongo_id_str}): {e}")
-                    description = 'Error fetching details'
-
-            item_mysql['description'] = description
-            item_mysql['image_data'] = image_data
-            items.append(item_mysql)
+        # Fetch details from MongoDB in bulk
+        items = attach_item_details(items_mysql)
 
         return items
     except mysql.connector.Error as e:
+        if not connect:
+            raise
         print(f"Error fetching items from MySQL: {e}")
         return []
     except Exception as e:
+        if not connect:
+            raise
         print(f"An error occurred during item retrieval: {e}")
         return items 
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def get_user_items(user_id):
@@ -286,9 +1126,11 @@ def get_user_items(user_id):
         return []
 
     items = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
         cursor.execute(
             """SELECT i.id, i.user_id, i.title, i.category, i.location, i.date, i.status, i.mongo_id, i.created_at,
                       u.username AS owner_username
@@ -300,28 +1142,8 @@ def get_user_items(user_id):
         )
         items_mysql = cursor.fetchall()
 
-        # Fetch details from MongoDB
-        for item_mysql in items_mysql:
-            mongo_id_str = item_mysql.get('mongo_id')
-            description = 'Details unavailable'
-            image_data = None
-            if mongo_id_str:
-                try:
-                    mongo_object_id = ObjectId(mongo_id_str)
-                    item_detail = mongo_db.items_detail.find_one({"_id": mongo_object_id})
-                    if item_detail:
-                        description = item_detail.get('description', 'No description found')
-                        image_data = item_detail.get('image') # BSON Binary or None
-                    else:
-                        print(f"No MongoDB document found for user item mongo_id: {mongo_id_str}")
-                        description = 'Details missing in secondary storage'
-                except Exception as e:
-                    print(f"Error fetching/parsing MongoDB document ({mongo_id_str}) for user item: {e}")
-                    description = 'Error fetching details'
-
-            item_mysql['description'] = description
-            item_mysql['image_data'] = image_data
-            items.append(item_mysql)
+        # Fetch details from MongoDB in bulk
+        items = attach_item_details(items_mysql)
 
         return items
     except mysql.connector.Error as e:
@@ -333,15 +1155,19 @@ def get_user_items(user_id):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 def get_item_owner(item_id):
     """Get the user_id of the item's owner."""
     if not connect_to_mysql():
         print("Database connection failed in get_item_owner")
         return None
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
         cursor.execute("SELECT user_id FROM items WHERE id = %s", (item_id,))
         result = cursor.fetchone()
         return result[0] if result else None
@@ -351,69 +1177,738 @@ def get_item_owner(item_id):
     finally:
         if cursor:
             cursor.close()
-
+        if connection:
+            connection.close()
+
+
+class FacetCache:
+    """Distinct values of one items column with their item counts, used to fill the browse filters.
+       Loaded with a single GROUP BY query, then updated in place by the item-mutating functions through
+       record(), so reading the values costs no query. With a ttl, the counts are reloaded once older
+       than ttl seconds.
+    """
+    def __init__(self, column, ttl=None):
+        self.column = column
+        self.ttl = ttl
+        # fold_search_text(value) -> [first spelling seen, number of items], None until loaded. Folding merges
+        # the spellings the column's collation treats as equal, as GROUP BY and the filter's = do.
+        self._counts = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute(f"SELECT {self.column}, COUNT(*) FROM items "
+                           f"WHERE {self.column} IS NOT NULL AND {self.column} != '' GROUP BY {self.column}")
+            self._counts = {}
+            for value, count in cursor.fetchall():
+                self._counts.setdefault(fold_search_text(value), [value, 0])[1] += count
+            self._loaded_at = time.monotonic()
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def values(self):
+        """Sorted distinct values; raises mysql.connector.Error if they had to be loaded and could not be."""
+        with self._lock:
+            if self._counts is None or (self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl):
+                self._load()
+            return sorted((value for value, count in self._counts.values() if count > 0), key=str.casefold)
+
+    def record(self, value, delta=1):
+        """Account for delta items gaining (or, when negative, losing) this value."""
+        if not value:
+            return
+        with self._lock:
+            if self._counts is None:
+                return # Not loaded yet; the first load will see the change
+            key = fold_search_text(value)
+            entry = self._counts.setdefault(key, [value, 0])
+            entry[1] += delta
+            if entry[1] <= 0:
+                del self._counts[key]
+
+item_category_facets = FacetCache('category', FACET_CACHE_TTL_SECONDS)
+item_location_facets = FacetCache('location', FACET_CACHE_TTL_SECONDS)
 
 def get_unique_categories():
-    """Get a list of unique categories from the items table"""
+    """Get a list of unique categories from the items table (served from the facet cache)"""
     if not connect_to_mysql(): return ["All Categories"]
-    cursor = None
     try:
-        cursor = mysql_connection.cursor()
-        cursor.execute("SELECT DISTINCT category FROM items WHERE category IS NOT NULL AND category != '' ORDER BY category")
-        categories = [row[0] for row in cursor.fetchall()]
-        return ["All Categories"] + categories
+        return ["All Categories"] + item_category_facets.values()
     except mysql.connector.Error as e:
         print(f"Error fetching categories: {e}")
         return ["All Categories"]
-    finally:
-        if cursor:
-            cursor.close()
 
 def get_unique_locations():
-    """Get a list of unique locations from the items table"""
+    """Get a list of unique locations from the items table (served from the facet cache)"""
     if not connect_to_mysql(): return ["All Locations"]
-    cursor = None
     try:
-        cursor = mysql_connection.cursor()
-        cursor.execute("SELECT DISTINCT location FROM items WHERE location IS NOT NULL AND location != '' ORDER BY location")
-        locations = [row[0] for row in cursor.fetchall()]
-        return ["All Locations"] + locations
+        return ["All Locations"] + item_location_facets.values()
     except mysql.connector.Error as e:
         print(f"Error fetching locations: {e}")
         return ["All Locations"]
+
+def fold_search_text(text):
+    """Form under which search terms are compared: case-insensitive."""
+    return text.casefold()
+
+class TrigramIndex:
+    """Typo-tolerant lookup of the values of one items column, or of the words in it (split_words=True).
+       Every known term is posted under its trigrams, so a lookup only visits the terms sharing a trigram
+       with the query instead of scanning the table. Loaded with one DISTINCT query on first use (see
+       warm_search_indexes), then kept current by save_item through record().
+    """
+    def __init__(self, column, split_words=False):
+        self.column = column
+        self.split_words = split_words
+        self._terms = None # folded term -> set of spellings seen, None until loaded
+        self._trigrams = {} # folded term -> its trigrams
+        self._postings = {} # trigram -> set of folded terms
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def trigrams(folded):
+        padded = f"  {folded} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _spellings(self, text):
+        if self.split_words:
+            return [word for word in re.findall(r"\w+", text) if len(word) >= SEARCH_MIN_WORD_LENGTH]
+        return [text.strip()] if text.strip() else []
+
+    def _add(self, text, terms, trigrams, postings):
+        for spelling in self._spellings(text):
+            folded = fold_search_text(spelling)
+            if folded not in terms:
+                terms[folded] = set()
+                trigrams[folded] = self.trigrams(folded)
+                for trigram in trigrams[folded]:
+                    postings.setdefault(trigram, set()).add(folded)
+            terms[folded].add(spelling)
+
+    def _load(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute(f"SELECT DISTINCT {self.column} FROM items "
+                           f"WHERE {self.column} IS NOT NULL AND {self.column} != ''")
+            terms, trigrams, postings = {}, {}, {}
+            while True:
+                rows = cursor.fetchmany(5000)
+                if not rows:
+                    break
+                for (text,) in rows:
+                    self._add(text, terms, trigrams, postings)
+            # Only a complete load is kept: if the cursor fails partway, the next lookup retries
+            self._terms, self._trigrams, self._postings = terms, trigrams, postings
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def lookup(self, text, limit=FUZZY_MAX_ALTERNATIVES, min_similarity=FUZZY_MIN_SIMILARITY):
+        """Known spellings of text once folded; when there are none, the closest known spellings by trigram
+           similarity, best first. Raises mysql.connector.Error if the index had to be loaded and could not be.
+        """
+        folded = fold_search_text(text.strip())
+        with self._lock:
+            if self._terms is None:
+                self._load()
+            if folded in self._terms:
+                return sorted(self._terms[folded])
+            query_trigrams = self.trigrams(folded)
+            shared = {}
+            for trigram in query_trigrams:
+                for term in self._postings.get(trigram, ()):
+                    shared[term] = shared.get(term, 0) + 1
+            scored = []
+            for term, count in shared.items():
+                similarity = count / (len(query_trigrams) + len(self._trigrams[term]) - count)
+                if similarity >= min_similarity:
+                    scored.append((similarity, term))
+            scored.sort(key=lambda entry: (-entry[0], entry[1]))
+            return [spelling for _, term in scored[:limit] for spelling in sorted(self._terms[term])]
+
+    def record(self, text):
+        """Make the spellings in a newly saved value known."""
+        if not text:
+            return
+        with self._lock:
+            if self._terms is not None: # Not loaded yet; the first load will see the value
+                self._add(text, self._terms, self._trigrams, self._postings)
+
+item_title_words = TrigramIndex('title', split_words=True)
+item_location_names = TrigramIndex('location')
+
+def warm_search_indexes():
+    """Load the search indexes ahead of the first search (run on a background thread at startup)."""
+    for index in (item_title_words, item_location_names):
+        try:
+            index.lookup("")
+        except mysql.connector.Error as e:
+            print(f"Error loading the {index.column} search index: {e}")
+    try:
+        image_similarity_index.search(0, 'found')
+    except Exception as e:
+        print(f"Error loading the image similarity index: {e}")
+
+def tfidf_cosine_similarities(query_text, texts):
+    """Cosine similarity between the TF-IDF vectors of query_text and of each of texts, as a NumPy array.
+       Document frequencies come from query_text and texts themselves. The term matrix is kept sparse, as
+       (document, term, count) triples, so the cost grows with the number of words rather than documents x vocabulary.
+    """
+    vocabulary = {}
+    rows, cols = [], []
+    for row, text in enumerate([query_text] + list(texts)):
+        for word in re.findall(r"\w+", fold_search_text(text or "")):
+            if len(word) >= SEARCH_MIN_WORD_LENGTH:
+                rows.append(row)
+                cols.append(vocabulary.setdefault(word, len(vocabulary)))
+    document_count = len(texts) + 1
+    if not vocabulary:
+        return np.zeros(len(texts))
+
+    pairs, counts = np.unique(np.array(rows, dtype=np.int64) * len(vocabulary) + np.array(cols, dtype=np.int64),
+                              return_counts=True)
+    pair_rows, pair_cols = pairs // len(vocabulary), pairs % len(vocabulary)
+    document_frequency = np.bincount(pair_cols, minlength=len(vocabulary))
+    idf = np.log((1 + document_count) / (1 + document_frequency)) + 1
+    weights = (1 + np.log(counts)) * idf[pair_cols]
+
+    norms = np.sqrt(np.bincount(pair_rows, weights=weights * weights, minlength=document_count))
+    query_weights = np.zeros(len(vocabulary))
+    query_weights[pair_cols[pair_rows == 0]] = weights[pair_rows == 0]
+    dots = np.bincount(pair_rows, weights=weights * query_weights[pair_cols], minlength=document_count)
+    denominators = norms * norms[0]
+    return np.divide(dots, denominators, out=np.zeros(document_count), where=denominators > 0)[1:]
+
+def location_similarity(location_a, location_b):
+    """1.0 for the same place up to case, otherwise the trigram similarity of the two spellings."""
+    folded_a, folded_b = fold_search_text(location_a or ""), fold_search_text(location_b or "")
+    if not folded_a or not folded_b:
+        return 0.0
+    if folded_a == folded_b:
+        return 1.0
+    trigrams_a, trigrams_b = TrigramIndex.trigrams(folded_a), TrigramIndex.trigrams(folded_b)
+    return len(trigrams_a & trigrams_b) / len(trigrams_a | trigrams_b)
+
+def find_item_matches(item_id, title, category, location, date, status, description):
+    """Best open items of the opposite status for a newly saved item, as dicts (id, title, location, date, score),
+       highest score first. Candidates come from one indexed range query (same category, date window), then
+       are scored together with NumPy. Raises mysql.connector.Error if the candidates cannot be read.
+    """
+    opposite_status = {'lost': 'found', 'found': 'lost'}.get(status)
+    if not opposite_status:
+        return []
+    if isinstance(date, str):
+        date = datetime.date.fromisoformat(date) if date else None
+
+    conditions, params = ["status = %s", "id != %s"], [opposite_status, item_id]
+    if category:
+        conditions.append("category = %s")
+        params.append(category)
+    if date:
+        window = datetime.timedelta(days=MATCH_DATE_WINDOW_DAYS)
+        conditions.append("date BETWEEN %s AND %s")
+        params.extend([date - window, date + window])
+    params.append(MATCH_MAX_CANDIDATES)
+
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(
+            f"""SELECT id, title, description, location, date FROM items
+                WHERE {' AND '.join(conditions)} ORDER BY date DESC LIMIT %s""",
+            tuple(params)
+        )
+        candidates = cursor.fetchall()
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+    if not candidates:
+        return []
+
+    text_scores = tfidf_cosine_similarities(f"{title} {description or ''}",
+                                            [f"{candidate['title']} {candidate['description'] or ''}" for candidate in candidates])
+    location_scores = np.array([location_similarity(location, candidate['location']) for candidate in candidates])
+    if date:
+        day_gaps = np.array([abs((candidate['date'] - date).days) if candidate['date'] else MATCH_DATE_WINDOW_DAYS
+                             for candidate in candidates])
+        date_scores = np.clip(1 - day_gaps / MATCH_DATE_WINDOW_DAYS, 0, 1)
+    else:
+        date_scores = np.zeros(len(candidates))
+    scores = (MATCH_WEIGHTS['text'] * text_scores + MATCH_WEIGHTS['location'] * location_scores
+              + MATCH_WEIGHTS['date'] * date_scores)
+
+    best = [index for index in np.argsort(-scores)[:MATCH_MAX_RESULTS] if scores[index] >= MATCH_MIN_SCORE]
+    return [{'id': candidates[index]['id'], 'title': candidates[index]['title'],
+             'location': candidates[index]['location'], 'date': candidates[index]['date'], 'score': float(scores[index])}
+            for index in best]
+
+
+def hamming_distance(hash_a, hash_b):
+    return bin(hash_a ^ hash_b).count("1")
+
+class BKTree:
+    """Burkhard-Keller tree over 64-bit hashes under Hamming distance. Each child hangs off its parent at their
+       distance, so by the triangle inequality search() can skip every subtree whose edge differs from the
+       query's distance to the node by more than the radius.
+    """
+    def __init__(self):
+        self._root = None # [hash, values with that hash, {distance: child node}]
+
+    def add(self, hash_value, value):
+        if self._root is None:
+            self._root = [hash_value, [value], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming_distance(node[0], hash_value)
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [hash_value, [value], {}]
+                return
+            node = child
+
+    def search(self, hash_value, radius):
+        """(distance, value) pairs for every value whose hash is within radius of hash_value."""
+        results = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(node[0], hash_value)
+            if distance <= radius:
+                results.extend((distance, value) for value in node[1])
+            stack.extend(child for edge, child in node[2].items() if distance - radius <= edge <= distance + radius)
+        return results
+
+class ImageSimilarityIndex:
+    """BK-tree of the item photo dHashes, with each item's current status. Loaded on first use (see
+       warm_search_indexes) from the non-recovered items and their items_detail hashes, then kept current by
+       save_item and accept_claim through record().
+    """
+    def __init__(self):
+        self._tree = None # BKTree of dHash -> item id, None until loaded
+        self._statuses = {} # item id -> status
+        self._pending = None # Changes recorded while a load is running, replayed onto its result
+        self._lock = threading.Lock() # Guards the fields above; never held while loading
+        self._load_lock = threading.Lock() # Held by the thread running a load
+
+    @staticmethod
+    def _apply(tree, statuses, item_id, status, dhash):
+        if item_id in statuses or dhash is not None:
+            if item_id not in statuses:
+                tree.add(dhash, item_id)
+            statuses[item_id] = status
+
+    def _load(self):
+        """Build the tree without holding _lock, so record() (called on the GUI thread) never waits for a load."""
+        with self._lock:
+            self._pending = []
+        try:
+            self._build_and_swap()
+        finally:
+            with self._lock:
+                self._pending = None
+
+    def _build_and_swap(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT id, status, mongo_id FROM items "
+                           "WHERE status != %s AND mongo_id IS NOT NULL", ('recovered',))
+            items_by_mongo_id = {mongo_id: (item_id, status) for item_id, status, mongo_id in cursor.fetchall()}
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+        tree, statuses = BKTree(), {}
+        for detail in mongo_db.items_detail.find({"image_dhash": {"$type": "string"}}, {"image_dhash": 1}):
+            item = items_by_mongo_id.get(str(detail["_id"]))
+            if item:
+                tree.add(int(detail["image_dhash"], 16), item[0])
+                statuses[item[0]] = item[1]
+        with self._lock:
+            for change in self._pending: # Saved or accepted while loading; may already be in the snapshot
+                self._apply(tree, statuses, *change)
+            self._tree, self._statuses = tree, statuses
+
+    def search(self, dhash, status, max_distance=IMAGE_MATCH_MAX_DISTANCE, exclude_id=None):
+        """(distance, item id) of the items with this status whose photo is within max_distance bits, closest first."""
+        if self._tree is None:
+            if not self._load_lock.acquire(blocking=False):
+                return [] # Another thread is loading: no suggestions rather than blocking the caller (often the GUI thread)
+            try:
+                if self._tree is None:
+                    self._load()
+            finally:
+                self._load_lock.release()
+        with self._lock:
+            return sorted((distance, item_id) for distance, item_id in self._tree.search(dhash, max_distance)
+                          if item_id != exclude_id and self._statuses.get(item_id) == status)
+
+    def record(self, item_id, status, dhash=None):
+        """Add a newly saved item's photo hash, or record a status change of an indexed item."""
+        with self._lock:
+            if self._tree is None:
+                if self._pending is not None:
+                    self._pending.append((item_id, status, dhash)) # A load is running; replay onto its result
+                return # Otherwise not loaded yet; the first load will see the change
+            self._apply(self._tree, self._statuses, item_id, status, dhash)
+
+image_similarity_index = ImageSimilarityIndex()
+
+def find_look_alike_items(item_id, image_dhash, status):
+    """Open items of the opposite status whose photo looks like this item's, in the same shape as
+       find_item_matches (score = fraction of identical hash bits), closest first.
+    """
+    opposite_status = {'lost': 'found', 'found': 'lost'}.get(status)
+    if image_dhash is None or not opposite_status:
+        return []
+    nearest = image_similarity_index.search(image_dhash, opposite_status, exclude_id=item_id)[:IMAGE_MATCH_MAX_RESULTS]
+    if not nearest:
+        return []
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(f"SELECT id, title, location, date FROM items "
+                       f"WHERE id IN ({', '.join(['%s'] * len(nearest))})", tuple(item_id for _, item_id in nearest))
+        rows = {row['id']: row for row in cursor.fetchall()}
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+    return [dict(rows[item_id], score=1 - distance / 64) for distance, item_id in nearest if item_id in rows]
+
+class MinHashLSHIndex:
+    """MinHash signatures of users' posts, bucketed by (user, category, LSH band). A user's posts are loaded with
+       one query on the owner index the first time that user posts, then kept current by save_item (record) and
+       accept_claim (forget). Finding a post's duplicates reads only its own buckets, so the cost does not grow
+       with the table.
+    """
+    PRIME = (1 << 31) - 1
+    _random = np.random.default_rng(20240501) # Fixed seed: signatures stay comparable across runs
+    A = _random.integers(1, PRIME, DUPLICATE_MINHASH_PERMUTATIONS, dtype=np.uint64)
+    B = _random.integers(0, PRIME, DUPLICATE_MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+    def __init__(self):
+        self._loaded_users = set()
+        self._buckets = {} # (user id, category, band, band bytes) -> set of item ids
+        self._posts = {} # item id -> (user id, category, signature, title)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def signature(cls, title, description):
+        """MinHash signature (uint64 array) of the shingles of title + description, or None if there are none."""
+        text = " ".join(fold_search_text(f"{title} {description or ''}").split())
+        shingles = {text[i:i + DUPLICATE_SHINGLE_SIZE] for i in range(max(len(text) - DUPLICATE_SHINGLE_SIZE + 1, 0))}
+        if not shingles:
+            return None
+        hashes = np.array([zlib.crc32(shingle.encode('utf-8')) % cls.PRIME for shingle in shingles], dtype=np.uint64)
+        # (a*x + b) mod p stays below 2**62 for 31-bit a, b and x, so uint64 never overflows
+        return ((cls.A[:, None] * hashes[None, :] + cls.B[:, None]) % cls.PRIME).min(axis=1)
+
+    def _bucket_keys(self, user_id, category, signature):
+        rows = DUPLICATE_MINHASH_PERMUTATIONS // DUPLICATE_LSH_BANDS
+        return [(user_id, category, band, signature[band * rows:(band + 1) * rows].tobytes())
+                for band in range(DUPLICATE_LSH_BANDS)]
+
+    def _add(self, item_id, user_id, category, title, description):
+        signature = self.signature(title, description)
+        if signature is None:
+            return
+        self._posts[item_id] = (user_id, category, signature, title)
+        for key in self._bucket_keys(user_id, category, signature):
+            self._buckets.setdefault(key, set()).add(item_id)
+
+    def _load_user(self, user_id):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT id, category, title, description FROM items "
+                           "WHERE user_id = %s AND status != %s", (user_id, 'recovered'))
+            for item_id, category, title, description in cursor.fetchall():
+                self._add(item_id, user_id, category, title, description)
+            self._loaded_users.add(user_id)
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def find(self, user_id, category, title, description):
+        """(similarity, item id, title) of the user's open posts in this category that look like a duplicate,
+           most similar first. Raises mysql.connector.Error if the user's posts had to be loaded and could not be.
+        """
+        signature = self.signature(title, description)
+        if signature is None:
+            return []
+        with self._lock:
+            if user_id not in self._loaded_users:
+                self._load_user(user_id)
+            candidates = set()
+            for key in self._bucket_keys(user_id, category, signature):
+                candidates |= self._buckets.get(key, set())
+            duplicates = []
+            for item_id in candidates:
+                similarity = float(np.mean(self._posts[item_id][2] == signature))
+                if similarity >= DUPLICATE_MIN_SIMILARITY:
+                    duplicates.append((similarity, item_id, self._posts[item_id][3]))
+        return sorted(duplicates, reverse=True)
+
+    def record(self, item_id, user_id, category, title, description):
+        """Add a newly saved post, if its owner's posts are loaded (otherwise their first load will see it)."""
+        with self._lock:
+            if user_id in self._loaded_users:
+                self._add(item_id, user_id, category, title, description)
+
+    def forget(self, item_id):
+        """Drop a post that is no longer open (e.g. recovered), so re-posting that item is not flagged."""
+        with self._lock:
+            post = self._posts.pop(item_id, None)
+            if post:
+                for key in self._bucket_keys(post[0], post[1], post[2]):
+                    self._buckets.get(key, set()).discard(item_id)
+
+duplicate_post_index = MinHashLSHIndex()
+
+def find_duplicate_posts(user_id, category, title, description):
+    """The user's open posts that the new one would likely duplicate, as (similarity, item id, title), best first."""
+    try:
+        return duplicate_post_index.find(user_id, category, title, description)
+    except mysql.connector.Error as e:
+        print(f"Error checking for duplicate posts: {e}")
+        return []
+
+def get_text_terms(text):
+    """Folded words of text, as saved-search keywords are compared."""
+    return {fold_search_text(word) for word in get_search_words(text)}
+
+class SavedSearchIndex:
+    """Inverted index of the saved searches. Each search is posted under a single key, its most selective term,
+       and an item can only match searches posted under one of its own terms, so matching a new item reads
+       those buckets instead of every saved search. Loaded on first use, then kept current by save_search.
+    """
+    def __init__(self, ttl=None):
+        self.ttl = ttl
+        self._buckets = None # key -> list of saved searches, None until loaded
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(search):
+        if search['words']:
+            return ('word', max(search['words'], key=len))
+        for field in ('location', 'category', 'status'):
+            if search[field]:
+                return (field, search[field])
+        return ('any',)
+
+    def _add(self, search_id, user_id, category, location, keywords, status):
+        search = {'id': search_id, 'user_id': user_id, 'words': get_text_terms(keywords),
+                  'category': fold_search_text(category) if category else None,
+                  'location': fold_search_text(location) if location else None, 'status': status}
+        self._buckets.setdefault(self._key(search), []).append(search)
+
+    def _load(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT id, user_id, category, location, keywords, status FROM saved_searches")
+            self._buckets = {}
+            for row in cursor.fetchall():
+                self._add(*row)
+            self._loaded_at = time.monotonic()
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def match(self, poster_id, title, category, location, status, description):
+        """(saved search id, subscriber id) of the other users' searches this item satisfies.
+           Raises mysql.connector.Error if the index had to be loaded and could not be.
+        """
+        words = get_text_terms(f"{title} {description or ''}")
+        category = fold_search_text(category) if category else None
+        location = fold_search_text(location) if location else None
+        keys = [('word', word) for word in words] + [('location', location), ('category', category), ('status', status), ('any',)]
+        with self._lock:
+            if self._buckets is None or (self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl):
+                self._load()
+            candidates = [search for key in keys for search in self._buckets.get(key, ())]
+        return [(search['id'], search['user_id']) for search in candidates
+                if search['user_id'] != poster_id
+                and search['words'] <= words
+                and search['category'] in (None, category)
+                and search['location'] in (None, location)
+                and search['status'] in (None, status)]
+
+    def record(self, search_id, user_id, category, location, keywords, status):
+        with self._lock:
+            if self._buckets is not None: # Not loaded yet; the first load will see it
+                self._add(search_id, user_id, category, location, keywords, status)
+
+saved_search_index = SavedSearchIndex(SAVED_SEARCH_INDEX_TTL_SECONDS)
+
+def save_search(user_id, category=None, location=None, keywords=None, status=None):
+    """Save a search so its owner is alerted about matching items posted later."""
+    if not connect_to_mysql():
+        return False, "Database connection failed"
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
+        cursor.execute(
+            "INSERT INTO saved_searches (user_id, category, location, keywords, status) VALUES (%s, %s, %s, %s, %s)",
+            (user_id, category, location, keywords, status)
+        )
+        saved_search_index.record(cursor.lastrowid, user_id, category, location, keywords, status)
+        kind = {'lost': "lost item", 'found': "found item"}.get(status, "item")
+        return True, f"Search saved. You will be alerted when a matching {kind} is posted."
+    except mysql.connector.Error as e:
+        print(f"Error saving search: {e}")
+        return False, f"Failed to save search: {e}"
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+def notify_saved_searches(item_id, poster_id, title, category, location, status, description):
+    """Create an alert for every saved search (of another user) that a newly saved item satisfies."""
+    connection = None
+    cursor = None
+    try:
+        matches = saved_search_index.match(poster_id, title, category, location, status, description)
+        if not matches:
+            return
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT IGNORE INTO search_alerts (user_id, saved_search_id, item_id) VALUES (%s, %s, %s)",
+            [(subscriber_id, search_id, item_id) for search_id, subscriber_id in matches]
+        )
+    except Exception as e:
+        print(f"Error creating saved search alerts: {e}") # The item is saved; only its alerts are lost
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
+def get_search_alerts(user_id):
+    """Unseen saved-search alerts of a user with the matching item's title, status and location, newest first."""
+    if not connect_to_mysql():
+        return []
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(
+            """SELECT a.id AS alert_id, i.title, i.status, i.location
+               FROM search_alerts a
+               JOIN items i ON a.item_id = i.id
+               WHERE a.user_id = %s AND a.seen = FALSE
+               ORDER BY a.created_at DESC""",
+            (user_id,)
+        )
+        return cursor.fetchall()
+    except mysql.connector.Error as e:
+        print(f"Error fetching saved search alerts: {e}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+def mark_search_alerts_seen(user_id, alert_ids):
+    if not alert_ids or not connect_to_mysql():
+        return
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
+        cursor.execute(
+            f"UPDATE search_alerts SET seen = TRUE WHERE user_id = %s AND id IN ({', '.join(['%s'] * len(alert_ids))})",
+            (user_id, *alert_ids)
+        )
+    except mysql.connector.Error as e:
+        print(f"Error marking saved search alerts as seen: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
 
 # --- Claim Management Functions ---
 
-def submit_claim(item_id, claimant_id, reason, evidence_image_data=None):
-    """Submit a claim for an item."""
+def submit_claim(item_id, claimant_id, reason, evidence_image_data=None, evidence_image_path=None):
+    """Submit a claim for an item. Evidence is given either as bytes or as a file path."""
     if not connect_to_mysql() or not connect_to_mongodb():
         return False, "Database connection failed"
 
     mongo_detail_id_obj = None
     mongo_detail_id_str = None
+    evidence_hash = None
+    connection = None
     cursor = None
 
     try:
-        if evidence_image_data:
-            mongo_result = mongo_db.claims_detail.insert_one({
-                "evidence_image": Binary(evidence_image_data),
+        if evidence_image_path or evidence_image_data:
+            evidence_hash, thumbnails = acquire_image_blob(
+                EVIDENCE_THUMBNAIL_SIZE, evidence_image_data, evidence_image_path,
+                metadata={"kind": "claim_evidence"})
+            claim_detail = {
+                "evidence_image_hash": evidence_hash,
+                "thumbnails": thumbnails,
                 "notes": f"Evidence for claim on item {item_id} by user {claimant_id}" 
-            })
+            }
+            mongo_result = mongo_db.claims_detail.insert_one(claim_detail)
             mongo_detail_id_obj = mongo_result.inserted_id
             mongo_detail_id_str = str(mongo_detail_id_obj)
 
         # 2. Save claim details to MySQL
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         cursor.execute(
             """INSERT INTO claims (item_id, claimant_id, reason, status, mongo_detail_id, created_at)
                VALUES (%s, %s, %s, %s, %s, %s)""",
             (item_id, claimant_id, reason, 'pending', mongo_detail_id_str, datetime.datetime.now())
         )
-        mysql_connection.commit()
+        connection.commit()
         return True, "Claim submitted successfully!"
 
     except Exception as e:
@@ -425,9 +1920,11 @@ def submit_claim(item_id, claimant_id, reason, evidence_image_data=None):
                 print(f"Cleaned up MongoDB claim detail {mongo_detail_id_str} due to error.")
             except Exception as mongo_del_err:
                 print(f"Error cleaning up MongoDB claim detail {mongo_detail_id_str}: {mongo_del_err}")
+        release_image_blob(evidence_hash)
         # Rollback MySQL
         try:
-            mysql_connection.rollback()
+            if connection:
+                connection.rollback()
         except Exception as rollback_err:
             print(f"Error rolling back MySQL transaction: {rollback_err}")
 
@@ -435,6 +1932,24 @@ def submit_claim(item_id, claimant_id, reason, evidence_image_data=None):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
+
+
+def attach_claim_evidence(claims_mysql):
+    """Add 'has_evidence' to each claim row, resolved in bulk without loading the images.
+       Cards load evidence thumbnails on demand through get_claim_evidence_thumbnails.
+    """
+    try:
+        details_by_id, _ = fetch_details_by_ids(
+            mongo_db.claims_detail, [claim.get('mongo_detail_id') for claim in claims_mysql], {"evidence_image": 0, "thumbnails": 0})
+    except Exception as e:
+        print(f"Error fetching claim details in bulk: {e}")
+        details_by_id = {}
+
+    for claim in claims_mysql:
+        claim['has_evidence'] = claim.get('mongo_detail_id') in details_by_id
+    return claims_mysql
 
 
 def get_claims_for_item(item_id):
@@ -443,9 +1958,11 @@ def get_claims_for_item(item_id):
         print("Database connection failed in get_claims_for_item")
         return []
     claims = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
         query = """
         SELECT c.id AS claim_id, c.item_id, c.claimant_id, c.reason, c.status AS claim_status,
                c.mongo_detail_id, c.created_at AS claim_created_at,
@@ -458,19 +1975,8 @@ def get_claims_for_item(item_id):
         cursor.execute(query, (item_id,))
         claims_mysql = cursor.fetchall()
 
-        # Optionally fetch evidence image data from MongoDB for each claim
-        for claim in claims_mysql:
-            mongo_detail_id_str = claim.get('mongo_detail_id')
-            evidence_image_data = None
-            if mongo_detail_id_str:
-                try:
-                    claim_detail = mongo_db.claims_detail.find_one({"_id": ObjectId(mongo_detail_id_str)})
-                    if claim_detail:
-                        evidence_image_data = claim_detail.get('evidence_image')
-                except Exception as e:
-                    print(f"Error fetching claim detail ({mongo_detail_id_str}): {e}")
-            claim['evidence_image_data'] = evidence_image_data
-            claims.append(claim)
+        # Check for claim evidence in MongoDB in bulk (images are loaded on demand)
+        claims = attach_claim_evidence(claims_mysql)
 
         return claims
     except mysql.connector.Error as e:
@@ -482,6 +1988,50 @@ def get_claims_for_item(item_id):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
+
+
+def get_claims_on_user_items(owner_id):
+    """Retrieve all claims on the non-recovered items of a specific owner in a single query,
+       newest first, with claimant and item info. Evidence is resolved in bulk.
+    """
+    if not connect_to_mysql() or not connect_to_mongodb():
+        print("Database connection failed in get_claims_on_user_items")
+        return []
+    claims = []
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        query = """
+        SELECT c.id AS claim_id, c.item_id, c.claimant_id, c.reason, c.status AS claim_status,
+               c.mongo_detail_id, c.created_at AS claim_created_at,
+               u.username AS claimant_username, i.title AS item_title
+        FROM claims c
+        JOIN items i ON c.item_id = i.id
+        JOIN users u ON c.claimant_id = u.id
+        WHERE i.user_id = %s AND i.status != %s
+        ORDER BY c.created_at DESC
+        """
+        cursor.execute(query, (owner_id, 'recovered'))
+        claims_mysql = cursor.fetchall()
+
+        claims = attach_claim_evidence(claims_mysql)
+
+        return claims
+    except mysql.connector.Error as e:
+        print(f"Error fetching claims on user items from MySQL: {e}")
+        return []
+    except Exception as e:
+        print(f"An error occurred during claim retrieval for user items: {e}")
+        return claims 
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
 
 
 def get_claims_by_claimant(claimant_id):
@@ -490,9 +2040,11 @@ def get_claims_by_claimant(claimant_id):
         print("Database connection failed in get_claims_by_claimant")
         return []
     claims = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
         query = """
         SELECT c.id AS claim_id, c.item_id, c.claimant_id, c.reason, c.status AS claim_status,
                c.mongo_detail_id, c.created_at AS claim_created_at,
@@ -505,32 +2057,8 @@ def get_claims_by_claimant(claimant_id):
         cursor.execute(query, (claimant_id,))
         claims_mysql = cursor.fetchall()
 
-        # Fetch details (item image, claim evidence image) from MongoDB
-        for claim in claims_mysql:
-            mongo_detail_id_str = claim.get('mongo_detail_id') 
-            evidence_image_data = None
-            if mongo_detail_id_str:
-                try:
-                    claim_detail = mongo_db.claims_detail.find_one({"_id": ObjectId(mongo_detail_id_str)})
-                    if claim_detail:
-                        evidence_image_data = claim_detail.get('evidence_image')
-                except Exception as e:
-                    print(f"Error fetching claim detail ({mongo_detail_id_str}): {e}")
-            claim['evidence_image_data'] = evidence_image_data
-
-            # Fetch item image
-            item_mongo_id_str = claim.get('item_mongo_id')
-            item_image_data = None
-            if item_mongo_id_str:
-                 try:
-                     item_detail = mongo_db.items_detail.find_one({"_id": ObjectId(item_mongo_id_str)})
-                     if item_detail:
-                         item_image_data = item_detail.get('image')
-                 except Exception as e:
-                      print(f"Error fetching item detail for claim ({item_mongo_id_str}): {e}")
-            claim['item_image_data'] = item_image_data # Add item image to claim dict
-
-            claims.append(claim)
+        # Check for claim evidence in MongoDB in bulk (images are loaded on demand)
+        claims = attach_claim_evidence(claims_mysql)
 
         return claims
     except mysql.connector.Error as e:
@@ -542,37 +2070,48 @@ def get_claims_by_claimant(claimant_id):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def update_claim_status(claim_id, new_status):
     """Update the status of a specific claim."""
     if not connect_to_mysql():
         return False, "Database connection failed"
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         cursor.execute(
             "UPDATE claims SET status = %s WHERE id = %s",
             (new_status, claim_id)
         )
-        mysql_connection.commit()
+        connection.commit()
         return True, f"Claim {claim_id} status updated to {new_status}"
     except mysql.connector.Error as err:
         print(f"Error updating claim status: {err}")
-        mysql_connection.rollback()
+        if connection:
+            connection.rollback()
         return False, f"Failed to update claim status: {err}"
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def accept_claim(claim_id, item_id):
     """Accept a claim: update claim status, item status, reject other pending claims."""
     if not connect_to_mysql():
         return False, "Database connection failed"
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
 
         # 1. Update the accepted claim's status
         cursor.execute("UPDATE claims SET status = %s WHERE id = %s", ('accepted', claim_id))
@@ -590,16 +2129,21 @@ def accept_claim(claim_id, item_id):
         )
         rejected_count = cursor.rowcount 
 
-        mysql_connection.commit()
+        connection.commit()
+        image_similarity_index.record(item_id, 'recovered')
+        duplicate_post_index.forget(item_id)
         return True, f"Claim {claim_id} accepted. Item {item_id} marked as recovered. {rejected_count} other pending claims rejected."
 
     except Exception as err: 
         print(f"Error accepting claim: {err}")
-        mysql_connection.rollback()
+        if connection:
+            connection.rollback()
         return False, f"Failed to accept claim: {err}"
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def reject_claim(claim_id):
@@ -615,7 +2159,6 @@ class ClaimDialog(QDialog):
         super().__init__(parent)
         self.item_id = item_id
         self.selected_evidence_path = None
-        self.evidence_image_data = None
 
         self.setWindowTitle("Submit Claim")
         self.setMinimumWidth(450)
@@ -672,43 +2215,586 @@ class ClaimDialog(QDialog):
                                                   "Images (*.png *.jpg *.jpeg *.bmp *.gif)", options=options)
         if file_path:
             try:
-                pixmap = QPixmap(file_path)
-                if pixmap.isNull():
+                preview_image = decode_image_scaled(file_path, QSize(40, 40))
+                if preview_image.isNull():
                     raise ValueError("Invalid image file")
 
-                # Read image data for potential submission
-                
-                with open(file_path, 'rb') as f:
-                    self.evidence_image_data = f.read()
-                    if len(self.evidence_image_data) > 16 * 1024 * 1024: 
-                        QMessageBox.warning(self, "Image Too Large", "Evidence image must be under 16MB.")
-                        self.evidence_image_data = None
-                        self.selected_evidence_path = None
-                        self.evidence_preview_label.setText("Image too large.")
-                        self.evidence_preview_label.setPixmap(QPixmap()) 
-                        return
+                # Check the size limit of the configured image storage (the file is read at submission)
+                size_limit = image_size_limit()
+                if size_limit and os.path.getsize(file_path) > size_limit:
+                    QMessageBox.warning(self, "Image Too Large", f"Evidence image must be under {size_limit // (1024 * 1024)}MB.")
+                    self.selected_evidence_path = None
+                    self.evidence_preview_label.setText("Image too large.")
+                    self.evidence_preview_label.setPixmap(QPixmap()) 
+                    return
 
                 self.selected_evidence_path = file_path
                 # Display a small preview
-                preview_pixmap = pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                preview_pixmap = QPixmap.fromImage(preview_image)
                 self.evidence_preview_label.setPixmap(preview_pixmap)
                 self.evidence_preview_label.setToolTip(file_path)
 
             except Exception as e:
                 QMessageBox.warning(self, "Image Error", f"Could not load or read image: {e}")
                 self.selected_evidence_path = None
-                self.evidence_image_data = None
                 self.evidence_preview_label.setText("Error loading image.")
                 self.evidence_preview_label.setPixmap(QPixmap()) 
 
 
     def get_claim_data(self):
-        """Return the claim reason and image data."""
+        """Return the claim reason and the evidence image path (or None)."""
         reason = self.reason_edit.toPlainText().strip()
         if not reason:
             QMessageBox.warning(self, "Missing Information", "Please provide a reason for your claim.")
             return None
-        return reason, self.evidence_image_data
+        return reason, self.selected_evidence_path
+
+class PixmapCache:
+    """LRU cache of display-ready pixmaps keyed by Mongo document id and target size in device pixels.
+       Evicts least recently used entries once their decoded size exceeds max_bytes.
+       Pixmaps are GUI objects, so the cache is only used from the GUI thread.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict() # (mongo_id, width, height) -> (QPixmap, cost in bytes)
+
+    @staticmethod
+    def key(mongo_id, size):
+        return (str(mongo_id), size.width(), size.height())
+
+    def get(self, mongo_id, size):
+        key = self.key(mongo_id, size)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, mongo_id, size, pixmap):
+        if pixmap is None or pixmap.isNull():
+            return
+        cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        if cost > self.max_bytes:
+            return
+        key = self.key(mongo_id, size)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= previous[1]
+        self._entries[key] = (pixmap, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_cost
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        """Counters for sizing PIXMAP_CACHE_MAX_BYTES."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries), 'bytes': self.total_bytes, 'max_bytes': self.max_bytes,
+            'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+pixmap_cache = PixmapCache(PIXMAP_CACHE_MAX_BYTES)
+
+class BrowsePageLoader(QObject):
+    """Runs get_all_items on a worker thread and hands each page back to the GUI thread through page_loaded.
+       Every request is tagged with the current generation; cancel() starts a new one so that
+       results of superseded loads are dropped instead of being shown.
+       The worker never connects or shows dialogs itself: the GUI thread checks the connections before
+       request_page, and errors come back through page_failed.
+    """
+    page_loaded = pyqtSignal(int, object, bool) # generation, items, first_page
+    page_failed = pyqtSignal(int, str, bool) # generation, error message, first_page
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """Abandon the load in flight, if any."""
+        self.cancel_event.set()
+        self.cancel_event = threading.Event()
+        self.generation += 1
+
+    def request_page(self, filters, after, first_page):
+        worker = threading.Thread(target=self.run_page_query,
+                                  args=(self.generation, self.cancel_event, filters, after, first_page),
+                                  daemon=True)
+        worker.start()
+
+    def run_page_query(self, generation, cancel_event, filters, after, first_page):
+        if cancel_event.is_set():
+            return
+        filter_category, filter_location, include_recovered, search_text = filters
+        try:
+            items = get_all_items(filter_category, filter_location, include_recovered, after=after, limit=BROWSE_PAGE_SIZE,
+                                  search_text=search_text, connect=False)
+        except Exception as e:
+            if not cancel_event.is_set():
+                self.page_failed.emit(generation, str(e), first_page)
+            return
+        if not cancel_event.is_set():
+            # Queued to the GUI thread, since this object lives there
+            self.page_loaded.emit(generation, items, first_page)
+
+class ItemListModel(QAbstractListModel):
+    """Rows of the browse list: item dicts from get_all_items plus their lazily loaded thumbnails."""
+    IMAGE_STATE_ROLE = Qt.UserRole + 1 # 'loading', 'loaded' or 'missing'
+    TITLE_FIELD = 'title'
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+        self.images = {} # mongo_id -> QPixmap, or None when no usable image exists
+        self.rows_by_mongo_id = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        if role == Qt.UserRole:
+            return item
+        if role == Qt.DisplayRole:
+            return item.get(self.TITLE_FIELD)
+        if role == Qt.ToolTipRole:
+            description = item.get('description')
+            return f"{item.get(self.TITLE_FIELD)}\n\n{description}" if description else item.get(self.TITLE_FIELD)
+        mongo_id = self.image_id(item)
+        if role == Qt.DecorationRole:
+            return self.images.get(mongo_id)
+        if role == self.IMAGE_STATE_ROLE:
+            if not mongo_id or (mongo_id in self.images and self.images[mongo_id] is None):
+                return 'missing'
+            return 'loaded' if mongo_id in self.images else 'loading'
+        return None
+
+    def image_id(self, item):
+        """mongo id under which the row's thumbnail is fetched, or None when it has no image."""
+        return item.get('mongo_id')
+
+    def clear(self):
+        self.beginResetModel()
+        self.items = []
+        self.images = {}
+        self.rows_by_mongo_id = {}
+        self.endResetModel()
+
+    def append_items(self, items):
+        if not items:
+            return
+        first_row = len(self.items)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(items) - 1)
+        for row, item in enumerate(items, first_row):
+            self.items.append(item)
+            mongo_id = self.image_id(item)
+            if mongo_id:
+                self.rows_by_mongo_id.setdefault(mongo_id, []).append(row)
+        self.endInsertRows()
+
+    def pending_image_ids(self, first_row, last_row):
+        """mongo ids of the rows in [first_row, last_row] whose thumbnail has not been fetched yet."""
+        pending = []
+        for item in self.items[first_row:last_row + 1]:
+            mongo_id = self.image_id(item)
+            if mongo_id and mongo_id not in self.images and mongo_id not in pending:
+                pending.append(mongo_id)
+        return pending
+
+    def set_images(self, pixmaps_by_id):
+        for mongo_id, pixmap in pixmaps_by_id.items():
+            self.images[mongo_id] = pixmap
+            for row in self.rows_by_mongo_id.get(mongo_id, []):
+                model_index = self.index(row)
+                self.dataChanged.emit(model_index, model_index, [Qt.DecorationRole])
+
+
+class ItemCardDelegate(QStyledItemDelegate):
+    """Paints browse item cards, the painted counterpart of create_item_widget.
+       Only visible rows are painted; the claim button is hit-tested in editorEvent.
+    """
+    claim_clicked = pyqtSignal(int)
+
+    CARD_HEIGHT = 200
+    CARD_SPACING = 18
+    MARGIN = 15
+    IMAGE_SIZE = ITEM_THUMBNAIL_SIZE
+    STATUS_COLORS = {'lost': "#ffb74d", 'found': "#81c784", 'recovered': "#78909c"}
+
+    def __init__(self, can_claim, parent=None):
+        """can_claim(item) tells whether the claim button is shown for an item."""
+        super().__init__(parent)
+        self.can_claim = can_claim
+        self.title_font = QFont(FONT_FAMILY)
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+        self.badge_font = QFont(FONT_FAMILY, 9, QFont.Bold)
+        self.text_font = QFont(FONT_FAMILY)
+        self.text_font.setPixelSize(12)
+        self.label_font = QFont(self.text_font)
+        self.label_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(400, self.CARD_HEIGHT + self.CARD_SPACING)
+
+    def card_rect(self, option):
+        return option.rect.adjusted(5, 0, -10, -self.CARD_SPACING)
+
+    def claim_button_rect(self, card):
+        return QRect(card.right() - self.MARGIN - 150, card.bottom() - self.MARGIN - 28, 150, 28)
+
+    def draw_wrapped_text(self, painter, rect, text, max_lines):
+        """Draw text word-wrapped over at most max_lines lines from the top of rect, eliding the last line
+           when the text does not fit. Uses the painter's current font.
+        """
+        metrics = painter.fontMetrics()
+        utf16 = (text or '').replace('\n', '\u2028').encode('utf-16-le') # QTextLayout offsets count UTF-16 units
+        layout = QTextLayout(utf16.decode('utf-16-le'), painter.font())
+        layout.beginLayout()
+        lines = []
+        while len(lines) < max_lines:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(rect.width())
+            lines.append(line)
+        layout.endLayout()
+        for i, line in enumerate(lines):
+            end = line.textStart() + line.textLength()
+            if i == len(lines) - 1 and 2 * end < len(utf16):
+                end = len(utf16) // 2 # More text than lines: elide the rest into the last line
+            shown = utf16[2 * line.textStart():2 * end].decode('utf-16-le').replace('\u2028', ' ').rstrip()
+            if end != line.textStart() + line.textLength():
+                shown = metrics.elidedText(shown, Qt.ElideRight, rect.width())
+            painter.drawText(QRect(rect.left(), rect.top() + i * metrics.lineSpacing(), rect.width(), metrics.lineSpacing()),
+                             Qt.AlignLeft | Qt.AlignTop, shown)
+
+    def paint(self, painter, option, index):
+        item = index.data(Qt.UserRole)
+        card = self.card_rect(option)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        painter.setPen(QColor("#e0e0e0"))
+        painter.setBrush(QColor("#ffffff"))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        # --- Image Area ---
+        image_rect = QRect(card.left() + self.MARGIN, card.top() + self.MARGIN, self.IMAGE_SIZE, self.IMAGE_SIZE)
+        painter.setPen(QColor("#dddddd"))
+        painter.setBrush(QColor("#f0f0f0"))
+        painter.drawRoundedRect(image_rect, 5, 5)
+        pixmap = index.data(Qt.DecorationRole)
+        if pixmap is not None and not pixmap.isNull():
+            target = QRect(QPoint(0, 0), pixmap.size() / pixmap.devicePixelRatio())
+            target.moveCenter(image_rect.center())
+            painter.drawPixmap(target, pixmap)
+        else:
+            painter.setFont(self.text_font)
+            painter.setPen(QColor("#888888"))
+            image_state = index.data(ItemListModel.IMAGE_STATE_ROLE)
+            painter.drawText(image_rect, Qt.AlignCenter, "Loading..." if image_state == 'loading' else "No Image")
+
+        # --- Details Area ---
+        left = image_rect.right() + self.MARGIN
+        details = QRect(left, card.top() + self.MARGIN, card.right() - self.MARGIN - left, card.height() - 2 * self.MARGIN)
+
+        # Top line: Title and Status
+        item_status = item.get('status', 'unknown')
+        painter.setFont(self.badge_font)
+        status_text = item_status.upper()
+        badge_width = painter.fontMetrics().horizontalAdvance(status_text) + 12
+        badge = QRect(details.right() - badge_width, details.top(), badge_width, painter.fontMetrics().height() + 6)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.STATUS_COLORS.get(item_status, "#bdbdbd")))
+        painter.drawRoundedRect(badge, 4, 4)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignCenter, status_text)
+
+        painter.setFont(self.title_font)
+        painter.setPen(QColor(ACCENT_COLOR))
+        title_rect = QRect(details.left(), details.top(), badge.left() - 10 - details.left(), badge.height())
+        title = painter.fontMetrics().elidedText(item.get('title', 'No Title'), Qt.ElideRight, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+
+        # Middle section: Other details
+        rows = []
+        if 'owner_username' in item:
+            rows.append(("Posted by:", item['owner_username']))
+        rows.append(("Category:", item.get('category', 'N/A')))
+        rows.append(("Location:", item.get('location', 'N/A')))
+        rows.append(("Date:", item.get('date', 'N/A')))
+        line_height = QFontMetrics(self.text_font).height() + 4
+        label_width = QFontMetrics(self.label_font).horizontalAdvance("Posted by:") + 8
+        y = badge.bottom() + 8
+        for label, value in rows:
+            painter.setFont(self.label_font)
+            painter.setPen(QColor("#333333"))
+            painter.drawText(QRect(details.left(), y, label_width, line_height), Qt.AlignLeft | Qt.AlignVCenter, label)
+            painter.setFont(self.text_font)
+            painter.setPen(QColor("#444444"))
+            value_rect = QRect(details.left() + label_width, y, details.width() - label_width, line_height)
+            painter.drawText(value_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             painter.fontMetrics().elidedText(str(value), Qt.ElideRight, value_rect.width()))
+            y += line_height
+
+        # Description, elided to the lines that fit above the button row
+        show_claim = self.can_claim(item)
+        button = self.claim_button_rect(card)
+        description_bottom = (button.top() - 4) if show_claim else details.bottom()
+        text_height = QFontMetrics(self.text_font).lineSpacing()
+        visible_lines = max(0, (description_bottom - y - 5) // text_height)
+        if visible_lines:
+            description_rect = QRect(details.left(), y + 5, details.width(), visible_lines * text_height)
+            painter.setFont(self.text_font)
+            painter.setPen(QColor("#555555"))
+            self.draw_wrapped_text(painter, description_rect, item.get('description', 'No description.'), visible_lines)
+
+        # --- Action Button Area ---
+        if show_claim:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(PRIMARY_COLOR))
+            painter.drawRoundedRect(button, 4, 4)
+            painter.setFont(self.label_font)
+            painter.setPen(QColor("white"))
+            painter.drawText(button, Qt.AlignCenter, "Claim This Item")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            item = index.data(Qt.UserRole)
+            if self.can_claim(item) and self.claim_button_rect(self.card_rect(option)).contains(event.pos()):
+                self.claim_clicked.emit(item['id'])
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class ClaimListModel(ItemListModel):
+    """Rows of a profile claim list: claim dicts plus their lazily loaded evidence thumbnails."""
+    TITLE_FIELD = 'item_title'
+
+    def image_id(self, claim):
+        return claim.get('mongo_detail_id') if claim.get('has_evidence') else None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.ToolTipRole and index.isValid():
+            claim = self.items[index.row()]
+            return (f"{claim.get('reason', 'No reason provided.')}\n\n"
+                    f"Claim ID: {claim.get('claim_id')}, Claimant ID: {claim.get('claimant_id')}")
+        return super().data(index, role)
+
+
+class ClaimCardDelegate(QStyledItemDelegate):
+    """Paints claim cards for the profile page.
+       Context: 'owner_view' or 'claimant_view'. Accept/Reject are hit-tested in editorEvent.
+    """
+    accept_clicked = pyqtSignal(int, int) # claim_id, item_id
+    reject_clicked = pyqtSignal(int) # claim_id
+
+    CARD_HEIGHT = 180
+    CARD_SPACING = 10
+    MARGIN = 10
+    EVIDENCE_SIZE = EVIDENCE_THUMBNAIL_SIZE
+    CARD_COLORS = {'accepted': "#e8f5e9", 'rejected': "#ffebee"}
+    STATUS_COLORS = {'pending': "#ffc107", 'accepted': "#4caf50", 'rejected': "#f44336"}
+
+    def __init__(self, context, parent=None):
+        super().__init__(parent)
+        self.context = context
+        self.info_font = QFont(FONT_FAMILY)
+        self.info_font.setPixelSize(13)
+        self.info_bold_font = QFont(self.info_font)
+        self.info_bold_font.setBold(True)
+        self.info_italic_font = QFont(self.info_font)
+        self.info_italic_font.setItalic(True)
+        self.badge_font = QFont(FONT_FAMILY, 9, QFont.Bold)
+        self.text_font = QFont(FONT_FAMILY)
+        self.text_font.setPixelSize(12)
+        self.label_font = QFont(self.text_font)
+        self.label_font.setBold(True)
+        self.note_font = QFont(FONT_FAMILY)
+        self.note_font.setPixelSize(11)
+        self.note_font.setItalic(True)
+        self.button_font = QFont(FONT_FAMILY)
+        self.button_font.setPixelSize(11)
+        self.accept_icon = QIcon.fromTheme("dialog-ok-apply")
+        self.reject_icon = QIcon.fromTheme("dialog-cancel")
+
+    REASON_FLAGS = Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap
+
+    def reason_height(self, claim, card_width):
+        """Height of the whole claim reason wrapped to the card, at least the two lines CARD_HEIGHT leaves for it."""
+        metrics = QFontMetrics(self.text_font)
+        width = max(card_width - 2 * self.MARGIN - QFontMetrics(self.label_font).horizontalAdvance("Reason: "), 1)
+        text_height = metrics.boundingRect(QRect(0, 0, width, 0), self.REASON_FLAGS, claim.get('reason', 'No reason provided.')).height()
+        return max(text_height, 2 * metrics.lineSpacing())
+
+    def sizeHint(self, option, index):
+        # Cards grow with their reason, so owners can read all of it before accepting or rejecting
+        card_width = option.widget.viewport().width() if option.widget is not None else option.rect.width()
+        extra = self.reason_height(index.data(Qt.UserRole), card_width) - 2 * QFontMetrics(self.text_font).lineSpacing()
+        return QSize(300, self.CARD_HEIGHT + extra + self.CARD_SPACING)
+
+    def card_rect(self, option):
+        return option.rect.adjusted(0, 0, 0, -self.CARD_SPACING)
+
+    def bottom_row_rect(self, card):
+        """Row holding the evidence preview on the left and the owner's buttons on the right."""
+        return QRect(card.left() + self.MARGIN, card.bottom() - self.MARGIN - self.EVIDENCE_SIZE,
+                     card.width() - 2 * self.MARGIN, self.EVIDENCE_SIZE)
+
+    def reject_button_rect(self, card):
+        row = self.bottom_row_rect(card)
+        return QRect(row.right() - 90, row.center().y() - 13, 90, 26)
+
+    def accept_button_rect(self, card):
+        return self.reject_button_rect(card).translated(-96, 0)
+
+    def has_actions(self, claim):
+        return self.context == 'owner_view' and claim.get('claim_status', 'pending') == 'pending'
+
+    def info_segments(self, claim):
+        """The card's first line as (text, font) runs."""
+        if self.context == 'claimant_view':
+            item_status = claim.get('item_status', '?')
+            return [("Your claim on: ", self.info_font),
+                    (claim.get('item_title', 'Unknown Item'), self.info_bold_font),
+                    (f" (Item Status: {item_status.upper()})", self.info_font)]
+        return [("Claim by ", self.info_font),
+                (claim.get('claimant_username', 'Unknown User'), self.info_bold_font),
+                (" on: ", self.info_font),
+                (claim.get('item_title', 'Your Item'), self.info_italic_font)]
+
+    def draw_segments(self, painter, rect, segments):
+        """Draw text runs one after another on a single line, eliding the run that overflows."""
+        x = rect.left()
+        for text, font in segments:
+            available = rect.right() - x
+            if available <= 0:
+                break
+            painter.setFont(font)
+            shown = painter.fontMetrics().elidedText(text, Qt.ElideRight, available)
+            painter.drawText(QRect(x, rect.top(), available, rect.height()), Qt.AlignLeft | Qt.AlignVCenter, shown)
+            if shown != text:
+                break
+            x += painter.fontMetrics().horizontalAdvance(shown)
+
+    def draw_button(self, painter, rect, color, icon, text):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setFont(self.button_font)
+        content_width = painter.fontMetrics().horizontalAdvance(text)
+        icon_size = 14 if not icon.isNull() else 0
+        if icon_size:
+            content_width += icon_size + 4
+        x = rect.center().x() - content_width // 2
+        if icon_size:
+            icon.paint(painter, QRect(x, rect.center().y() - icon_size // 2, icon_size, icon_size))
+            x += icon_size + 4
+        painter.setPen(QColor("white"))
+        painter.drawText(QRect(x, rect.top(), rect.right() - x, rect.height()), Qt.AlignLeft | Qt.AlignVCenter, text)
+
+    def paint(self, painter, option, index):
+        claim = index.data(Qt.UserRole)
+        card = self.card_rect(option)
+        claim_status = claim.get('claim_status', 'pending')
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        painter.setPen(QColor("#cccccc"))
+        painter.setBrush(QColor(self.CARD_COLORS.get(claim_status, "#ffffff")))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+        content = card.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+        # Top line: who claimed what, and the claim status
+        painter.setFont(self.badge_font)
+        status_text = claim_status.upper()
+        badge_width = painter.fontMetrics().horizontalAdvance(status_text) + 12
+        badge = QRect(content.right() - badge_width, content.top(), badge_width, painter.fontMetrics().height() + 6)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.STATUS_COLORS.get(claim_status, "#bdbdbd")))
+        painter.drawRoundedRect(badge, 4, 4)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignCenter, status_text)
+
+        painter.setPen(QColor("#222222"))
+        info_rect = QRect(content.left(), content.top(), badge.left() - 10 - content.left(), badge.height())
+        self.draw_segments(painter, info_rect, self.info_segments(claim))
+
+        # Claim Reason, in full (sizeHint made room for it)
+        y = badge.bottom() + 8
+        text_height = QFontMetrics(self.text_font).lineSpacing()
+        painter.setFont(self.label_font)
+        painter.setPen(QColor("#333333"))
+        label_width = painter.fontMetrics().horizontalAdvance("Reason: ")
+        painter.drawText(QRect(content.left(), y, label_width, text_height), Qt.AlignLeft | Qt.AlignTop, "Reason:")
+        painter.setFont(self.text_font)
+        reason_rect = QRect(content.left() + label_width, y, content.width() - label_width, self.reason_height(claim, card.width()))
+        painter.drawText(reason_rect, self.REASON_FLAGS, claim.get('reason', 'No reason provided.'))
+
+        # Claim Date
+        y = reason_rect.bottom() + 4
+        created_at_raw = claim.get('claim_created_at', '')
+        created_at_str = str(created_at_raw).split('.')[0] if created_at_raw else 'Unknown Date'
+        painter.setFont(self.note_font)
+        painter.setPen(QColor("#666666"))
+        painter.drawText(QRect(content.left(), y, content.width(), painter.fontMetrics().height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, f"Submitted: {created_at_str}")
+
+        # Bottom row: evidence preview and the owner's actions
+        row = self.bottom_row_rect(card)
+        if claim.get('has_evidence'):
+            evidence_rect = QRect(row.left(), row.top(), self.EVIDENCE_SIZE, self.EVIDENCE_SIZE)
+            painter.setPen(QColor("#bbbbbb"))
+            painter.setBrush(QColor("#e0e0e0"))
+            painter.drawRoundedRect(evidence_rect, 4, 4)
+            pixmap = index.data(Qt.DecorationRole)
+            if pixmap is not None and not pixmap.isNull():
+                target = QRect(QPoint(0, 0), pixmap.size() / pixmap.devicePixelRatio())
+                target.moveCenter(evidence_rect.center())
+                painter.drawPixmap(target, pixmap)
+            else:
+                painter.setFont(self.button_font)
+                painter.setPen(QColor("#666666"))
+                image_state = index.data(ClaimListModel.IMAGE_STATE_ROLE)
+                painter.drawText(evidence_rect, Qt.AlignCenter, "..." if image_state == 'loading' else "Invalid\nEvidence")
+        else:
+            painter.setFont(self.note_font)
+            painter.setPen(QColor("#888888"))
+            painter.drawText(row, Qt.AlignLeft | Qt.AlignVCenter, "No evidence provided")
+
+        if self.has_actions(claim):
+            self.draw_button(painter, self.accept_button_rect(card), "#4caf50", self.accept_icon, "Accept")
+            self.draw_button(painter, self.reject_button_rect(card), "#f44336", self.reject_icon, "Reject")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            claim = index.data(Qt.UserRole)
+            if self.has_actions(claim):
+                card = self.card_rect(option)
+                if self.accept_button_rect(card).contains(event.pos()):
+                    self.accept_clicked.emit(claim['claim_id'], claim['item_id'])
+                    return True
+                if self.reject_button_rect(card).contains(event.pos()):
+                    self.reject_clicked.emit(claim['claim_id'])
+                    return True
+        return super().editorEvent(event, model, option, index)
 
 class TawdrlikApp(QMainWindow):
     def __init__(self):
@@ -719,9 +2805,26 @@ class TawdrlikApp(QMainWindow):
             self.databases_connected = False
         else:
             self.databases_connected = True
+            threading.Thread(target=warm_search_indexes, daemon=True).start()
 
         self.current_user = None 
         self.selected_image_path = None 
+
+        # Browse page paging state (see load_all_items / load_next_browse_page)
+        self.browse_filters = (None, None, False, None)
+        self.browse_next_key = None
+        self.browse_exhausted = True
+        self.browse_loading = False
+        self.browse_loader = BrowsePageLoader(self)
+        self.browse_loader.page_loaded.connect(self.handle_browse_page_loaded)
+        self.browse_loader.page_failed.connect(self.handle_browse_page_failed)
+
+        # Image labels waiting for their card to scroll into view
+        self.pending_lazy_images = []
+        self.lazy_image_timer = QTimer(self)
+        self.lazy_image_timer.setSingleShot(True)
+        self.lazy_image_timer.timeout.connect(self.load_visible_images)
+
         self.setWindowTitle("Tawdrlik - Lost & Found System")
         self.setGeometry(100, 100, 950, 750) 
         self.setStyleSheet(f"background-color: {BACKGROUND_COLOR};")
@@ -734,6 +2837,8 @@ class TawdrlikApp(QMainWindow):
 
         # Create stacked widget for different pages 
         self.stacked_widget = QStackedWidget()
+        self.stacked_widget.currentChanged.connect(self.schedule_lazy_image_load)
+        self.stacked_widget.currentChanged.connect(self.handle_page_changed)
         self.main_layout.addWidget(self.stacked_widget, 1) # Give stack widget stretch factor
 
         # Create different pages
@@ -1106,20 +3211,19 @@ class TawdrlikApp(QMainWindow):
                                                   "Images (*.png *.jpg *.jpeg *.bmp *.gif)", options=options)
         if file_path:
             try:
-                pixmap = QPixmap(file_path)
-                if pixmap.isNull():
+                preview_image = decode_image_scaled(file_path, self.image_preview_label.size())
+                if preview_image.isNull():
                     raise ValueError("Invalid image file")
 
                  # Check file size before storing path (optional but good)
-                with open(file_path, 'rb') as f:
-                     image_data_temp = f.read()
-                     if len(image_data_temp) > 16 * 1024 * 1024:
-                          QMessageBox.warning(self, "Image Too Large", "Item image must be under 16MB.")
-                          return 
+                size_limit = image_size_limit()
+                if size_limit and os.path.getsize(file_path) > size_limit:
+                     QMessageBox.warning(self, "Image Too Large", f"Item image must be under {size_limit // (1024 * 1024)}MB.")
+                     return 
                 self.selected_image_path = file_path
                 
                 # Display a thumbnail preview
-                preview_pixmap = pixmap.scaled(self.image_preview_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                preview_pixmap = QPixmap.fromImage(preview_image)
                 self.image_preview_label.setPixmap(preview_pixmap)
                 self.image_preview_label.setToolTip(file_path) 
 
@@ -1178,6 +3282,14 @@ class TawdrlikApp(QMainWindow):
         self.location_filter.addItem("All Locations")
         self.location_filter.setStyleSheet(combo_style)
         self.location_filter.setCursor(Qt.PointingHandCursor)
+        self.location_filter.setEditable(True) # Typed locations are matched loosely (see TrigramIndex)
+        self.location_filter.setInsertPolicy(QComboBox.NoInsert)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("e.g., blue wallet")
+        self.search_input.setStyleSheet("QLineEdit { padding: 10px; min-width: 200px; font-size: 14px; background-color: white; }")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.returnPressed.connect(self.apply_item_filters)
 
         apply_filter_button = QPushButton(QIcon.fromTheme("edit-find"), " Apply Filter")
         apply_filter_button.setStyleSheet(f"QPushButton {{ background-color: {ACCENT_COLOR}; color: white; padding: 10px 20px; border-radius: 5px; font-weight: bold; font-size: 14px; border: none; }} QPushButton:hover {{ background-color: #162d40; }}")
@@ -1191,7 +3303,24 @@ class TawdrlikApp(QMainWindow):
         reset_filter_button.setIconSize(reset_filter_button.sizeHint() * 0.6)
         reset_filter_button.clicked.connect(self.reset_item_filters)
 
+        save_search_button = QPushButton(QIcon.fromTheme("bookmark-new"), " Save Search")
+        save_search_button.setStyleSheet("QPushButton { background-color: #e0e0e0; color: #333; padding: 10px 20px; border-radius: 5px; font-weight: bold; font-size: 14px; border: none; } QPushButton:hover { background-color: #d5d5d5; }")
+        save_search_button.setCursor(Qt.PointingHandCursor)
+        save_search_button.setIconSize(save_search_button.sizeHint() * 0.6)
+        save_search_button.clicked.connect(self.handle_save_search)
+
+        # Which items a saved search alerts about; browsing itself always lists both
+        self.alert_status_filter = QComboBox()
+        self.alert_status_filter.addItem("Lost or Found", None)
+        self.alert_status_filter.addItem("Lost", 'lost')
+        self.alert_status_filter.addItem("Found", 'found')
+        self.alert_status_filter.setStyleSheet(combo_style.replace("min-width: 180px", "min-width: 130px"))
+        self.alert_status_filter.setCursor(Qt.PointingHandCursor)
+        self.alert_status_filter.setToolTip("Alert me about lost items, found items, or both")
+
         filter_layout.addWidget(filter_label)
+        filter_layout.addWidget(QLabel("Search:"))
+        filter_layout.addWidget(self.search_input)
         filter_layout.addWidget(QLabel("Category:"))
         filter_layout.addWidget(self.category_filter)
         filter_layout.addWidget(QLabel("Location:"))
@@ -1199,23 +3328,38 @@ class TawdrlikApp(QMainWindow):
         filter_layout.addSpacing(10)
         filter_layout.addWidget(apply_filter_button)
         filter_layout.addWidget(reset_filter_button)
+        filter_layout.addWidget(self.alert_status_filter)
+        filter_layout.addWidget(save_search_button)
         filter_layout.addStretch()
 
         view_layout.addWidget(filter_container)
 
-        # Items list area (Scrollable)
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("border: none; background-color: transparent;")
-
-        scroll_content = QWidget()
-        self.items_list_layout = QVBoxLayout(scroll_content)
-        self.items_list_layout.setAlignment(Qt.AlignTop)
-        self.items_list_layout.setSpacing(18)
-        self.items_list_layout.setContentsMargins(5, 5, 10, 5)
-
-        scroll_area.setWidget(scroll_content)
-        view_layout.addWidget(scroll_area)
+        # Loading / empty state message, shown in place of the list
+        self.items_status_label = QLabel()
+        self.items_status_label.setAlignment(Qt.AlignCenter)
+        self.items_status_label.setStyleSheet("color: #888; margin: 30px 0;")
+        self.items_status_label.hide()
+        view_layout.addWidget(self.items_status_label)
+
+        # Items list area: a model/view list whose delegate paints only the visible cards
+        self.items_model = ItemListModel(self)
+        self.item_delegate = ItemCardDelegate(self.can_claim_item, self)
+        self.item_delegate.claim_clicked.connect(self.handle_claim_button_click)
+        self.items_view = QListView()
+        self.items_view.setModel(self.items_model)
+        self.items_view.setItemDelegate(self.item_delegate)
+        self.items_view.setUniformItemSizes(True)
+        self.items_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.items_view.verticalScrollBar().setSingleStep(20)
+        self.items_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.items_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.items_view.setFocusPolicy(Qt.NoFocus)
+        self.items_view.setStyleSheet("QListView { border: none; background-color: transparent; }")
+        self.items_view.verticalScrollBar().valueChanged.connect(self.schedule_lazy_image_load)
+        # Fetch the next page when nearing the bottom, or when a page does not fill the view
+        self.items_view.verticalScrollBar().valueChanged.connect(self.check_browse_scroll_position)
+        self.items_view.verticalScrollBar().rangeChanged.connect(self.check_browse_scroll_position)
+        view_layout.addWidget(self.items_view)
 
         self.stacked_widget.addWidget(view_items_widget)
 
@@ -1286,6 +3430,7 @@ class TawdrlikApp(QMainWindow):
         self.user_items_layout.setSpacing(15)
         self.user_items_layout.setContentsMargins(10, 10, 10, 10)
         items_scroll_area.setWidget(items_scroll_content)
+        items_scroll_area.verticalScrollBar().valueChanged.connect(self.schedule_lazy_image_load)
         my_items_layout.addWidget(items_scroll_area)
         splitter_layout.addWidget(my_items_group)
 
@@ -1300,31 +3445,25 @@ class TawdrlikApp(QMainWindow):
         # Claims on My Items (for Owners)
         claims_on_my_items_group = QGroupBox("Claims Received on My Items")
         claims_on_my_items_layout_outer = QVBoxLayout(claims_on_my_items_group)
-        claims_on_items_scroll = QScrollArea()
-        claims_on_items_scroll.setWidgetResizable(True)
-        claims_on_items_scroll.setStyleSheet("border: 1px solid #e0e0e0; border-radius: 5px; background-color: #f8f8f8;") 
-        claims_on_items_content = QWidget()
-        self.claims_on_my_items_layout = QVBoxLayout(claims_on_items_content) 
-        self.claims_on_my_items_layout.setAlignment(Qt.AlignTop)
-        self.claims_on_my_items_layout.setSpacing(10)
-        self.claims_on_my_items_layout.setContentsMargins(8, 8, 8, 8)
-        claims_on_items_scroll.setWidget(claims_on_items_content)
-        claims_on_my_items_layout_outer.addWidget(claims_on_items_scroll)
+        self.claims_on_my_items_status_label = self.create_claim_status_label()
+        claims_on_my_items_layout_outer.addWidget(self.claims_on_my_items_status_label)
+        self.claims_on_my_items_model = ClaimListModel(self)
+        self.claims_on_my_items_delegate = ClaimCardDelegate('owner_view', self)
+        self.claims_on_my_items_delegate.accept_clicked.connect(self.handle_accept_claim)
+        self.claims_on_my_items_delegate.reject_clicked.connect(self.handle_reject_claim)
+        self.claims_on_my_items_view = self.create_claim_list_view(self.claims_on_my_items_model, self.claims_on_my_items_delegate)
+        claims_on_my_items_layout_outer.addWidget(self.claims_on_my_items_view)
         claims_management_layout.addWidget(claims_on_my_items_group, 1) 
 
         # My Submitted Claims (for Claimants)
         my_submitted_claims_group = QGroupBox("My Submitted Claims")
         my_submitted_claims_layout_outer = QVBoxLayout(my_submitted_claims_group)
-        my_claims_scroll = QScrollArea()
-        my_claims_scroll.setWidgetResizable(True)
-        my_claims_scroll.setStyleSheet("border: 1px solid #e0e0e0; border-radius: 5px; background-color: #f8f8f8;")
-        my_claims_content = QWidget()
-        self.my_claims_layout = QVBoxLayout(my_claims_content) 
-        self.my_claims_layout.setAlignment(Qt.AlignTop)
-        self.my_claims_layout.setSpacing(10)
-        self.my_claims_layout.setContentsMargins(8, 8, 8, 8)
-        my_claims_scroll.setWidget(my_claims_content)
-        my_submitted_claims_layout_outer.addWidget(my_claims_scroll)
+        self.my_claims_status_label = self.create_claim_status_label()
+        my_submitted_claims_layout_outer.addWidget(self.my_claims_status_label)
+        self.my_claims_model = ClaimListModel(self)
+        self.my_claims_delegate = ClaimCardDelegate('claimant_view', self)
+        self.my_claims_view = self.create_claim_list_view(self.my_claims_model, self.my_claims_delegate)
+        my_submitted_claims_layout_outer.addWidget(self.my_claims_view)
         claims_management_layout.addWidget(my_submitted_claims_group, 1)
 
         splitter_layout.addWidget(claims_management_group)
@@ -1332,6 +3471,28 @@ class TawdrlikApp(QMainWindow):
 
         self.stacked_widget.addWidget(profile_widget)
 
+    def create_claim_list_view(self, model, delegate):
+        """A claim list whose delegate paints only the visible claim cards."""
+        view = QListView()
+        view.setModel(model)
+        view.setItemDelegate(delegate)
+        view.setResizeMode(QListView.Adjust) # Card heights depend on the width their reason wraps to
+        view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        view.verticalScrollBar().setSingleStep(20)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view.setSelectionMode(QAbstractItemView.NoSelection)
+        view.setFocusPolicy(Qt.NoFocus)
+        view.setStyleSheet("QListView { border: 1px solid #e0e0e0; border-radius: 5px; background-color: #f8f8f8; padding: 8px; }")
+        view.verticalScrollBar().valueChanged.connect(self.schedule_lazy_image_load)
+        return view
+
+    def create_claim_status_label(self):
+        """Loading / empty state message shown above a claim list."""
+        status_label = QLabel()
+        status_label.setAlignment(Qt.AlignCenter)
+        status_label.hide()
+        return status_label
+
 
     # --- Event Handling Methods ---
     def handle_login(self):
@@ -1417,8 +3578,8 @@ class TawdrlikApp(QMainWindow):
             self.image_preview_label.clear(); self.selected_image_path = None
             self.profile_username_label.setText("Username: "); self.profile_email_label.setText("Email: ")
             self.clear_layout(self.user_items_layout)
-            self.clear_layout(self.claims_on_my_items_layout)
-            self.clear_layout(self.my_claims_layout)
+            self.claims_on_my_items_model.clear()
+            self.my_claims_model.clear()
             self.show_flash_message(f"{logged_out_user} logged out successfully.")
 
 
@@ -1470,24 +3631,33 @@ class TawdrlikApp(QMainWindow):
             QMessageBox.warning(self, "Submission Error", "Please select an image for the item.")
             return
 
-        image_data = None
         try:
-            with open(self.selected_image_path, 'rb') as f:
-                image_data = f.read()
-            if len(image_data) > 16 * 1024 * 1024:
-                 QMessageBox.warning(self, "Image Error", "Selected image is too large (max 16MB).")
+            size_limit = image_size_limit()
+            if size_limit and os.path.getsize(self.selected_image_path) > size_limit:
+                 QMessageBox.warning(self, "Image Error", f"Selected image is too large (max {size_limit // (1024 * 1024)}MB).")
                  return
         except Exception as e:
             QMessageBox.warning(self, "Image Error", f"Could not read image file: {e}")
             return 
 
+        # Re-posts and double submissions: confirm before saving a near copy of an open post
+        duplicates = find_duplicate_posts(self.current_user['id'], category, title, description)
+        if duplicates:
+            reply = QMessageBox.question(self, "Possible Duplicate",
+                                         f"This looks like an item you already posted: \"{duplicates[0][2]}\".\n"
+                                         "Post it anyway?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+
+        # The image is read (or streamed to GridFS) straight from disk by save_item
         success, message = save_item(
             self.current_user['id'], title, category, location, date,
-            self.current_item_status, description, image_data
+            self.current_item_status, description, image_path=self.selected_image_path
         )
 
         if success:
-            self.show_flash_message(message)
+            self.show_flash_message(message, duration=8000) # Long enough to read the suggested matches
             self.show_view_items_page() 
         else:
             QMessageBox.critical(self, "Error Saving Item", message)
@@ -1515,12 +3685,15 @@ class TawdrlikApp(QMainWindow):
         self.location_filter.addItems(get_unique_locations())
         loc_index = self.location_filter.findText(current_loc)
         self.location_filter.setCurrentIndex(loc_index if loc_index != -1 else 0)
+        if loc_index == -1 and current_loc:
+            self.location_filter.setEditText(current_loc)
 
         self.stacked_widget.setCurrentIndex(4) 
         self.load_all_items(
              self.category_filter.currentText(),
              self.location_filter.currentText(),
-             include_recovered=False 
+             include_recovered=False,
+             search_text=self.search_input.text()
         ) 
 
 
@@ -1530,7 +3703,8 @@ class TawdrlikApp(QMainWindow):
         self.load_all_items(
             self.category_filter.currentText(),
             self.location_filter.currentText(),
-            include_recovered=False 
+            include_recovered=False,
+            search_text=self.search_input.text()
         )
 
     def reset_item_filters(self):
@@ -1538,30 +3712,126 @@ class TawdrlikApp(QMainWindow):
         if not self.current_user: return
         self.category_filter.setCurrentIndex(0)
         self.location_filter.setCurrentIndex(0)
+        self.search_input.clear()
         self.load_all_items(include_recovered=False) 
 
+    def handle_save_search(self):
+        """Save the current category, location, keywords and lost/found choice as a search to be alerted about"""
+        if not self.current_user: return
+        category = self.category_filter.currentText()
+        location = self.location_filter.currentText().strip()
+        keywords = self.search_input.text().strip()
+        category = category if category != "All Categories" else None
+        location = location if location and location != "All Locations" else None
+        if not category and not location and not get_search_words(keywords):
+            QMessageBox.warning(self, "Save Search", "Choose a category, a location or keywords to save.")
+            return
+        success, message = save_search(self.current_user['id'], category, location, keywords or None,
+                                       status=self.alert_status_filter.currentData())
+        self.show_flash_message(message, is_error=not success)
+
 
-    def load_all_items(self, filter_category=None, filter_location=None, include_recovered=False):
-        """Load and display items with optional filtering and recovery status"""
+    def load_all_items(self, filter_category=None, filter_location=None, include_recovered=False, search_text=None):
+        """Load and display the first page of items with optional filtering and recovery status.
+           Further pages are appended by load_next_browse_page as the user scrolls.
+           With search_text, the items matching its keywords are listed by relevance instead.
+        """
         if not self.databases_connected: return 
-        self.clear_layout(self.items_list_layout) 
+        self.cancel_browse_loading()
+        self.items_model.clear()
+        self.browse_filters = (filter_category, filter_location, include_recovered, search_text if get_search_words(search_text) else None)
+        self.browse_next_key = None
+        self.browse_exhausted = False
 
-        loading_label = QLabel("Loading items...") 
-        loading_label.setAlignment(Qt.AlignCenter); loading_label.setStyleSheet("color: #888; margin: 30px 0;")
-        self.items_list_layout.addWidget(loading_label)
-        QApplication.processEvents()
+        self.items_status_label.setText("Loading items...")
+        self.items_status_label.show()
+
+        self.load_next_browse_page(first_page=True)
 
-        items = get_all_items(filter_category, filter_location, include_recovered)
-        self.clear_layout(self.items_list_layout) 
+    def load_next_browse_page(self, first_page=False):
+        """Start fetching the page following the last displayed item; its cards are appended
+           by handle_browse_page_loaded once the worker thread delivers it.
+        """
+        if self.browse_loading or self.browse_exhausted: return
+        # Connect here, on the GUI thread, since a failed connection shows a dialog
+        if not connect_to_mysql() or not connect_to_mongodb():
+            self.browse_exhausted = True # Don't retry (and re-show the dialog) on every scroll
+            if first_page:
+                self.items_status_label.setText("Could not connect to the database.")
+                self.items_status_label.show()
+            return
+        self.browse_loading = True
+        self.browse_loader.request_page(self.browse_filters, self.browse_next_key, first_page)
+
+    def handle_browse_page_loaded(self, generation, items, first_page):
+        """Append a page delivered by the browse worker, unless its load was cancelled meanwhile."""
+        if generation != self.browse_loader.generation: return # Stale: filters changed or the page was left
+        self.browse_loading = False
+
+        if first_page:
+            self.items_status_label.hide()
+        if len(items) < BROWSE_PAGE_SIZE:
+            self.browse_exhausted = True
         if not items:
-            no_items_label = QLabel("No items found matching your criteria.")
-            no_items_label.setAlignment(Qt.AlignCenter); no_items_label.setStyleSheet("color: #666; margin: 30px 0;")
-            self.items_list_layout.addWidget(no_items_label)
+            if first_page:
+                self.items_status_label.setText("No items found matching your criteria.")
+                self.items_status_label.show()
             return
 
-        for item in items:
-            item_widget = self.create_item_widget(item, context='view_all')
-            self.items_list_layout.addWidget(item_widget)
+        if self.browse_filters[3]:
+            self.browse_next_key = (self.browse_next_key or 0) + len(items) # Search results page by offset
+        else:
+            self.browse_next_key = browse_page_key(items[-1])
+        self.items_model.append_items(items)
+        self.schedule_lazy_image_load()
+
+    def handle_browse_page_failed(self, generation, message, first_page):
+        """Report a browse page load that raised on the worker thread. The list is not marked exhausted,
+           so scrolling again retries the page.
+        """
+        if generation != self.browse_loader.generation: return
+        self.browse_loading = False
+        if first_page:
+            self.items_status_label.setText("Failed to load items.")
+            self.items_status_label.show()
+        self.show_flash_message(f"Failed to load items: {message}", is_error=True)
+
+    def cancel_browse_loading(self):
+        """Cancel the browse page load in flight; its results will be dropped when they arrive."""
+        if self.browse_loading:
+            self.browse_loader.cancel()
+            self.browse_loading = False
+
+    def handle_page_changed(self, index):
+        """Leaving the browse page abandons its pending load; showing it again starts a fresh one."""
+        if index != 4:
+            self.cancel_browse_loading()
+        if index == 2 and self.current_user:
+            self.show_search_alerts()
+
+    def show_search_alerts(self):
+        """Tell the user about items posted since their last visit that match their saved searches"""
+        alerts = get_search_alerts(self.current_user['id'])
+        if not alerts: return
+        lines = [f"• {alert['title']} ({alert['status']}, {alert['location']})" for alert in alerts[:SEARCH_ALERTS_SHOWN]]
+        if len(alerts) > SEARCH_ALERTS_SHOWN:
+            lines.append(f"...and {len(alerts) - SEARCH_ALERTS_SHOWN} more")
+        mark_search_alerts_seen(self.current_user['id'], [alert['alert_id'] for alert in alerts])
+        QMessageBox.information(self, "Saved Search Alerts",
+                                "New items match your saved searches:\n\n" + "\n".join(lines))
+
+    def check_browse_scroll_position(self, *args):
+        """Load the next browse page once the scroll position gets close to the bottom."""
+        if self.browse_exhausted or self.stacked_widget.currentIndex() != 4: return
+        scroll_bar = self.items_view.verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.value() <= BROWSE_PREFETCH_MARGIN_PX:
+            self.load_next_browse_page()
+
+    def can_claim_item(self, item_data):
+        """Whether the logged-in user may claim an item shown on the browse page."""
+        return (self.current_user is not None and
+                item_data.get('status') in ['found', 'lost'] and
+                item_data.get('user_id') != self.current_user['id'])
 
 
     def show_profile_page(self):
@@ -1608,54 +3878,41 @@ class TawdrlikApp(QMainWindow):
     def load_claims_on_my_items(self):
         """Load claims made by others on items owned by the current user."""
         if not self.current_user or not self.databases_connected: return
-        self.clear_layout(self.claims_on_my_items_layout)
+        self.claims_on_my_items_model.clear()
 
-        loading_label = QLabel("Loading received claims..."); loading_label.setAlignment(Qt.AlignCenter); loading_label.setStyleSheet("color: #888; margin: 15px 0;")
-        self.claims_on_my_items_layout.addWidget(loading_label)
+        self.claims_on_my_items_status_label.setText("Loading received claims..."); self.claims_on_my_items_status_label.setStyleSheet("color: #888; margin: 15px 0;")
+        self.claims_on_my_items_status_label.show()
         QApplication.processEvents()
 
-        my_items = get_user_items(self.current_user['id'])
-        all_claims_on_my_items = []
-        for item in my_items:
-            if item.get('status') != 'recovered':
-                claims_for_this_item = get_claims_for_item(item['id'])
-                for claim in claims_for_this_item:
-                    claim['item_title'] = item['title']
-                    all_claims_on_my_items.append(claim)
+        all_claims_on_my_items = get_claims_on_user_items(self.current_user['id'])
 
-        all_claims_on_my_items.sort(key=lambda x: x['claim_created_at'], reverse=True)
-
-        self.clear_layout(self.claims_on_my_items_layout) 
         if not all_claims_on_my_items:
-            no_claims_label = QLabel("No pending claims on your items."); no_claims_label.setAlignment(Qt.AlignCenter); no_claims_label.setStyleSheet("color: #666; margin: 15px 0;")
-            self.claims_on_my_items_layout.addWidget(no_claims_label)
+            self.claims_on_my_items_status_label.setText("No pending claims on your items."); self.claims_on_my_items_status_label.setStyleSheet("color: #666; margin: 15px 0;")
             return
 
-        for claim in all_claims_on_my_items:
-            claim_widget = self.create_claim_widget(claim, context='owner_view')
-            self.claims_on_my_items_layout.addWidget(claim_widget)
+        self.claims_on_my_items_status_label.hide()
+        self.claims_on_my_items_model.append_items(all_claims_on_my_items)
+        self.schedule_lazy_image_load()
 
 
     def load_my_submitted_claims(self):
         """Load claims submitted by the current user."""
         if not self.current_user or not self.databases_connected: return
-        self.clear_layout(self.my_claims_layout)
+        self.my_claims_model.clear()
 
-        loading_label = QLabel("Loading your submitted claims..."); loading_label.setAlignment(Qt.AlignCenter); loading_label.setStyleSheet("color: #888; margin: 15px 0;")
-        self.my_claims_layout.addWidget(loading_label)
+        self.my_claims_status_label.setText("Loading your submitted claims..."); self.my_claims_status_label.setStyleSheet("color: #888; margin: 15px 0;")
+        self.my_claims_status_label.show()
         QApplication.processEvents()
 
         my_claims = get_claims_by_claimant(self.current_user['id'])
-        self.clear_layout(self.my_claims_layout)
 
         if not my_claims:
-            no_claims_label = QLabel("You haven't submitted any claims yet."); no_claims_label.setAlignment(Qt.AlignCenter); no_claims_label.setStyleSheet("color: #666; margin: 15px 0;")
-            self.my_claims_layout.addWidget(no_claims_label)
+            self.my_claims_status_label.setText("You haven't submitted any claims yet."); self.my_claims_status_label.setStyleSheet("color: #666; margin: 15px 0;")
             return
 
-        for claim in my_claims:
-            claim_widget = self.create_claim_widget(claim, context='claimant_view')
-            self.my_claims_layout.addWidget(claim_widget)
+        self.my_claims_status_label.hide()
+        self.my_claims_model.append_items(my_claims)
+        self.schedule_lazy_image_load()
 
 
     def create_item_widget(self, item_data, context='view_all'):
@@ -1678,11 +3935,10 @@ class TawdrlikApp(QMainWindow):
         image_label.setAlignment(Qt.AlignCenter)
         image_label.setStyleSheet("background-color: #f0f0f0; border-radius: 5px; border: 1px solid #ddd;")
 
-        pixmap = self.load_pixmap_from_data(item_data.get('image_data'))
-        if pixmap:
-            scaled_pixmap = pixmap.scaled(image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            image_label.setPixmap(scaled_pixmap)
-            image_label.setToolTip("Item Image")
+        if item_data.get('mongo_id'):
+            image_label.setText("Loading...")
+            self.register_lazy_image(image_label, get_item_thumbnails, item_data['mongo_id'],
+                                     "Item Image", "No Image", "No image provided")
         else:
             image_label.setText("No Image")
             image_label.setToolTip("No image provided")
@@ -1778,114 +4034,6 @@ class TawdrlikApp(QMainWindow):
         return item_widget
 
 
-    def create_claim_widget(self, claim_data, context='owner_view'):
-        """Creates a widget for displaying a claim.
-           Context: 'owner_view' or 'claimant_view'.
-           Includes claim details, evidence preview, and context-specific buttons.
-           Expects claim_data dictionary.
-        """
-        claim_widget = QWidget()
-        base_style = "border-radius: 6px; border: 1px solid #ccc; padding: 10px;"
-        claim_status = claim_data.get('claim_status', 'pending')
-        bg_color = "#ffffff" 
-        if claim_status == 'accepted': bg_color = "#e8f5e9" 
-        elif claim_status == 'rejected': bg_color = "#ffebee" 
-
-        claim_widget.setStyleSheet(f"background-color: {bg_color}; {base_style}")
-
-        main_layout = QVBoxLayout(claim_widget)
-        main_layout.setSpacing(8)
-
-        top_line_layout = QHBoxLayout()
-        top_line_layout.setContentsMargins(0,0,0,0)
-
-        info_label = QLabel()
-        info_label.setStyleSheet("font-size: 13px;")
-        info_label.setWordWrap(True)
-        if context == 'claimant_view':
-             item_title = claim_data.get('item_title', 'Unknown Item')
-             item_status_for_claim = claim_data.get('item_status', '?')
-             info_label.setText(f"Your claim on: <b>{item_title}</b> (Item Status: {item_status_for_claim.upper()})")
-             info_label.setToolTip(f"Claim on item ID: {claim_data.get('item_id')}")
-        else: # owner_view
-             claimant_name = claim_data.get('claimant_username', 'Unknown User')
-             item_title_for_owner = claim_data.get('item_title', 'Your Item') 
-             info_label.setText(f"Claim by <b>{claimant_name}</b> on: <i>{item_title_for_owner}</i>")
-             info_label.setToolTip(f"Claim ID: {claim_data.get('claim_id')}, Claimant ID: {claim_data.get('claimant_id')}")
-
-
-        status_label = QLabel(claim_status.upper())
-        status_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        status_label.setFont(QFont(FONT_FAMILY, 9, QFont.Bold))
-        status_style = "color: white; padding: 3px 6px; border-radius: 4px; font-weight: bold;"
-        if claim_status == 'pending': status_label.setStyleSheet(f"background-color: #ffc107; {status_style}") 
-        elif claim_status == 'accepted': status_label.setStyleSheet(f"background-color: #4caf50; {status_style}") 
-        elif claim_status == 'rejected': status_label.setStyleSheet(f"background-color: #f44336; {status_style}") 
-        else: status_label.setStyleSheet(f"background-color: #bdbdbd; {status_style}")
-
-        top_line_layout.addWidget(info_label, 1) 
-        top_line_layout.addWidget(status_label)
-        main_layout.addLayout(top_line_layout)
-
-        # Claim Reason
-        reason_label = QLabel(f"<b>Reason:</b> {claim_data.get('reason', 'No reason provided.')}")
-        reason_label.setStyleSheet("font-size: 12px; color: #333;")
-        reason_label.setWordWrap(True)
-        main_layout.addWidget(reason_label)
-
-        # Claim Date
-        created_at_raw = claim_data.get('claim_created_at', '')
-        created_at_str = str(created_at_raw).split('.')[0] if created_at_raw else 'Unknown Date' 
-        date_label = QLabel(f"<i>Submitted: {created_at_str}</i>")
-        date_label.setStyleSheet("font-size: 11px; color: #666;")
-        main_layout.addWidget(date_label)
-
-
-        bottom_layout = QHBoxLayout()
-        bottom_layout.setContentsMargins(0, 5, 0, 0)
-
-        evidence_data = claim_data.get('evidence_image_data')
-        if evidence_data:
-             evidence_img_label = QLabel()
-             evidence_img_size = 60
-             evidence_img_label.setFixedSize(evidence_img_size, evidence_img_size)
-             evidence_img_label.setAlignment(Qt.AlignCenter)
-             evidence_img_label.setStyleSheet("background-color: #e0e0e0; border-radius: 4px; border: 1px solid #bbb;")
-             pixmap = self.load_pixmap_from_data(evidence_data)
-             if pixmap:
-                  scaled_pixmap = pixmap.scaled(evidence_img_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                  evidence_img_label.setPixmap(scaled_pixmap)
-                  evidence_img_label.setToolTip("Evidence Image Provided")
-             else:
-                  evidence_img_label.setText("Invalid\nEvidence")
-                  evidence_img_label.setToolTip("Could not load evidence image")
-             bottom_layout.addWidget(evidence_img_label) 
-             
-             no_evidence_label = QLabel("<i>No evidence provided</i>")
-             no_evidence_label.setStyleSheet("font-size: 11px; color: #888;")
-             bottom_layout.addWidget(no_evidence_label)
-
-
-        bottom_layout.addStretch() 
-
-        if context == 'owner_view' and claim_status == 'pending':
-            accept_button = QPushButton(QIcon.fromTheme("dialog-ok-apply"), " Accept")
-            accept_button.setStyleSheet("background-color: #4caf50; color: white; padding: 5px 10px; border-radius: 4px; font-size: 11px; border: none;")
-            accept_button.setCursor(Qt.PointingHandCursor)
-            accept_button.clicked.connect(lambda checked, cid=claim_data['claim_id'], iid=claim_data['item_id']: self.handle_accept_claim(cid, iid))
-            bottom_layout.addWidget(accept_button)
-
-            reject_button = QPushButton(QIcon.fromTheme("dialog-cancel"), " Reject")
-            reject_button.setStyleSheet("background-color: #f44336; color: white; padding: 5px 10px; border-radius: 4px; font-size: 11px; border: none;")
-            reject_button.setCursor(Qt.PointingHandCursor)
-            reject_button.clicked.connect(lambda checked, cid=claim_data['claim_id']: self.handle_reject_claim(cid))
-            bottom_layout.addWidget(reject_button)
-
-        main_layout.addLayout(bottom_layout)
-
-        return claim_widget
-
-
     def handle_claim_button_click(self, item_id):
         """Opens the claim dialog when 'Claim This Item' is clicked."""
         if not self.current_user:
@@ -1899,8 +4047,8 @@ class TawdrlikApp(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             claim_data = dialog.get_claim_data()
             if claim_data:
-                reason, evidence_data = claim_data
-                success, message = submit_claim(item_id, self.current_user['id'], reason, evidence_data)
+                reason, evidence_path = claim_data
+                success, message = submit_claim(item_id, self.current_user['id'], reason, evidence_image_path=evidence_path)
                 if success:
                     self.show_flash_message(message)
                     if self.stacked_widget.currentIndex() == 5: 
@@ -1950,11 +4098,123 @@ class TawdrlikApp(QMainWindow):
                   self.show_flash_message(f"Failed to reject claim: {message}", is_error=True)
 
 
-    def load_pixmap_from_data(self, image_data):
-        """Safely load a QPixmap from binary data."""
+    def register_lazy_image(self, label, fetch_images, mongo_id, tooltip, missing_text, missing_tooltip):
+        """Queue an image label to be filled once it is actually visible on screen.
+           fetch_images takes a list of mongo ids and a thumbnail scale and returns a dict of id -> image bytes.
+        """
+        self.pending_lazy_images.append({
+            'label': label, 'fetch_images': fetch_images, 'mongo_id': mongo_id, 'tooltip': tooltip,
+            'missing_text': missing_text, 'missing_tooltip': missing_tooltip
+        })
+        self.schedule_lazy_image_load()
+
+    def schedule_lazy_image_load(self, *args):
+        """Coalesce scroll/page/resize events into a single visibility check."""
+        if not self.lazy_image_timer.isActive():
+            self.lazy_image_timer.start(LAZY_IMAGE_DELAY_MS)
+
+    def load_visible_images(self):
+        """Fetch and display images for queued labels that are currently on screen.
+           Images of the same kind are fetched together in one batched query.
+        """
+        visible_by_fetcher = {}
+        still_pending = []
+        for entry in self.pending_lazy_images:
+            label = entry['label']
+            try:
+                on_screen = label.isVisible() and not label.visibleRegion().isEmpty()
+            except RuntimeError:
+                continue # The card was deleted before it was ever shown
+            if on_screen:
+                group = (entry['fetch_images'], label.width(), label.height())
+                visible_by_fetcher.setdefault(group, []).append(entry)
+            else:
+                still_pending.append(entry)
+        self.pending_lazy_images = still_pending
+
+        # Use the 2x thumbnails on HiDPI screens so previews stay sharp
+        pixel_ratio = self.devicePixelRatioF()
+        scale = "2x" if pixel_ratio > 1 else "1x"
+        for (fetch_images, width, height), entries in visible_by_fetcher.items():
+            pixmaps = self.load_cached_pixmaps([entry['mongo_id'] for entry in entries], fetch_images,
+                                               QSize(width, height), scale, pixel_ratio)
+            for entry in entries:
+                label = entry['label']
+                pixmap = pixmaps.get(entry['mongo_id'])
+                try:
+                    if pixmap:
+                        label.setPixmap(pixmap)
+                        label.setToolTip(entry['tooltip'])
+                    else:
+                        label.setText(entry['missing_text'])
+                        label.setToolTip(entry['missing_tooltip'])
+                except RuntimeError:
+                    pass # The card was deleted while its image was loading
+
+        current_page = self.stacked_widget.currentIndex()
+        if current_page == 4:
+            self.load_visible_list_images(self.items_view, get_item_thumbnails, ItemCardDelegate.IMAGE_SIZE, scale, pixel_ratio)
+        elif current_page == 5:
+            for claims_view in (self.claims_on_my_items_view, self.my_claims_view):
+                self.load_visible_list_images(claims_view, get_claim_evidence_thumbnails, ClaimCardDelegate.EVIDENCE_SIZE, scale, pixel_ratio)
+
+    def load_visible_list_images(self, view, fetch_images, size, scale, pixel_ratio):
+        """Fetch thumbnails for the rows of a card list currently in its viewport, in one batched query."""
+        model = view.model()
+        if not view.isVisible() or not model.rowCount():
+            return
+        viewport = view.viewport().rect()
+        first_index = view.indexAt(viewport.topLeft())
+        if not first_index.isValid():
+            return
+        last_index = view.indexAt(viewport.bottomLeft())
+        last_row = last_index.row() if last_index.isValid() else model.rowCount() - 1
+        mongo_ids = model.pending_image_ids(first_index.row(), last_row)
+        if not mongo_ids:
+            return
+
+        model.set_images(self.load_cached_pixmaps(mongo_ids, fetch_images, QSize(size, size), scale, pixel_ratio))
+
+    def load_cached_pixmaps(self, mongo_ids, fetch_images, size, scale, pixel_ratio):
+        """Display-ready pixmaps for mongo_ids at size (logical pixels), None where no usable image exists.
+           Served from pixmap_cache where possible; only the misses are fetched, in one batched query.
+        """
+        target_size = size * pixel_ratio
+        pixmaps = {}
+        missing_ids = []
+        for mongo_id in mongo_ids:
+            pixmap = pixmap_cache.get(mongo_id, target_size)
+            if pixmap is None:
+                missing_ids.append(mongo_id)
+            else:
+                pixmaps[mongo_id] = pixmap
+        if not missing_ids:
+            return pixmaps
+
+        images = fetch_images(missing_ids, scale)
+        for mongo_id in missing_ids:
+            pixmap = self.load_pixmap_from_data(images.get(mongo_id), target_size)
+            if pixmap:
+                pixmap.setDevicePixelRatio(pixel_ratio)
+                pixmap_cache.put(mongo_id, target_size, pixmap)
+            pixmaps[mongo_id] = pixmap
+        return pixmaps
+
+    def resizeEvent(self, event):
+        """Growing the window can reveal cards whose images are not loaded yet."""
+        super().resizeEvent(event)
+        self.schedule_lazy_image_load()
+
+    def load_pixmap_from_data(self, image_data, size=None):
+        """Safely load a QPixmap from binary data.
+           With size (device pixels), the image is decoded straight to a size fitting in it.
+        """
         if not image_data:
             return None
         try:
+            if size is not None:
+                image = decode_image_scaled(image_data, size)
+                return QPixmap.fromImage(image) if not image.isNull() else None
             pixmap = QPixmap()
             buffer = QBuffer()
             buffer.setData(bytes(image_data)) 
@@ -1991,10 +4251,13 @@ def main():
     window.show()
     
     def cleanup():
-        global mysql_connection, mongo_client
-        if mysql_connection and mysql_connection.is_connected():
+        global mongo_client
+        stats = pixmap_cache.stats()
+        print(f"Pixmap cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+              f"{stats['evictions']} evictions, {stats['bytes'] // 1024} KB in {stats['entries']} entries.")
+        if mysql_pool is not None:
             try:
-                mysql_connection.close()
+                close_mysql_pool()
                 print("MySQL connection closed.")
             except Exception as e:
                  print(f"Error closing MySQL connection: {e}")
@@ -2004,6 +4267,10 @@ def main():
                 print("MongoDB connection closed.")
             except Exception as e:
                  print(f"Error closing MongoDB connection: {e}")
+        try:
+            close_thumbnail_disk_cache()
+        except OSError as e:
+            print(f"Error closing thumbnail disk cache: {e}")
 
     app.aboutToQuit.connect(cleanup)
     sys.exit(app.exec_())
@@ -1,10 +1,23 @@
 # -*- coding: utf-8 -*-  
 import sys
+import os
 import re
+import unicodedata
 import datetime
+import time
 import hashlib
+import threading
+import queue
+import json
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
 import mysql.connector
-from pymongo import MongoClient
+import numpy as np
+from pymongo import MongoClient, ReturnDocument, monitoring
+from pymongo.errors import DuplicateKeyError
+import gridfs
 from bson.objectid import ObjectId
 from bson.binary import Binary 
 import base64 
@@ -15,15 +28,19 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QLineEd
                             QStackedWidget, QComboBox, QDateEdit, QTextEdit,
                             QListWidget, QListWidgetItem, QMessageBox, QGroupBox,
                             QScrollArea, QSizePolicy, QSpacerItem, QFileDialog,
-                            QDialog, QDialogButtonBox)
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap
-from PyQt5.QtCore import Qt, QDate, QBuffer, QIODevice, QTimer, QSize 
+                            QDialog, QDialogButtonBox, QListView, QAbstractItemView,
+                            QStyledItemDelegate)
+from PyQt5.QtGui import (QFont, QFontMetrics, QColor, QPalette, QIcon, QPixmap, QImage, QImageReader, QPainter,
+                         QTextLayout)
+from PyQt5.QtCore import (Qt, QDate, QBuffer, QByteArray, QIODevice, QTimer, QSize, QRect, QRectF,
+                          QPoint, QEvent, QModelIndex, QAbstractListModel, QObject, pyqtSignal)
 
 
 # Variables globales pour les connexions aux bases de données
-mysql_connection = None
-mongo_client = None
+mysql_pool = None
 mongo_db = None
+mongo_last_ok = 0.0 # time.monotonic() de la dernière commande MongoDB réussie
+thumbnail_disk_cache = None # ThumbnailDiskCache, ou False s'il s'est révélé inutilisable
 
 # Configuration de la base de données
 MYSQL_CONFIG = {
@@ -33,8 +50,99 @@ MYSQL_CONFIG = {
     'database': 'tawdrlikDB'
 }
 
+# Pool de connexions MySQL : chaque fonction de données emprunte sa propre connexion et la rend à la fin,
+# ce qui permet aux chargements en arrière-plan et aux écritures de s'exécuter dans des threads parallèles
+MYSQL_POOL_SIZE = 5
+MYSQL_POOL_TIMEOUT = 10 # Secondes d'attente maximale d'une connexion libre
+
+# Santé des connexions : l'état est déduit du résultat des vraies requêtes. Une connexion n'est
+# pingée que si elle est restée inactive plus longtemps que ce délai, ou après l'échec d'une requête.
+HEALTH_CHECK_IDLE_SECONDS = 30
+MYSQL_RECONNECT_ATTEMPTS = 2
+
 MONGODB_URI = "mongodb://localhost:27017/"
 MONGODB_DB = "tawdrlikDB"
+MONGO_IN_BATCH_SIZE = 500 # Nombre max d'ObjectId par requête $in lors de la résolution groupée des détails
+
+# Page de consultation : les objets sont récupérés par pages, en se positionnant après la dernière ligne affichée
+# (sans parcours OFFSET), et la page suivante est demandée quand l'utilisateur arrive à ce nombre de pixels du bas
+BROWSE_PAGE_SIZE = 50
+BROWSE_PREFETCH_MARGIN_PX = 600
+ITEM_STATUS_ORDER = ('lost', 'found', 'recovered') # Ordre de l'ENUM, suivi par ORDER BY o.statut_objet
+
+# La recherche par mots-clés utilise l'index FULLTEXT(titre, description_meta) : chaque mot doit correspondre,
+# comme préfixe, et les résultats arrivent du plus pertinent au moins pertinent. Les mots plus courts que
+# innodb_ft_min_token_size ne sont pas indexés par InnoDB.
+SEARCH_MIN_WORD_LENGTH = 3
+# Tolérance aux fautes : un mot cherché qu'aucun titre ne contient est élargi aux mots de titres dont la similarité
+# en trigrammes atteint FUZZY_MIN_SIMILARITY (au plus FUZZY_MAX_ALTERNATIVES) ; un lieu saisi qui ne correspond à
+# aucun lieu connu est élargi de la même façon aux lieux connus les plus proches. Les accents sont ignorés.
+FUZZY_MIN_SIMILARITY = 0.4
+FUZZY_MAX_ALTERNATIVES = 5
+
+# Rapprochement perdu/trouvé : un nouvel objet perdu (trouvé) est comparé aux objets trouvés (perdus) ouverts de la
+# même catégorie datés à moins de MATCH_DATE_WINDOW_DAYS jours, plage que l'index de consultation par catégorie
+# sert directement. Le score pondère la similarité cosinus TF-IDF titre + description, la proximité du lieu et de la date.
+MATCH_DATE_WINDOW_DAYS = 30
+MATCH_MAX_CANDIDATES = 5000
+MATCH_WEIGHTS = {'text': 0.6, 'location': 0.25, 'date': 0.15}
+MATCH_MIN_SCORE = 0.35
+MATCH_MAX_RESULTS = 3
+
+# Photos ressemblantes : chaque photo d'objet reçoit un hachage de différence de 64 bits (dHash) à la sauvegarde.
+# Les photos dont les hachages diffèrent d'au plus IMAGE_MATCH_MAX_DISTANCE bits sont considérées comme montrant le
+# même objet. Les recherches passent par un arbre BK, qui ne visite que les hachages pouvant être à cette distance.
+IMAGE_MATCH_MAX_DISTANCE = 10
+IMAGE_MATCH_MAX_RESULTS = 3
+
+# Annonces en double : titre + description sont réduits à une signature MinHash de leurs fragments de caractères,
+# découpée en bandes LSH. Une nouvelle annonce n'est comparée qu'aux annonces du même utilisateur dans la même
+# catégorie partageant une bande, et est signalée quand leur similarité de Jaccard estimée atteint DUPLICATE_MIN_SIMILARITY.
+DUPLICATE_SHINGLE_SIZE = 4
+DUPLICATE_MINHASH_PERMUTATIONS = 64
+DUPLICATE_LSH_BANDS = 16 # 4 lignes par bande : des annonces similaires à environ 50 % partagent déjà une bande
+DUPLICATE_MIN_SIMILARITY = 0.7
+
+# Recherches enregistrées : chacune est référencée dans un index inversé sous son terme le plus sélectif (son plus
+# long mot-clé, sinon son lieu, sa catégorie, son statut, ou un compartiment fourre-tout). Un nouvel objet n'est donc
+# comparé qu'aux recherches référencées sous ses propres mots, lieu, catégorie et statut. Avec un TTL (secondes),
+# l'index est rechargé pour voir les recherches enregistrées par d'autres instances de l'application.
+SAVED_SEARCH_INDEX_TTL_SECONDS = None
+SEARCH_ALERTS_SHOWN = 10 # Alertes nommées dans la notification ; les autres sont comptées
+
+# Les catégories et lieux distincts des filtres de consultation sont chargés une fois, puis tenus à jour par
+# save_item. Quand plusieurs instances de l'application écrivent dans la même base, définir un TTL (secondes)
+# pour que chacune récupère aussi les valeurs ajoutées par les autres.
+FACET_CACHE_TTL_SECONDS = None
+
+# Les listes ne chargent jamais les images ; les cartes les récupèrent une fois réellement affichées
+LAZY_IMAGE_DELAY_MS = 50
+
+# Les miniatures sont générées à l'envoi, en 1x et 2x (HiDPI) de la taille d'aperçu à l'écran
+ITEM_THUMBNAIL_SIZE = 100     # Image de la carte d'objet
+EVIDENCE_THUMBNAIL_SIZE = 60  # Aperçu de la preuve de réclamation
+THUMBNAIL_SCALES = (1, 2)
+THUMBNAIL_JPEG_QUALITY = 85
+# Les pixmaps décodés à la taille d'affichage sont gardés dans un cache LRU commun au processus, afin que
+# revenir sur une page ne décode et ne redimensionne pas à nouveau les mêmes images ; borné par leur taille décodée
+PIXMAP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Les octets de miniature récupérés depuis MongoDB sont aussi gardés sur disque d'une session à l'autre, dans un
+# fichier pack en ajout seul lu via mmap. Au-delà de la taille maximale, le pack est compacté en ne gardant que
+# les enregistrements les plus récemment utilisés. Mettre THUMBNAIL_DISK_CACHE_DIR à None pour le désactiver.
+THUMBNAIL_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".tawdrlik", "thumbnail_cache")
+THUMBNAIL_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+THUMBNAIL_DISK_CACHE_COMPACT_RATIO = 0.75 # Le compactage garde cette fraction du maximum, pour laisser de la marge
+THUMBNAIL_DISK_CACHE_MAX_ENTRY_BYTES = 1024 * 1024 # Les originaux plus gros (documents sans miniatures) ne sont pas mis en cache
+
+# Stockage des images : "embedded" garde les originaux en Binary dans items_detail/claims_detail
+# (limité par la taille de document BSON de 16 Mo), "gridfs" les écrit en flux dans un bucket GridFS.
+IMAGE_STORAGE = "embedded"
+MAX_EMBEDDED_IMAGE_SIZE = 16 * 1024 * 1024
+GRIDFS_BUCKET = "images"
+GRIDFS_CHUNK_SIZE = 255 * 1024
+# Les originaux sont stockés une seule fois par contenu distinct dans cette collection, indexés par leur
+# SHA-256 et comptés par références ; les documents d'objet et de réclamation ne gardent que l'empreinte.
+IMAGE_BLOBS_COLLECTION = "image_blobs"
 
 # Constantes de style de l'application
 PRIMARY_COLOR = "#3BAFDA"
@@ -45,28 +153,170 @@ FONT_FAMILY = "Arial"
 
 # --- Fonctions de connexion à la base de données ---
 
+class MySQLPool:
+    """Pool de taille fixe de connexions MySQL, ouvertes à la demande jusqu'à size.
+       Une connexion n'est pingée à l'emprunt que si elle est restée inactive au-delà de HEALTH_CHECK_IDLE_SECONDS
+       ou si sa dernière requête a échoué ; sinon emprunts et retours ne coûtent aucun aller-retour.
+    """
+    def __init__(self, size, config):
+        self._config = config
+        self._size = size
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._idle = queue.LifoQueue() # Dernière utilisée en premier, pour garder les connexions actives chaudes
+
+    def _open_connection(self):
+        with self._lock:
+            if self._opened >= self._size:
+                return None
+            self._opened += 1
+        try:
+            return mysql.connector.connect(**self._config)
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def checkout(self, timeout):
+        try:
+            raw, last_ok, healthy = self._idle.get_nowait()
+        except queue.Empty:
+            raw = self._open_connection()
+            if raw is not None:
+                return PooledMySQLConnection(self, raw)
+            try:
+                raw, last_ok, healthy = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise mysql.connector.errors.PoolError(f"Aucune connexion MySQL disponible après {timeout} s")
+        if not healthy or time.monotonic() - last_ok > HEALTH_CHECK_IDLE_SECONDS:
+            try:
+                raw.ping(reconnect=True, attempts=MYSQL_RECONNECT_ATTEMPTS, delay=1)
+            except Exception:
+                self._idle.put((raw, 0.0, False))
+                raise
+        return PooledMySQLConnection(self, raw)
+
+    def checkin(self, raw, healthy):
+        if healthy and raw.in_transaction:
+            # L'appelant n'a ni validé ni annulé
+            try:
+                raw.rollback()
+            except Exception:
+                healthy = False
+        self._idle.put((raw, time.monotonic(), healthy))
+
+    def close_all(self):
+        while True:
+            try:
+                raw, _, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+
+class PooledMySQLConnection:
+    """Connexion empruntée à un MySQLPool. close() la rend au pool."""
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        self.healthy = True
+
+    def cursor(self, **kwargs):
+        return HealthTrackingCursor(self, kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def close(self):
+        if self._raw is not None:
+            self._pool.checkin(self._raw, self.healthy)
+            self._raw = None
+
+
+class HealthTrackingCursor:
+    """Curseur qui enregistre le résultat des requêtes sur sa connexion. Une requête qui échoue parce que
+       la connexion est tombée est relancée une fois après reconnexion, sauf si une transaction était ouverte.
+    """
+    def __init__(self, connection, kwargs):
+        self._connection = connection
+        self._kwargs = kwargs
+        self._cursor = connection._raw.cursor(**kwargs)
+
+    def execute(self, operation, params=None):
+        raw = self._connection._raw
+        in_transaction = raw.in_transaction
+        try:
+            return self._cursor.execute(operation, params)
+        except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError):
+            self._connection.healthy = False
+            if in_transaction:
+                raise # Les requêtes précédentes de la transaction sont perdues, l'appelant annule
+        try:
+            self._cursor.close()
+        except Exception:
+            pass
+        raw.reconnect(attempts=MYSQL_RECONNECT_ATTEMPTS, delay=1)
+        self._cursor = raw.cursor(**self._kwargs)
+        result = self._cursor.execute(operation, params)
+        self._connection.healthy = True
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
 def connect_to_mysql():
-    global mysql_connection
-    if mysql_connection and mysql_connection.is_connected():
-        return True # Déjà connecté
+    """Créer le pool de connexions MySQL au premier appel. Retourne False si la base est injoignable."""
+    global mysql_pool
+    if mysql_pool is not None:
+        return True # Pool déjà créé
     try:
-        mysql_connection = mysql.connector.connect(**MYSQL_CONFIG, autocommit=False) # Désactiver l'autocommit pour les transactions
-        # Tester la connexion 
-        cursor = mysql_connection.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchall()
-        cursor.close()
+        # Autocommit : les lectures ne gardent jamais de transaction ouverte ; les écritures appellent start_transaction()
+        pool = MySQLPool(MYSQL_POOL_SIZE, dict(MYSQL_CONFIG, autocommit=True))
+        pool.checkout(MYSQL_POOL_TIMEOUT).close() # Ouvrir une première connexion pour tester les paramètres
+        mysql_pool = pool
         print("MySQL connecté avec succès")
         return True
     except mysql.connector.Error as err:
         print(f"Erreur MySQL : {err}")
         QMessageBox.critical(None, "Erreur de base de données", f"Échec de la connexion MySQL : {err}")
-        mysql_connection = None # S'assurer qu'il est None en cas d'échec
+        mysql_pool = None # S'assurer qu'il est None en cas d'échec
         return False
 
+def get_mysql_connection():
+    """Emprunter une connexion au pool, en attendant jusqu'à MYSQL_POOL_TIMEOUT secondes qu'une connexion soit rendue.
+       L'appelant doit appeler close() dessus pour la rendre au pool (ce qui annule aussi toute transaction en cours).
+    """
+    return mysql_pool.checkout(MYSQL_POOL_TIMEOUT)
+
+def close_mysql_pool():
+    """Fermer les connexions inactives du pool (les connexions empruntées restent utilisables jusqu'à leur retour)."""
+    global mysql_pool
+    if mysql_pool is not None:
+        mysql_pool.close_all()
+        mysql_pool = None
+
+class MongoHealthListener(monitoring.CommandListener):
+    """Enregistre le résultat de chaque commande MongoDB, pour que connect_to_mongodb ne pingue qu'après une inactivité ou un échec."""
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        global mongo_last_ok
+        mongo_last_ok = time.monotonic()
+
+    def failed(self, event):
+        global mongo_last_ok
+        mongo_last_ok = 0.0
+
 def connect_to_mongodb():
     global mongo_client, mongo_db
     if mongo_client is not None and mongo_db is not None:
+         if time.monotonic() - mongo_last_ok < HEALTH_CHECK_IDLE_SECONDS:
+              return True # Les commandes récentes ont réussi ; le pilote se reconnecte seul si besoin
          try:
               mongo_client.admin.command('ping') # Vérifier si la connexion est toujours active
               return True
@@ -76,7 +326,8 @@ def connect_to_mongodb():
               mongo_db = None
               # Passe à la logique de reconnexion
     try:
-        mongo_client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000) # Ajouter un délai d'attente
+        mongo_client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=5000, # Ajouter un délai d'attente
+                                   event_listeners=[MongoHealthListener()])
         # La commande ismaster est peu coûteuse et ne nécessite pas d'authentification.
         mongo_client.admin.command('ismaster') # Vérifier la connexion
         mongo_db = mongo_client[MONGODB_DB]
@@ -89,6 +340,192 @@ def connect_to_mongodb():
         mongo_db = None
         return False
 
+def decode_image_scaled(image_source, box_size):
+    """Décoder une image (octets ou chemin de fichier) directement à une taille tenant dans box_size (un QSize).
+       QImageReader lit les dimensions dans l'en-tête et laisse le codec décoder à la taille réduite
+       (le JPEG utilise l'IDCT réduite de libjpeg) : une grande photo n'est jamais décodée en pleine résolution.
+       Les petites images ne sont jamais agrandies. Renvoie un QImage nul si les données ne peuvent être décodées.
+    """
+    if isinstance(image_source, str):
+        reader = QImageReader(image_source)
+    else:
+        buffer = QBuffer()
+        buffer.setData(bytes(image_source))
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+    original_size = reader.size()
+    if original_size.isValid() and (original_size.width() > box_size.width() or original_size.height() > box_size.height()):
+        reader.setScaledSize(original_size.scaled(box_size, Qt.KeepAspectRatio).expandedTo(QSize(1, 1)))
+    image = reader.read()
+    # Les formats qui n'indiquent pas leur taille à l'avance sont décodés en entier, puis redimensionnés
+    if not image.isNull() and (image.width() > box_size.width() or image.height() > box_size.height()):
+        image = image.scaled(box_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+def make_thumbnails(image_source, box_size):
+    """Produire des miniatures pré-encodées tenant dans box_size (1x) et 2*box_size (2x).
+       image_source est soit les octets de l'image, soit un chemin de fichier (décodé directement depuis le disque).
+       Retourne un dict comme {"1x": Binary, "2x": Binary}, ou None si l'image ne peut pas être décodée.
+       Les images avec transparence sont stockées en PNG, les autres en JPEG.
+    """
+    largest_side = box_size * max(THUMBNAIL_SCALES)
+    image = decode_image_scaled(image_source, QSize(largest_side, largest_side))
+    if image.isNull():
+        return None
+    thumbnails = {}
+    for scale in THUMBNAIL_SCALES:
+        side = box_size * scale
+        if image.width() > side or image.height() > side:
+            thumb = image.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        else:
+            thumb = image # Ne jamais agrandir les petites images
+        encoded = QByteArray()
+        buffer = QBuffer(encoded)
+        buffer.open(QIODevice.WriteOnly)
+        if thumb.hasAlphaChannel():
+            saved = thumb.save(buffer, "PNG")
+        else:
+            saved = thumb.save(buffer, "JPEG", THUMBNAIL_JPEG_QUALITY)
+        buffer.close()
+        if not saved:
+            return None
+        thumbnails[f"{scale}x"] = Binary(bytes(encoded))
+    return thumbnails
+
+# --- Fonctions de stockage des images ---
+
+def compute_image_dhash(image_source):
+    """Hachage de différence de 64 bits d'une image (octets ou chemin de fichier) : l'image est réduite à 9x8 niveaux
+       de gris et chaque bit indique si un pixel est plus clair que son voisin de droite. Redimensionner, recompresser
+       ou changer légèrement les couleurs ne change que peu de bits. Retourne None si l'image ne peut pas être décodée.
+    """
+    image = decode_image_scaled(image_source, QSize(64, 64))
+    if image.isNull():
+        return None
+    image = image.convertToFormat(QImage.Format_Grayscale8).scaled(9, 8, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    dhash = 0
+    for y in range(8):
+        for x in range(8):
+            dhash = (dhash << 1) | (image.pixelColor(x, y).red() > image.pixelColor(x + 1, y).red())
+    return dhash
+
+def image_size_limit():
+    """Taille maximale acceptée à l'envoi en octets, ou None quand le stockage GridFS lève la limite BSON."""
+    return MAX_EMBEDDED_IMAGE_SIZE if IMAGE_STORAGE == "embedded" else None
+
+def get_gridfs_bucket():
+    return gridfs.GridFSBucket(mongo_db, bucket_name=GRIDFS_BUCKET, chunk_size_bytes=GRIDFS_CHUNK_SIZE)
+
+def store_image(image_field, image_data=None, image_path=None, metadata=None):
+    """Stocker une image originale selon IMAGE_STORAGE et retourner les champs du document qui la référencent.
+       Avec GridFS, l'image est écrite en flux par blocs de GRIDFS_CHUNK_SIZE (directement depuis le disque
+       quand image_path est fourni) et le document ne garde que '<image_field>_file_id'.
+    """
+    if IMAGE_STORAGE == "gridfs":
+        bucket = get_gridfs_bucket()
+        filename = os.path.basename(image_path) if image_path else image_field
+        if image_path:
+            with open(image_path, 'rb') as f:
+                file_id = bucket.upload_from_stream(filename, f, metadata=metadata)
+        else:
+            file_id = bucket.upload_from_stream(filename, io.BytesIO(bytes(image_data)), metadata=metadata)
+        return {image_field: None, f"{image_field}_file_id": file_id}
+
+    if image_path:
+        with open(image_path, 'rb') as f:
+            image_data = f.read()
+    return {image_field: Binary(image_data)}
+
+def delete_stored_image(image_field, image_fields):
+    """Supprimer un fichier GridFS créé par store_image (les images intégrées partent avec leur document)."""
+    file_id = (image_fields or {}).get(f"{image_field}_file_id")
+    if file_id is not None:
+        try:
+            get_gridfs_bucket().delete(file_id)
+        except Exception as e:
+            print(f"Erreur lors de la suppression du fichier GridFS {file_id} : {e}")
+
+def read_stored_image(doc, image_field):
+    """Retourner les octets de l'image originale d'un document, en lisant les fichiers GridFS bloc par bloc.
+       Les documents qui référencent un blob partagé via '<image_field>_hash' sont résolus à travers lui.
+    """
+    if doc.get(image_field):
+        return doc[image_field]
+    content_hash = doc.get(f"{image_field}_hash")
+    if content_hash is not None:
+        blob = mongo_db[IMAGE_BLOBS_COLLECTION].find_one({"_id": content_hash}, {"thumbnails": 0})
+        return read_stored_image(blob, "data") if blob else None
+    file_id = doc.get(f"{image_field}_file_id")
+    if file_id is None:
+        return None
+    data = bytearray()
+    with get_gridfs_bucket().open_download_stream(file_id) as stream:
+        while True:
+            chunk = stream.readchunk()
+            if not chunk:
+                break
+            data.extend(chunk)
+    return bytes(data)
+
+def hash_image(image_data=None, image_path=None):
+    """SHA-256 du contenu de l'image ; les fichiers sont hachés par blocs de GRIDFS_CHUNK_SIZE."""
+    digest = hashlib.sha256()
+    if image_path:
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(GRIDFS_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    else:
+        digest.update(bytes(image_data))
+    return digest.hexdigest()
+
+def acquire_image_blob(box_size, image_data=None, image_path=None, metadata=None):
+    """Prendre une référence sur le blob partagé contenant cette image, en ne stockant l'image que si elle est nouvelle.
+       Retourne (empreinte du contenu, miniatures pour box_size). Un envoi en double incrémente seulement
+       le compteur de références et réutilise les miniatures déjà générées pour ce contenu.
+    """
+    content_hash = hash_image(image_data, image_path)
+    image_source = image_path or image_data
+    size_key = str(box_size)
+    blobs = mongo_db[IMAGE_BLOBS_COLLECTION]
+    while True:
+        blob = blobs.find_one_and_update(
+            {"_id": content_hash}, {"$inc": {"refcount": 1}}, projection={f"thumbnails.{size_key}": 1})
+        if blob is not None:
+            break
+        thumbnails = make_thumbnails(image_source, box_size)
+        image_fields = store_image("data", image_data, image_path, metadata)
+        try:
+            blobs.insert_one({"_id": content_hash, "refcount": 1,
+                              "thumbnails": {size_key: thumbnails}, **image_fields})
+            return content_hash, thumbnails
+        except DuplicateKeyError:
+            # La même image a été stockée en parallèle : supprimer notre copie et référencer celle-là
+            delete_stored_image("data", image_fields)
+
+    stored_thumbnails = blob.get("thumbnails") or {}
+    if size_key in stored_thumbnails:
+        return content_hash, stored_thumbnails[size_key]
+    # Image connue utilisée pour la première fois à une autre taille d'aperçu (ex. photo d'objet reprise comme preuve)
+    thumbnails = make_thumbnails(image_source, box_size)
+    blobs.update_one({"_id": content_hash}, {"$set": {f"thumbnails.{size_key}": thumbnails}})
+    return content_hash, thumbnails
+
+def release_image_blob(content_hash):
+    """Libérer une référence prise par acquire_image_blob et supprimer le blob quand plus rien ne pointe dessus."""
+    if content_hash is None:
+        return
+    try:
+        blobs = mongo_db[IMAGE_BLOBS_COLLECTION]
+        blob = blobs.find_one_and_update(
+            {"_id": content_hash}, {"$inc": {"refcount": -1}},
+            projection={"refcount": 1, "data_file_id": 1}, return_document=ReturnDocument.AFTER)
+        if blob and blob["refcount"] <= 0:
+            # Suppression conditionnelle : un envoi simultané de la même image a pu la référencer à nouveau
+            if blobs.delete_one({"_id": content_hash, "refcount": {"$lte": 0}}).deleted_count:
+                delete_stored_image("data", blob)
+    except Exception as e:
+        print(f"Erreur lors de la libération du blob d'image {content_hash} : {e}")
+
 def hash_password(password):
     """Hacher un mot de passe en utilisant SHA-256"""
     return hashlib.sha256(password.encode()).hexdigest()
@@ -99,9 +536,12 @@ def register_user(username, email, password):
     """Enregistrer un nouvel utilisateur dans la base de données MySQL"""
     if not connect_to_mysql():
         return False, "Base de données non connectée"
-    cursor = None 
+    connection = None
+    cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         hashed_password = hash_password(password)
 
         # Vérifier si l'email existe déjà 
@@ -119,26 +559,31 @@ def register_user(username, email, password):
             "INSERT INTO utilisateurs (nom_utilisateur, email, mot_de_passe) VALUES (%s, %s, %s)",
             (username, email, hashed_password)
         )
-        mysql_connection.commit() 
+        connection.commit() 
         return True, "Inscription réussie !"
     
     except mysql.connector.Error as err:
         
         print(f"Erreur d'inscription : {err}")
-        mysql_connection.rollback() # Annuler les changements en cas d'erreur 
+        if connection:
+            connection.rollback() # Annuler les changements en cas d'erreur 
         
         return False, f"Échec de l'inscription : {err}"
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 def login_user(email, password):
     """Authentifier un utilisateur par rapport à la base de données MySQL"""
     if not connect_to_mysql():
         return False, "Base de données non connectée"
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True) # Obtenir les résultats sous forme de dict
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True) # Obtenir les résultats sous forme de dict
         hashed_password = hash_password(password)
 
         cursor.execute(
@@ -158,36 +603,66 @@ def login_user(email, password):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
-def save_item(user_id, title, category, location, date, status, description, image_data=None):
-    """Sauvegarder les métadonnées de l'objet dans MySQL et les détails (description + image) dans MongoDB"""
+def save_item(user_id, title, category, location, date, status, description, image_data=None, image_path=None):
+    """Sauvegarder les métadonnées de l'objet dans MySQL et les détails (description + image) dans MongoDB.
+       L'image est fournie soit en octets (image_data), soit par un chemin de fichier (image_path).
+    """
     if not connect_to_mysql() or not connect_to_mongodb():
         return False, "Échec de la connexion à la base de données"
 
     mongo_id_obj = None
     mongo_id_str = None 
+    image_hash = None
+    image_dhash = None
+    connection = None
     cursor = None
 
     try:
-        # 1. Sauvegarder la description et l'image dans MongoDB
+        # 1. Sauvegarder la description dans MongoDB ; l'image va dans le stockage de blobs partagé
         
-        mongo_image_data = Binary(image_data) if image_data else None
-        mongo_result = mongo_db.items_detail.insert_one({
-            "description": description,
-            "image": mongo_image_data 
-        })
+        item_detail = {"description": description, "image": None, "thumbnails": None}
+        if image_path or image_data:
+            image_hash, item_detail["thumbnails"] = acquire_image_blob(
+                ITEM_THUMBNAIL_SIZE, image_data, image_path, metadata={"kind": "item"})
+            item_detail["image_hash"] = image_hash
+            image_dhash = compute_image_dhash(image_path or image_data)
+            if image_dhash is not None:
+                item_detail["image_dhash"] = f"{image_dhash:016x}" # Hex: MongoDB integers are signed
+        mongo_result = mongo_db.items_detail.insert_one(item_detail)
         mongo_id_obj = mongo_result.inserted_id
         mongo_id_str = str(mongo_id_obj)
 
         # 2. Sauvegarder les métadonnées dans MySQL, en liant au document MongoDB
         
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         cursor.execute(
             """INSERT INTO objets (id_utilisateur_proprietaire, titre, categorie, lieu, date_evenement, statut_objet, id_mongo_details, description_meta)
                  VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
             (user_id, title, category, location, date, status, mongo_id_str, description)
         )
-        mysql_connection.commit()
+        connection.commit()
+        item_category_facets.record(category)
+        item_location_facets.record(location)
+        item_title_words.record(title)
+        item_location_names.record(location)
+        image_similarity_index.record(cursor.lastrowid, status, image_dhash)
+        duplicate_post_index.record(cursor.lastrowid, user_id, category, title, description)
+        notify_saved_searches(cursor.lastrowid, user_id, title, category, location, status, description)
+        try:
+            matches = find_item_matches(cursor.lastrowid, title, category, location, date, status, description)
+            matched_ids = {match['id_objet'] for match in matches}
+            matches += [match for match in find_look_alike_items(cursor.lastrowid, image_dhash, status)
+                        if match['id_objet'] not in matched_ids]
+        except Exception as e:
+            print(f"Erreur lors du rapprochement de l'objet : {e}") # L'objet est sauvegardé ; il n'a simplement pas de suggestions
+            matches = []
+        if matches:
+            return True, "Objet sauvegardé ! Correspondances possibles : " + ", ".join(match['titre'] for match in matches)
         return True, "Objet sauvegardé avec succès !"
 
     except Exception as e:
@@ -201,8 +676,10 @@ def save_item(user_id, title, category, location, date, status, description, ima
                 print(f"Nettoyage de l'entrée MongoDB {mongo_id_str} en raison d'une erreur.")
             except Exception as mongo_del_err:
                 print(f"Erreur lors du nettoyage de l'entrée MongoDB {mongo_id_str}: {mongo_del_err}")
+        release_image_blob(image_hash)
         try:
-            mysql_connection.rollback()
+            if connection:
+                connection.rollback()
         except Exception as rollback_err:
             print(f"Erreur lors de l'annulation de la transaction MySQL : {rollback_err}")
 
@@ -210,19 +687,372 @@ def save_item(user_id, title, category, location, date, status, description, ima
     finally:
         if cursor:
             cursor.close()
-
-def get_all_items(filter_category=None, filter_location=None, include_recovered=False):
+        if connection:
+            connection.close()
+
+def fetch_details_by_ids(collection, mongo_id_strs, projection=None):
+    """Résoudre les documents MongoDB d'une liste d'identifiants via des requêtes $in par lots.
+       Retourne (details_by_id, invalid_ids) : un dict identifiant -> document et l'ensemble
+       des identifiants qui ne sont pas des ObjectId valides.
+       Une projection optionnelle limite les champs transférés (par ex. pour ignorer les images).
+    """
+    details_by_id = {}
+    invalid_ids = set()
+    object_ids = []
+    seen = set()
+    for mongo_id_str in mongo_id_strs:
+        if not mongo_id_str or mongo_id_str in seen:
+            continue
+        seen.add(mongo_id_str)
+        try:
+            object_ids.append(ObjectId(mongo_id_str))
+        except Exception as e:
+            print(f"Identifiant MongoDB invalide ({mongo_id_str}) : {e}")
+            invalid_ids.add(mongo_id_str)
+
+    for start in range(0, len(object_ids), MONGO_IN_BATCH_SIZE):
+        chunk = object_ids[start:start + MONGO_IN_BATCH_SIZE]
+        for doc in collection.find({"_id": {"$in": chunk}}, projection):
+            details_by_id[str(doc['_id'])] = doc
+    return details_by_id, invalid_ids
+
+def attach_item_details(items_mysql):
+    """Ajouter 'description' depuis MongoDB à chaque ligne d'objet MySQL.
+       Tous les détails sont résolus en un nombre constant d'allers-retours. Les images sont
+       exclues ; les cartes chargent les miniatures à la demande via get_item_thumbnails.
+    """
+    try:
+        details_by_id, invalid_ids = fetch_details_by_ids(
+            mongo_db.items_detail, [item.get('id_mongo_details') for item in items_mysql], {"image": 0, "thumbnails": 0})
+    except Exception as e:
+        print(f"Erreur lors de la récupération groupée des documents MongoDB : {e}")
+        details_by_id, invalid_ids = None, set()
+
+    for item_mysql in items_mysql:
+        mongo_id_str = item_mysql.get('id_mongo_details')
+        description = 'Détails indisponibles'
+        if mongo_id_str:
+            if details_by_id is None or mongo_id_str in invalid_ids:
+                description = 'Erreur lors de la récupération des détails'
+            elif mongo_id_str in details_by_id:
+                item_detail = details_by_id[mongo_id_str]
+                description = item_detail.get('description', 'Aucune description trouvée')
+            else:
+                print(f"Aucun document MongoDB trouvé pour mongo_id : {mongo_id_str}")
+                description = 'Détails manquants dans le stockage secondaire'
+
+        item_mysql['description'] = description
+    return items_mysql
+
+class ThumbnailDiskCache:
+    """Cache persistant de miniatures : un fichier pack en ajout seul d'enregistrements (clé, octets) lu via mmap,
+       plus un fichier d'index associant chaque clé à son décalage, sa longueur et sa dernière utilisation.
+       L'index est enregistré à la fermeture ; s'il manque ou ne correspond pas au pack (après un plantage par
+       exemple), il est reconstruit en parcourant les en-têtes d'enregistrement. Quand le pack dépasse max_bytes,
+       il est réécrit avec les seuls enregistrements vivants les plus récemment utilisés.
+       Les enregistrements vides mémorisent les documents sans image.
+    """
+    RECORD_HEADER = struct.Struct("<HI") # longueur de la clé, longueur des données
+
+    def __init__(self, directory, name, max_bytes):
+        os.makedirs(directory, exist_ok=True)
+        self.pack_path = os.path.join(directory, f"{name}.pack")
+        self.index_path = os.path.join(directory, f"{name}.idx")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._lock_file = self._acquire_file_lock(os.path.join(directory, f"{name}.lock"))
+        self._pack = open(self.pack_path, 'ab+') # Les écritures ajoutent toujours en fin ; les lectures passent par le mapping
+        self._map = None
+        self._index = {} # clé -> [décalage des données, longueur des données, dernière utilisation]
+        self._clock = 0
+        self._dirty = False
+        self._load_index()
+
+    @staticmethod
+    def _acquire_file_lock(lock_path):
+        """Empêcher une seconde instance en cours d'ajouter au même pack ; lève OSError si le verrou est pris."""
+        lock_file = open(lock_path, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise
+        return lock_file
+
+    def _remap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        size = os.fstat(self._pack.fileno()).st_size
+        if size:
+            self._map = mmap.mmap(self._pack.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _load_index(self):
+        pack_size = os.fstat(self._pack.fileno()).st_size
+        self._remap()
+        try:
+            with open(self.index_path, encoding='utf-8') as index_file:
+                saved = json.load(index_file)
+            if saved['pack_size'] == pack_size:
+                self._index = {key: list(entry) for key, entry in saved['entries'].items()}
+                self._clock = saved['clock']
+                return
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Reconstituer l'index à partir du pack lui-même, en supprimant un enregistrement tronqué à sa fin."""
+        self._index = {}
+        size = len(self._map) if self._map is not None else 0
+        offset = 0
+        while offset + self.RECORD_HEADER.size <= size:
+            key_length, data_length = self.RECORD_HEADER.unpack_from(self._map, offset)
+            data_offset = offset + self.RECORD_HEADER.size + key_length
+            if data_offset + data_length > size:
+                break
+            key = self._map[offset + self.RECORD_HEADER.size:data_offset].decode('utf-8')
+            self._index[key] = [data_offset, data_length, 0]
+            offset = data_offset + data_length
+        if offset < size:
+            self._map.close()
+            self._map = None
+            self._pack.truncate(offset)
+            self._remap()
+        self._dirty = True
+
+    def _save_index(self):
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as index_file:
+            json.dump({'pack_size': os.fstat(self._pack.fileno()).st_size, 'clock': self._clock,
+                       'entries': self._index}, index_file)
+        os.replace(temp_path, self.index_path)
+        self._dirty = False
+
+    def get_many(self, keys):
+        """Octets en cache pour les clés qui ont un enregistrement (b'' pour les documents connus sans image)."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._index.get(key)
+                if entry is None:
+                    continue
+                data_offset, data_length, _ = entry
+                if self._map is None or data_offset + data_length > len(self._map):
+                    self._remap() # Le pack a grandi depuis son dernier mapping
+                found[key] = self._map[data_offset:data_offset + data_length] if data_length else b""
+                self._clock += 1
+                entry[2] = self._clock
+                self._dirty = True
+        return found
+
+    def put_many(self, data_by_key):
+        with self._lock:
+            offset = os.fstat(self._pack.fileno()).st_size
+            for key, data in data_by_key.items():
+                data = bytes(data)
+                if len(data) > THUMBNAIL_DISK_CACHE_MAX_ENTRY_BYTES:
+                    continue
+                key_bytes = key.encode('utf-8')
+                self._pack.write(self.RECORD_HEADER.pack(len(key_bytes), len(data)) + key_bytes + data)
+                data_offset = offset + self.RECORD_HEADER.size + len(key_bytes)
+                self._clock += 1
+                self._index[key] = [data_offset, len(data), self._clock]
+                offset = data_offset + len(data)
+            self._pack.flush()
+            self._dirty = True
+            if offset > self.max_bytes:
+                self._compact()
+
+    def _compact(self):
+        """Réécrire le pack avec les enregistrements vivants les plus récemment utilisés, jusqu'à la cible de compactage."""
+        budget = int(self.max_bytes * THUMBNAIL_DISK_CACHE_COMPACT_RATIO)
+        kept = []
+        used = 0
+        for key, entry in sorted(self._index.items(), key=lambda pair: pair[1][2], reverse=True):
+            record_size = self.RECORD_HEADER.size + len(key.encode('utf-8')) + entry[1]
+            if used + record_size > budget:
+                break
+            kept.append((key, entry))
+            used += record_size
+        kept.sort(key=lambda pair: pair[1][0]) # Garder l'ordre d'origine pour que la copie lise séquentiellement
+
+        self._remap()
+        temp_path = self.pack_path + ".tmp"
+        new_index = {}
+        with open(temp_path, 'wb') as new_pack:
+            offset = 0
+            for key, (data_offset, data_length, last_use) in kept:
+                key_bytes = key.encode('utf-8')
+                new_pack.write(self.RECORD_HEADER.pack(len(key_bytes), data_length) + key_bytes)
+                new_pack.write(self._map[data_offset:data_offset + data_length])
+                new_index[key] = [offset + self.RECORD_HEADER.size + len(key_bytes), data_length, last_use]
+                offset += self.RECORD_HEADER.size + len(key_bytes) + data_length
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._pack.close()
+        os.replace(temp_path, self.pack_path)
+        self._pack = open(self.pack_path, 'ab+')
+        self._index = new_index
+        self._remap()
+        self._save_index()
+
+    def close(self):
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._pack.close()
+            self._lock_file.close()
+
+def get_thumbnail_disk_cache():
+    """Ouvrir le cache disque des miniatures à la première utilisation. Retourne None s'il est désactivé ou inutilisable."""
+    global thumbnail_disk_cache
+    if thumbnail_disk_cache is None:
+        thumbnail_disk_cache = False
+        if THUMBNAIL_DISK_CACHE_DIR:
+            try:
+                thumbnail_disk_cache = ThumbnailDiskCache(THUMBNAIL_DISK_CACHE_DIR, MONGODB_DB, THUMBNAIL_DISK_CACHE_MAX_BYTES)
+            except OSError as e:
+                print(f"Cache disque des miniatures indisponible (une autre instance est-elle en cours ?) : {e}")
+    return thumbnail_disk_cache or None
+
+def close_thumbnail_disk_cache():
+    global thumbnail_disk_cache
+    if thumbnail_disk_cache:
+        thumbnail_disk_cache.close()
+    thumbnail_disk_cache = None
+
+def fetch_thumbnails_by_ids(collection_name, original_field, mongo_id_strs, scale):
+    """Récupérer uniquement les octets de miniature des documents donnés pour une échelle ("1x" ou "2x").
+       Les documents antérieurs aux miniatures se rabattent sur leur image originale.
+       Les miniatures présentes dans le cache disque y sont lues ; seules les autres sont interrogées.
+       Retourne un dict identifiant -> octets.
+    """
+    if not mongo_id_strs:
+        return {}
+    images = {}
+    disk_cache = get_thumbnail_disk_cache()
+    if disk_cache is not None:
+        cache_keys = {mongo_id: f"{collection_name}/{scale}/{mongo_id}" for mongo_id in mongo_id_strs}
+        cached = disk_cache.get_many(cache_keys.values())
+        for mongo_id, key in cache_keys.items():
+            if cached.get(key):
+                images[mongo_id] = cached[key]
+        mongo_id_strs = [mongo_id for mongo_id, key in cache_keys.items() if key not in cached]
+        if not mongo_id_strs:
+            return images
+    if not connect_to_mongodb():
+        return images
+    collection = mongo_db[collection_name]
+    thumbnail_field = f"thumbnails.{scale}"
+    try:
+        details_by_id, _ = fetch_details_by_ids(collection, mongo_id_strs, {thumbnail_field: 1})
+        for mongo_id, doc in details_by_id.items():
+            thumb = (doc.get('thumbnails') or {}).get(scale)
+            if thumb:
+                images[mongo_id] = thumb
+        missing = [mongo_id for mongo_id in details_by_id if mongo_id not in images]
+        if missing:
+            originals_by_id, _ = fetch_details_by_ids(
+                collection, missing,
+                {original_field: 1, f"{original_field}_file_id": 1, f"{original_field}_hash": 1})
+            for mongo_id, doc in originals_by_id.items():
+                original = read_stored_image(doc, original_field)
+                if original:
+                    images[mongo_id] = original
+        if disk_cache is not None:
+            # Les documents sans image reçoivent un enregistrement vide, pour ne plus être interrogés non plus
+            disk_cache.put_many({f"{collection_name}/{scale}/{mongo_id}": images.get(mongo_id, b"")
+                                 for mongo_id in details_by_id})
+    except Exception as e:
+        print(f"Erreur lors de la récupération des miniatures depuis MongoDB : {e}")
+    return images
+
+def get_item_thumbnails(mongo_id_strs, scale="1x"):
+    """Charger les miniatures des cartes d'objet à la demande, indexées par id_mongo_details."""
+    return fetch_thumbnails_by_ids('items_detail', 'image', mongo_id_strs, scale)
+
+def get_claim_evidence_thumbnails(mongo_detail_id_strs, scale="1x"):
+    """Charger les miniatures de preuve à la demande, indexées par id_mongo_preuve."""
+    return fetch_thumbnails_by_ids('claims_detail', 'evidence_image', mongo_detail_id_strs, scale)
+
+def browse_page_key(item):
+    """Position d'un objet dans l'ordre de consultation, à passer à get_all_items(after=...)."""
+    return (item['statut_objet'], item['date_evenement'], item['date_signalement'], item['id_objet'])
+
+def browse_seek_condition(after):
+    """Condition SQL (et paramètres) sélectionnant les lignes qui suivent `after` dans
+       ORDER BY o.statut_objet, o.date_evenement DESC, o.date_signalement DESC, o.id_objet DESC.
+       MySQL trie les NULL en premier en ordre croissant, donc les dates NULL viennent en dernier dans les colonnes DESC.
+    """
+    status, date, created_at, item_id = after
+    condition, params = "o.id_objet < %s", [item_id]
+    for column, value in (("o.date_signalement", created_at), ("o.date_evenement", date)):
+        if value is None:
+            condition = f"({column} IS NULL AND {condition})"
+        else:
+            condition = f"({column} < %s OR {column} IS NULL OR ({column} = %s AND {condition}))"
+            params = [value, value] + params
+    # Les ENUM se comparent comme des chaînes face à un littéral, donc les statuts suivants sont listés explicitement
+    later_statuses = ITEM_STATUS_ORDER[ITEM_STATUS_ORDER.index(status) + 1:]
+    condition = f"(o.statut_objet = %s AND {condition})"
+    params = [status] + params
+    if later_statuses:
+        condition = f"(o.statut_objet IN ({', '.join(['%s'] * len(later_statuses))}) OR {condition})"
+        params = list(later_statuses) + params
+    return condition, params
+
+def get_search_words(search_text):
+    """Mots de search_text que l'index FULLTEXT peut trouver. Seuls les caractères de mot sont gardés, pour que
+       les opérateurs saisis ne changent pas le sens de la requête.
+    """
+    return [word for word in re.findall(r"\w+", search_text or "") if len(word) >= SEARCH_MIN_WORD_LENGTH]
+
+def build_fulltext_query(search_text):
+    """Chaîne AGAINST en mode booléen exigeant chaque mot cherché comme préfixe, ou None s'il n'y en a pas.
+       Un mot qu'aucun titre ne contient peut à la place correspondre à une graphie proche tirée de item_title_words.
+    """
+    terms = []
+    for word in get_search_words(search_text):
+        try:
+            alternatives = [alt for alt in item_title_words.lookup(word) if fold_search_text(alt) != fold_search_text(word)]
+        except mysql.connector.Error as e:
+            print(f"Erreur lors du chargement de l'index des mots de titres : {e}")
+            alternatives = []
+        terms.append(f"+({word}* {' '.join(alternatives)})" if alternatives else f"+{word}*")
+    return " ".join(terms) or None
+
+def get_all_items(filter_category=None, filter_location=None, include_recovered=False, after=None, limit=None,
+                  search_text=None, connect=True):
     
-    """Récupérer les objets (excluant les récupérés par défaut), joindre avec l'utilisateur, récupérer les détails de MongoDB"""
+    """Récupérer les objets (excluant les récupérés par défaut), joindre avec l'utilisateur, récupérer les détails de MongoDB.
+       Avec limit, retourne une page ; passer browse_page_key() du dernier objet comme `after` pour la suivante.
+       Avec search_text, seuls les objets correspondant à ses mots sont retournés, les plus pertinents d'abord ;
+       la pertinence n'offre pas de clé de position stable, `after` est alors le nombre d'objets déjà affichés.
+       connect=False saute connect_to_mysql/connect_to_mongodb, qui peuvent afficher des dialogues et remplacer les
+       clients : les appelants hors du thread de l'interface y vérifient d'abord les connexions et le passent. Les
+       erreurs sont alors levées au lieu d'être journalisées, pour que ces appelants puissent les signaler.
+    """
     
-    if not connect_to_mysql() or not connect_to_mongodb():
+    if connect and (not connect_to_mysql() or not connect_to_mongodb()):
         print("Échec de la connexion à la base de données dans get_all_items")
         return []
 
     items = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
 
         query = """
         SELECT o.id_objet, o.id_utilisateur_proprietaire, o.titre, o.categorie, o.lieu, o.date_evenement, o.statut_objet, o.id_mongo_details, o.date_signalement,
@@ -233,6 +1063,10 @@ def get_all_items(filter_category=None, filter_location=None, include_recovered=
 
         params = []
         conditions = []
+        fulltext_query = build_fulltext_query(search_text)
+        if fulltext_query:
+            conditions.append("MATCH(o.titre, o.description_meta) AGAINST (%s IN BOOLEAN MODE)")
+            params.append(fulltext_query)
 
         # Exclure les objets récupérés sauf indication contraire
         
@@ -245,50 +1079,58 @@ def get_all_items(filter_category=None, filter_location=None, include_recovered=
             params.append(filter_category)
 
         if filter_location and filter_location != "Tous les lieux": 
-            conditions.append("o.lieu = %s")
-            params.append(filter_location)
+            # Un lieu saisi correspond aussi à ses autres graphies, et aux lieux proches quand aucun n'est connu
+            try:
+                locations = item_location_names.lookup(filter_location) or [filter_location]
+            except mysql.connector.Error as e:
+                print(f"Erreur lors du chargement de l'index des lieux : {e}")
+                locations = [filter_location]
+            conditions.append(f"o.lieu IN ({', '.join(['%s'] * len(locations))})")
+            params.extend(locations)
+
+        if after is not None and not fulltext_query:
+            seek_condition, seek_params = browse_seek_condition(after)
+            conditions.append(seek_condition)
+            params.extend(seek_params)
 
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
 
-        query += " ORDER BY o.statut_objet, o.date_evenement DESC, o.date_signalement DESC"
+        if fulltext_query:
+            # MySQL évalue le MATCH une seule fois et le réutilise pour le classement
+            query += " ORDER BY MATCH(o.titre, o.description_meta) AGAINST (%s IN BOOLEAN MODE) DESC, o.id_objet DESC"
+            params.append(fulltext_query)
+        else:
+            query += " ORDER BY o.statut_objet, o.date_evenement DESC, o.date_signalement DESC, o.id_objet DESC"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+            if fulltext_query and after:
+                query += " OFFSET %s"
+                params.append(after)
 
         cursor.execute(query, tuple(params)) 
         items_mysql = cursor.fetchall()
 
-        # Récupérer les détails de MongoDB pour chaque objet
-        for item_mysql in items_mysql:
-            mongo_id_str = item_mysql.get('id_mongo_details')
-            description = 'Détails indisponibles'
-            image_data = None
-            if mongo_id_str:
-                try:
-                    mongo_object_id = ObjectId(mongo_id_str)
-                    item_detail = mongo_db.items_detail.find_one({"_id": mongo_object_id})
-                    if item_detail:
-                        description = item_detail.get('description', 'Aucune description trouvée')
-                        image_data = item_detail.get('image') 
-                    else:
-                        print(f"Aucun document MongoDB trouvé pour mongo_id : {mongo_id_str}")
-                        description = 'Détails manquants dans le stockage secondaire'
-                except Exception as e:
-                    print(f"Erreur lors de la récupération/analyse du document MongoDB ({mongo_id_str}): {e}")
-                    description = 'Erreur lors de la récupération des détails'
-
-            item_mysql['description'] = description
-            item_mysql['image_data'] = image_data
-            items.append(item_mysql) 
+        # Récupérer les détails de MongoDB en une seule passe groupée
+        items = attach_item_details(items_mysql)
 
         return items
     except mysql.connector.Error as e:
+        if not connect:
+            raise
         print(f"Erreur lors de la récupération des objets depuis MySQL : {e}")
         return []
     except Exception as e:
+        if not connect:
+            raise
         print(f"Une erreur s'est produite lors de la récupération des objets : {e}")
         return items 
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def get_user_items(user_id):
@@ -298,9 +1140,11 @@ def get_user_items(user_id):
         return []
 
     items = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
         cursor.execute(
             """SELECT o.id_objet, o.id_utilisateur_proprietaire, o.titre, o.categorie, o.lieu, o.date_evenement, o.statut_objet, o.id_mongo_details, o.date_signalement,
                       u.nom_utilisateur AS proprietaire_nom_utilisateur
@@ -312,29 +1156,8 @@ def get_user_items(user_id):
         )
         items_mysql = cursor.fetchall()
 
-        # Récupérer les détails de MongoDB
-        
-        for item_mysql in items_mysql:
-            mongo_id_str = item_mysql.get('id_mongo_details')
-            description = 'Détails indisponibles'
-            image_data = None
-            if mongo_id_str: 
-                try:
-                    mongo_object_id = ObjectId(mongo_id_str)
-                    item_detail = mongo_db.items_detail.find_one({"_id": mongo_object_id})
-                    if item_detail:
-                        description = item_detail.get('description', 'Aucune description trouvée')
-                        image_data = item_detail.get('image') # BSON Binary ou None
-                    else:
-                        print(f"Aucun document MongoDB trouvé pour l'objet utilisateur mongo_id : {mongo_id_str}")
-                        description = 'Détails manquants dans le stockage secondaire'
-                except Exception as e:
-                    print(f"Erreur lors de la récupération/analyse du document MongoDB ({mongo_id_str}) pour l'objet utilisateur : {e}")
-                    description = 'Erreur lors de la récupération des détails'
-
-            item_mysql['description'] = description
-            item_mysql['image_data'] = image_data
-            items.append(item_mysql)
+        # Récupérer les détails de MongoDB en une seule passe groupée
+        items = attach_item_details(items_mysql)
 
         return items
     except mysql.connector.Error as e:
@@ -346,15 +1169,19 @@ def get_user_items(user_id):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 def get_item_owner(item_id):
     """Obtenir le user_id du propriétaire de l'objet."""
     if not connect_to_mysql():
         print("Échec de la connexion à la base de données dans get_item_owner")
         return None
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
         cursor.execute("SELECT id_utilisateur_proprietaire FROM objets WHERE id_objet = %s", (item_id,))
         result = cursor.fetchone()
         return result[0] if result else None
@@ -364,69 +1191,744 @@ def get_item_owner(item_id):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
+
+class FacetCache:
+    """Valeurs distinctes d'une colonne de la table objets avec leur nombre d'objets, pour remplir les filtres.
+       Chargées en une seule requête GROUP BY, puis mises à jour sur place par les fonctions qui modifient
+       les objets via record() : lire les valeurs ne coûte aucune requête. Avec un ttl, les compteurs sont
+       rechargés dès qu'ils ont plus de ttl secondes.
+    """
+    def __init__(self, column, ttl=None):
+        self.column = column
+        self.ttl = ttl
+        # fold_search_text(valeur) -> [première graphie vue, nombre d'objets], None tant que non chargé. Le repliement
+        # fusionne les graphies que la collation de la colonne considère égales, comme GROUP BY et le = du filtre.
+        self._counts = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute(f"SELECT {self.column}, COUNT(*) FROM objets "
+                           f"WHERE {self.column} IS NOT NULL AND {self.column} != '' GROUP BY {self.column}")
+            self._counts = {}
+            for value, count in cursor.fetchall():
+                self._counts.setdefault(fold_search_text(value), [value, 0])[1] += count
+            self._loaded_at = time.monotonic()
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def values(self):
+        """Valeurs distinctes triées ; lève mysql.connector.Error si elles devaient être chargées et n'ont pas pu l'être."""
+        with self._lock:
+            if self._counts is None or (self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl):
+                self._load()
+            return sorted((value for value, count in self._counts.values() if count > 0), key=str.casefold)
+
+    def record(self, value, delta=1):
+        """Prendre en compte delta objets gagnant (ou, si négatif, perdant) cette valeur."""
+        if not value:
+            return
+        with self._lock:
+            if self._counts is None:
+                return # Pas encore chargé ; le premier chargement verra la modification
+            key = fold_search_text(value)
+            entry = self._counts.setdefault(key, [value, 0])
+            entry[1] += delta
+            if entry[1] <= 0:
+                del self._counts[key]
+
+item_category_facets = FacetCache('categorie', FACET_CACHE_TTL_SECONDS)
+item_location_facets = FacetCache('lieu', FACET_CACHE_TTL_SECONDS)
 
 def get_unique_categories():
-    """Obtenir une liste des catégories uniques de la table items"""
+    """Obtenir une liste des catégories uniques de la table items (servie par le cache de facettes)"""
     if not connect_to_mysql(): return ["Toutes les catégories"]
-    cursor = None
     try:
-        cursor = mysql_connection.cursor()
-        cursor.execute("SELECT DISTINCT categorie FROM objets WHERE categorie IS NOT NULL AND categorie != '' ORDER BY categorie")
-        categories = [row[0] for row in cursor.fetchall()]
-        return ["Toutes les catégories"] + categories
+        return ["Toutes les catégories"] + item_category_facets.values()
     except mysql.connector.Error as e: 
         print(f"Erreur lors de la récupération des catégories : {e}")
         return ["Toutes les catégories"] 
-    finally:
-        if cursor:
-            cursor.close()
 
 def get_unique_locations():
-    """Obtenir une liste des lieux uniques de la table items"""
+    """Obtenir une liste des lieux uniques de la table items (servie par le cache de facettes)"""
     if not connect_to_mysql(): return ["Tous les lieux"]
-    cursor = None
     try:
-        cursor = mysql_connection.cursor()
-        cursor.execute("SELECT DISTINCT lieu FROM objets WHERE lieu IS NOT NULL AND lieu != '' ORDER BY lieu")
-        locations = [row[0] for row in cursor.fetchall()] 
-        return ["Tous les lieux"] + locations
+        return ["Tous les lieux"] + item_location_facets.values()
     except mysql.connector.Error as e:
         print(f"Erreur lors de la récupération des lieux : {e}")
         return ["Tous les lieux"]
+
+def fold_search_text(text):
+    """Forme sous laquelle les termes de recherche sont comparés : sans casse ni accents ("Bibliothèque" -> "bibliotheque")."""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+class TrigramIndex:
+    """Recherche tolérante aux fautes des valeurs d'une colonne d'objets, ou des mots qu'elle contient (split_words=True).
+       Chaque terme connu est référencé sous ses trigrammes, donc une recherche ne visite que les termes partageant
+       un trigramme avec la requête au lieu de parcourir la table. Chargé par une requête DISTINCT à la première
+       utilisation (voir warm_search_indexes), puis tenu à jour par save_item via record().
+    """
+    def __init__(self, column, split_words=False):
+        self.column = column
+        self.split_words = split_words
+        self._terms = None # terme replié -> ensemble des graphies vues, None tant que non chargé
+        self._trigrams = {} # terme replié -> ses trigrammes
+        self._postings = {} # trigramme -> ensemble de termes repliés
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def trigrams(folded):
+        padded = f"  {folded} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _spellings(self, text):
+        if self.split_words:
+            return [word for word in re.findall(r"\w+", text) if len(word) >= SEARCH_MIN_WORD_LENGTH]
+        return [text.strip()] if text.strip() else []
+
+    def _add(self, text, terms, trigrams, postings):
+        for spelling in self._spellings(text):
+            folded = fold_search_text(spelling)
+            if folded not in terms:
+                terms[folded] = set()
+                trigrams[folded] = self.trigrams(folded)
+                for trigram in trigrams[folded]:
+                    postings.setdefault(trigram, set()).add(folded)
+            terms[folded].add(spelling)
+
+    def _load(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute(f"SELECT DISTINCT {self.column} FROM objets "
+                           f"WHERE {self.column} IS NOT NULL AND {self.column} != ''")
+            terms, trigrams, postings = {}, {}, {}
+            while True:
+                rows = cursor.fetchmany(5000)
+                if not rows:
+                    break
+                for (text,) in rows:
+                    self._add(text, terms, trigrams, postings)
+            # Seul un chargement complet est conservé : si le curseur échoue en cours de route, la recherche suivante réessaie
+            self._terms, self._trigrams, self._postings = terms, trigrams, postings
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def lookup(self, text, limit=FUZZY_MAX_ALTERNATIVES, min_similarity=FUZZY_MIN_SIMILARITY):
+        """Graphies connues de text une fois replié ; à défaut, les graphies connues les plus proches par similarité
+           de trigrammes, la meilleure d'abord. Lève mysql.connector.Error si l'index devait être chargé et n'a pas pu l'être.
+        """
+        folded = fold_search_text(text.strip())
+        with self._lock:
+            if self._terms is None:
+                self._load()
+            if folded in self._terms:
+                return sorted(self._terms[folded])
+            query_trigrams = self.trigrams(folded)
+            shared = {}
+            for trigram in query_trigrams:
+                for term in self._postings.get(trigram, ()):
+                    shared[term] = shared.get(term, 0) + 1
+            scored = []
+            for term, count in shared.items():
+                similarity = count / (len(query_trigrams) + len(self._trigrams[term]) - count)
+                if similarity >= min_similarity:
+                    scored.append((similarity, term))
+            scored.sort(key=lambda entry: (-entry[0], entry[1]))
+            return [spelling for _, term in scored[:limit] for spelling in sorted(self._terms[term])]
+
+    def record(self, text):
+        """Faire connaître les graphies d'une valeur nouvellement enregistrée."""
+        if not text:
+            return
+        with self._lock:
+            if self._terms is not None: # Pas encore chargé ; le premier chargement verra la valeur
+                self._add(text, self._terms, self._trigrams, self._postings)
+
+item_title_words = TrigramIndex('titre', split_words=True)
+item_location_names = TrigramIndex('lieu')
+
+def warm_search_indexes():
+    """Charger les index de recherche avant la première recherche (exécuté sur un thread d'arrière-plan au démarrage)."""
+    for index in (item_title_words, item_location_names):
+        try:
+            index.lookup("")
+        except mysql.connector.Error as e:
+            print(f"Erreur lors du chargement de l'index de recherche {index.column} : {e}")
+    try:
+        image_similarity_index.search(0, 'found')
+    except Exception as e:
+        print(f"Erreur lors du chargement de l'index de similarité d'images : {e}")
+
+def tfidf_cosine_similarities(query_text, texts):
+    """Similarité cosinus entre les vecteurs TF-IDF de query_text et de chacun des texts, en tableau NumPy.
+       Les fréquences documentaires viennent de query_text et de texts eux-mêmes. La matrice des termes reste creuse,
+       en triplets (document, terme, nombre), donc le coût croît avec le nombre de mots et non documents x vocabulaire.
+    """
+    vocabulary = {}
+    rows, cols = [], []
+    for row, text in enumerate([query_text] + list(texts)):
+        for word in re.findall(r"\w+", fold_search_text(text or "")):
+            if len(word) >= SEARCH_MIN_WORD_LENGTH:
+                rows.append(row)
+                cols.append(vocabulary.setdefault(word, len(vocabulary)))
+    document_count = len(texts) + 1
+    if not vocabulary:
+        return np.zeros(len(texts))
+
+    pairs, counts = np.unique(np.array(rows, dtype=np.int64) * len(vocabulary) + np.array(cols, dtype=np.int64),
+                              return_counts=True)
+    pair_rows, pair_cols = pairs // len(vocabulary), pairs % len(vocabulary)
+    document_frequency = np.bincount(pair_cols, minlength=len(vocabulary))
+    idf = np.log((1 + document_count) / (1 + document_frequency)) + 1
+    weights = (1 + np.log(counts)) * idf[pair_cols]
+
+    norms = np.sqrt(np.bincount(pair_rows, weights=weights * weights, minlength=document_count))
+    query_weights = np.zeros(len(vocabulary))
+    query_weights[pair_cols[pair_rows == 0]] = weights[pair_rows == 0]
+    dots = np.bincount(pair_rows, weights=weights * query_weights[pair_cols], minlength=document_count)
+    denominators = norms * norms[0]
+    return np.divide(dots, denominators, out=np.zeros(document_count), where=denominators > 0)[1:]
+
+def location_similarity(location_a, location_b):
+    """1.0 pour le même lieu aux accents et à la casse près, sinon la similarité en trigrammes des deux graphies."""
+    folded_a, folded_b = fold_search_text(location_a or ""), fold_search_text(location_b or "")
+    if not folded_a or not folded_b:
+        return 0.0
+    if folded_a == folded_b:
+        return 1.0
+    trigrams_a, trigrams_b = TrigramIndex.trigrams(folded_a), TrigramIndex.trigrams(folded_b)
+    return len(trigrams_a & trigrams_b) / len(trigrams_a | trigrams_b)
+
+def find_item_matches(item_id, title, category, location, date, status, description):
+    """Meilleurs objets ouverts de statut opposé pour un objet nouvellement sauvegardé, en dicts (id_objet, titre, lieu,
+       date_evenement, score), meilleur score d'abord. Les candidats viennent d'une seule requête par plage indexée
+       (même catégorie, fenêtre de dates), puis sont notés ensemble avec NumPy. Lève mysql.connector.Error si les
+       candidats ne peuvent pas être lus.
+    """
+    opposite_status = {'lost': 'found', 'found': 'lost'}.get(status)
+    if not opposite_status:
+        return []
+    if isinstance(date, str):
+        date = datetime.date.fromisoformat(date) if date else None
+
+    conditions, params = ["statut_objet = %s", "id_objet != %s"], [opposite_status, item_id]
+    if category:
+        conditions.append("categorie = %s")
+        params.append(category)
+    if date:
+        window = datetime.timedelta(days=MATCH_DATE_WINDOW_DAYS)
+        conditions.append("date_evenement BETWEEN %s AND %s")
+        params.extend([date - window, date + window])
+    params.append(MATCH_MAX_CANDIDATES)
+
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(
+            f"""SELECT id_objet, titre, description_meta, lieu, date_evenement FROM objets
+                WHERE {' AND '.join(conditions)} ORDER BY date_evenement DESC LIMIT %s""",
+            tuple(params)
+        )
+        candidates = cursor.fetchall()
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
+    if not candidates:
+        return []
 
+    text_scores = tfidf_cosine_similarities(f"{title} {description or ''}",
+                                            [f"{candidate['titre']} {candidate['description_meta'] or ''}" for candidate in candidates])
+    location_scores = np.array([location_similarity(location, candidate['lieu']) for candidate in candidates])
+    if date:
+        day_gaps = np.array([abs((candidate['date_evenement'] - date).days) if candidate['date_evenement'] else MATCH_DATE_WINDOW_DAYS
+                             for candidate in candidates])
+        date_scores = np.clip(1 - day_gaps / MATCH_DATE_WINDOW_DAYS, 0, 1)
+    else:
+        date_scores = np.zeros(len(candidates))
+    scores = (MATCH_WEIGHTS['text'] * text_scores + MATCH_WEIGHTS['location'] * location_scores
+              + MATCH_WEIGHTS['date'] * date_scores)
+
+    best = [index for index in np.argsort(-scores)[:MATCH_MAX_RESULTS] if scores[index] >= MATCH_MIN_SCORE]
+    return [{'id_objet': candidates[index]['id_objet'], 'titre': candidates[index]['titre'],
+             'lieu': candidates[index]['lieu'], 'date_evenement': candidates[index]['date_evenement'], 'score': float(scores[index])}
+            for index in best]
+
+
+def hamming_distance(hash_a, hash_b):
+    return bin(hash_a ^ hash_b).count("1")
+
+class BKTree:
+    """Arbre de Burkhard-Keller sur des hachages de 64 bits avec la distance de Hamming. Chaque enfant est rattaché à
+       son parent par leur distance, donc par l'inégalité triangulaire search() peut ignorer tout sous-arbre dont
+       l'arête diffère de la distance de la requête au nœud de plus que le rayon.
+    """
+    def __init__(self):
+        self._root = None # [hachage, valeurs ayant ce hachage, {distance: nœud enfant}]
+
+    def add(self, hash_value, value):
+        if self._root is None:
+            self._root = [hash_value, [value], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming_distance(node[0], hash_value)
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [hash_value, [value], {}]
+                return
+            node = child
+
+    def search(self, hash_value, radius):
+        """Paires (distance, valeur) pour chaque valeur dont le hachage est à au plus radius de hash_value."""
+        results = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(node[0], hash_value)
+            if distance <= radius:
+                results.extend((distance, value) for value in node[1])
+            stack.extend(child for edge, child in node[2].items() if distance - radius <= edge <= distance + radius)
+        return results
+
+class ImageSimilarityIndex:
+    """Arbre BK des dHash des photos d'objets, avec le statut courant de chaque objet. Chargé à la première utilisation
+       (voir warm_search_indexes) depuis les objets non récupérés et leurs hachages de items_detail, puis tenu à jour
+       par save_item et accept_claim via record().
+    """
+    def __init__(self):
+        self._tree = None # BKTree de dHash -> id d'objet, None tant que non chargé
+        self._statuses = {} # id d'objet -> statut
+        self._pending = None # Changements notés pendant un chargement, rejoués sur son résultat
+        self._lock = threading.Lock() # Protège les champs ci-dessus ; jamais tenu pendant un chargement
+        self._load_lock = threading.Lock() # Tenu par le thread qui exécute un chargement
+
+    @staticmethod
+    def _apply(tree, statuses, item_id, status, dhash):
+        if item_id in statuses or dhash is not None:
+            if item_id not in statuses:
+                tree.add(dhash, item_id)
+            statuses[item_id] = status
+
+    def _load(self):
+        """Construire l'arbre sans tenir _lock, pour que record() (appelé dans le thread de l'interface) n'attende jamais un chargement."""
+        with self._lock:
+            self._pending = []
+        try:
+            self._build_and_swap()
+        finally:
+            with self._lock:
+                self._pending = None
+
+    def _build_and_swap(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT id_objet, statut_objet, id_mongo_details FROM objets "
+                           "WHERE statut_objet != %s AND id_mongo_details IS NOT NULL", ('recovered',))
+            items_by_mongo_id = {mongo_id: (item_id, status) for item_id, status, mongo_id in cursor.fetchall()}
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+        tree, statuses = BKTree(), {}
+        for detail in mongo_db.items_detail.find({"image_dhash": {"$type": "string"}}, {"image_dhash": 1}):
+            item = items_by_mongo_id.get(str(detail["_id"]))
+            if item:
+                tree.add(int(detail["image_dhash"], 16), item[0])
+                statuses[item[0]] = item[1]
+        with self._lock:
+            for change in self._pending: # Sauvegardé ou accepté pendant le chargement ; peut déjà figurer dans l'instantané
+                self._apply(tree, statuses, *change)
+            self._tree, self._statuses = tree, statuses
+
+    def search(self, dhash, status, max_distance=IMAGE_MATCH_MAX_DISTANCE, exclude_id=None):
+        """(distance, id d'objet) des objets de ce statut dont la photo est à au plus max_distance bits, les plus proches d'abord."""
+        if self._tree is None:
+            if not self._load_lock.acquire(blocking=False):
+                return [] # Un autre thread charge : pas de suggestions plutôt que de bloquer l'appelant (souvent le thread de l'interface)
+            try:
+                if self._tree is None:
+                    self._load()
+            finally:
+                self._load_lock.release()
+        with self._lock:
+            return sorted((distance, item_id) for distance, item_id in self._tree.search(dhash, max_distance)
+                          if item_id != exclude_id and self._statuses.get(item_id) == status)
+
+    def record(self, item_id, status, dhash=None):
+        """Ajouter le hachage de la photo d'un objet nouvellement sauvegardé, ou noter un changement de statut d'un objet indexé."""
+        with self._lock:
+            if self._tree is None:
+                if self._pending is not None:
+                    self._pending.append((item_id, status, dhash)) # Un chargement est en cours ; rejouer sur son résultat
+                return # Sinon pas encore chargé ; le premier chargement verra le changement
+            self._apply(self._tree, self._statuses, item_id, status, dhash)
+
+image_similarity_index = ImageSimilarityIndex()
+
+def find_look_alike_items(item_id, image_dhash, status):
+    """Objets ouverts de statut opposé dont la photo ressemble à celle de cet objet, sous la même forme que
+       find_item_matches (score = part des bits de hachage identiques), les plus proches d'abord.
+    """
+    opposite_status = {'lost': 'found', 'found': 'lost'}.get(status)
+    if image_dhash is None or not opposite_status:
+        return []
+    nearest = image_similarity_index.search(image_dhash, opposite_status, exclude_id=item_id)[:IMAGE_MATCH_MAX_RESULTS]
+    if not nearest:
+        return []
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(f"SELECT id_objet, titre, lieu, date_evenement FROM objets "
+                       f"WHERE id_objet IN ({', '.join(['%s'] * len(nearest))})", tuple(item_id for _, item_id in nearest))
+        rows = {row['id_objet']: row for row in cursor.fetchall()}
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+    return [dict(rows[item_id], score=1 - distance / 64) for distance, item_id in nearest if item_id in rows]
+
+class MinHashLSHIndex:
+    """Signatures MinHash des annonces des utilisateurs, rangées par (utilisateur, catégorie, bande LSH). Les annonces
+       d'un utilisateur sont chargées par une requête sur l'index des propriétaires la première fois qu'il poste, puis
+       tenues à jour par save_item (record) et accept_claim (forget). Trouver les doublons d'une annonce ne lit que ses
+       propres compartiments, donc le coût ne croît pas avec la table.
+    """
+    PRIME = (1 << 31) - 1
+    _random = np.random.default_rng(20240501) # Graine fixe : les signatures restent comparables d'une exécution à l'autre
+    A = _random.integers(1, PRIME, DUPLICATE_MINHASH_PERMUTATIONS, dtype=np.uint64)
+    B = _random.integers(0, PRIME, DUPLICATE_MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+    def __init__(self):
+        self._loaded_users = set()
+        self._buckets = {} # (id utilisateur, catégorie, bande, octets de la bande) -> ensemble d'ids d'objets
+        self._posts = {} # id d'objet -> (id utilisateur, catégorie, signature, titre)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def signature(cls, title, description):
+        """Signature MinHash (tableau uint64) des fragments de titre + description, ou None s'il n'y en a aucun."""
+        text = " ".join(fold_search_text(f"{title} {description or ''}").split())
+        shingles = {text[i:i + DUPLICATE_SHINGLE_SIZE] for i in range(max(len(text) - DUPLICATE_SHINGLE_SIZE + 1, 0))}
+        if not shingles:
+            return None
+        hashes = np.array([zlib.crc32(shingle.encode('utf-8')) % cls.PRIME for shingle in shingles], dtype=np.uint64)
+        # (a*x + b) mod p reste sous 2**62 pour a, b et x sur 31 bits, donc uint64 ne déborde jamais
+        return ((cls.A[:, None] * hashes[None, :] + cls.B[:, None]) % cls.PRIME).min(axis=1)
+
+    def _bucket_keys(self, user_id, category, signature):
+        rows = DUPLICATE_MINHASH_PERMUTATIONS // DUPLICATE_LSH_BANDS
+        return [(user_id, category, band, signature[band * rows:(band + 1) * rows].tobytes())
+                for band in range(DUPLICATE_LSH_BANDS)]
+
+    def _add(self, item_id, user_id, category, title, description):
+        signature = self.signature(title, description)
+        if signature is None:
+            return
+        self._posts[item_id] = (user_id, category, signature, title)
+        for key in self._bucket_keys(user_id, category, signature):
+            self._buckets.setdefault(key, set()).add(item_id)
+
+    def _load_user(self, user_id):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT id_objet, categorie, titre, description_meta FROM objets "
+                           "WHERE id_utilisateur_proprietaire = %s AND statut_objet != %s", (user_id, 'recovered'))
+            for item_id, category, title, description in cursor.fetchall():
+                self._add(item_id, user_id, category, title, description)
+            self._loaded_users.add(user_id)
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def find(self, user_id, category, title, description):
+        """(similarité, id d'objet, titre) des annonces ouvertes de l'utilisateur dans cette catégorie qui semblent être
+           un doublon, la plus similaire d'abord. Lève mysql.connector.Error si ses annonces devaient être chargées et
+           n'ont pas pu l'être.
+        """
+        signature = self.signature(title, description)
+        if signature is None:
+            return []
+        with self._lock:
+            if user_id not in self._loaded_users:
+                self._load_user(user_id)
+            candidates = set()
+            for key in self._bucket_keys(user_id, category, signature):
+                candidates |= self._buckets.get(key, set())
+            duplicates = []
+            for item_id in candidates:
+                similarity = float(np.mean(self._posts[item_id][2] == signature))
+                if similarity >= DUPLICATE_MIN_SIMILARITY:
+                    duplicates.append((similarity, item_id, self._posts[item_id][3]))
+        return sorted(duplicates, reverse=True)
+
+    def record(self, item_id, user_id, category, title, description):
+        """Ajouter une annonce nouvellement sauvegardée, si les annonces de son propriétaire sont chargées
+           (sinon leur premier chargement la verra)."""
+        with self._lock:
+            if user_id in self._loaded_users:
+                self._add(item_id, user_id, category, title, description)
+
+    def forget(self, item_id):
+        """Retirer une annonce qui n'est plus ouverte (ex. récupérée), pour que republier cet objet ne soit pas signalé."""
+        with self._lock:
+            post = self._posts.pop(item_id, None)
+            if post:
+                for key in self._bucket_keys(post[0], post[1], post[2]):
+                    self._buckets.get(key, set()).discard(item_id)
+
+duplicate_post_index = MinHashLSHIndex()
+
+def find_duplicate_posts(user_id, category, title, description):
+    """Annonces ouvertes de l'utilisateur que la nouvelle dupliquerait probablement, en (similarité, id d'objet, titre),
+       la meilleure d'abord."""
+    try:
+        return duplicate_post_index.find(user_id, category, title, description)
+    except mysql.connector.Error as e:
+        print(f"Erreur lors de la recherche d'annonces en double : {e}")
+        return []
+
+def get_text_terms(text):
+    """Mots repliés de text, tels que les mots-clés des recherches enregistrées sont comparés."""
+    return {fold_search_text(word) for word in get_search_words(text)}
+
+class SavedSearchIndex:
+    """Index inversé des recherches enregistrées. Chaque recherche est référencée sous une seule clé, son terme le plus
+       sélectif, et un objet ne peut correspondre qu'aux recherches référencées sous l'un de ses propres termes, donc
+       rapprocher un nouvel objet lit ces compartiments au lieu de chaque recherche enregistrée. Chargé à la première
+       utilisation, puis tenu à jour par save_search.
+    """
+    def __init__(self, ttl=None):
+        self.ttl = ttl
+        self._buckets = None # clé -> liste de recherches enregistrées, None tant que non chargé
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(search):
+        if search['words']:
+            return ('word', max(search['words'], key=len))
+        for field in ('location', 'category', 'status'):
+            if search[field]:
+                return (field, search[field])
+        return ('any',)
+
+    def _add(self, search_id, user_id, category, location, keywords, status):
+        search = {'id': search_id, 'user_id': user_id, 'words': get_text_terms(keywords),
+                  'category': fold_search_text(category) if category else None,
+                  'location': fold_search_text(location) if location else None, 'status': status}
+        self._buckets.setdefault(self._key(search), []).append(search)
+
+    def _load(self):
+        connection = None
+        cursor = None
+        try:
+            connection = get_mysql_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT id_recherche, id_utilisateur, categorie, lieu, mots_cles, statut_objet FROM recherches_enregistrees")
+            self._buckets = {}
+            for row in cursor.fetchall():
+                self._add(*row)
+            self._loaded_at = time.monotonic()
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+    def match(self, poster_id, title, category, location, status, description):
+        """(id de recherche, id de l'abonné) des recherches des autres utilisateurs que cet objet satisfait.
+           Lève mysql.connector.Error si l'index devait être chargé et n'a pas pu l'être.
+        """
+        words = get_text_terms(f"{title} {description or ''}")
+        category = fold_search_text(category) if category else None
+        location = fold_search_text(location) if location else None
+        keys = [('word', word) for word in words] + [('location', location), ('category', category), ('status', status), ('any',)]
+        with self._lock:
+            if self._buckets is None or (self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl):
+                self._load()
+            candidates = [search for key in keys for search in self._buckets.get(key, ())]
+        return [(search['id'], search['user_id']) for search in candidates
+                if search['user_id'] != poster_id
+                and search['words'] <= words
+                and search['category'] in (None, category)
+                and search['location'] in (None, location)
+                and search['status'] in (None, status)]
+
+    def record(self, search_id, user_id, category, location, keywords, status):
+        with self._lock:
+            if self._buckets is not None: # Pas encore chargé ; le premier chargement la verra
+                self._add(search_id, user_id, category, location, keywords, status)
+
+saved_search_index = SavedSearchIndex(SAVED_SEARCH_INDEX_TTL_SECONDS)
+
+def save_search(user_id, category=None, location=None, keywords=None, status=None):
+    """Enregistrer une recherche pour que son propriétaire soit alerté des objets correspondants publiés ensuite."""
+    if not connect_to_mysql():
+        return False, "Échec de la connexion à la base de données"
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
+        cursor.execute(
+            "INSERT INTO recherches_enregistrees (id_utilisateur, categorie, lieu, mots_cles, statut_objet) VALUES (%s, %s, %s, %s, %s)",
+            (user_id, category, location, keywords, status)
+        )
+        saved_search_index.record(cursor.lastrowid, user_id, category, location, keywords, status)
+        kind = {'lost': "objet perdu", 'found': "objet trouvé"}.get(status, "objet")
+        return True, f"Recherche enregistrée. Vous serez alerté quand un {kind} correspondant sera publié."
+    except mysql.connector.Error as e:
+        print(f"Erreur lors de l'enregistrement de la recherche : {e}")
+        return False, f"Échec de l'enregistrement de la recherche : {e}"
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+def notify_saved_searches(item_id, poster_id, title, category, location, status, description):
+    """Créer une alerte pour chaque recherche enregistrée (d'un autre utilisateur) qu'un objet nouvellement sauvegardé satisfait."""
+    connection = None
+    cursor = None
+    try:
+        matches = saved_search_index.match(poster_id, title, category, location, status, description)
+        if not matches:
+            return
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT IGNORE INTO alertes_recherche (id_utilisateur, id_recherche, id_objet) VALUES (%s, %s, %s)",
+            [(subscriber_id, search_id, item_id) for search_id, subscriber_id in matches]
+        )
+    except Exception as e:
+        print(f"Erreur lors de la création des alertes de recherche : {e}") # L'objet est sauvegardé ; seules ses alertes sont perdues
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+def get_search_alerts(user_id):
+    """Alertes de recherche non vues d'un utilisateur avec le titre, le statut et le lieu de l'objet, les plus récentes d'abord."""
+    if not connect_to_mysql():
+        return []
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(
+            """SELECT a.id_alerte AS alert_id, o.titre, o.statut_objet, o.lieu
+               FROM alertes_recherche a
+               JOIN objets o ON a.id_objet = o.id_objet
+               WHERE a.id_utilisateur = %s AND a.vue = FALSE
+               ORDER BY a.date_alerte DESC""",
+            (user_id,)
+        )
+        return cursor.fetchall()
+    except mysql.connector.Error as e:
+        print(f"Erreur lors de la récupération des alertes de recherche : {e}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+def mark_search_alerts_seen(user_id, alert_ids):
+    if not alert_ids or not connect_to_mysql():
+        return
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor()
+        cursor.execute(
+            f"UPDATE alertes_recherche SET vue = TRUE WHERE id_utilisateur = %s AND id_alerte IN ({', '.join(['%s'] * len(alert_ids))})",
+            (user_id, *alert_ids)
+        )
+    except mysql.connector.Error as e:
+        print(f"Erreur lors du marquage des alertes de recherche comme vues : {e}")
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
 
 # --- Fonctions de gestion des réclamations ---
 
-def submit_claim(item_id, claimant_id, reason, evidence_image_data=None):
-    """Soumettre une réclamation pour un objet."""
+def submit_claim(item_id, claimant_id, reason, evidence_image_data=None, evidence_image_path=None):
+    """Soumettre une réclamation pour un objet. La preuve est fournie soit en octets, soit par un chemin de fichier."""
     if not connect_to_mysql() or not connect_to_mongodb():
         return False, "Échec de la connexion à la base de données"
 
     mongo_detail_id_obj = None
     mongo_detail_id_str = None
+    evidence_hash = None
+    connection = None
     cursor = None
 
     try:
-        if evidence_image_data: 
-            mongo_result = mongo_db.claims_detail.insert_one({
-                "evidence_image": Binary(evidence_image_data),
+        if evidence_image_path or evidence_image_data: 
+            evidence_hash, thumbnails = acquire_image_blob(
+                EVIDENCE_THUMBNAIL_SIZE, evidence_image_data, evidence_image_path,
+                metadata={"kind": "claim_evidence"})
+            claim_detail = {
+                "evidence_image_hash": evidence_hash,
+                "thumbnails": thumbnails,
                 "notes": f"Preuve pour la réclamation sur l'objet {item_id} par l'utilisateur {claimant_id}" 
-            })
+            }
+            mongo_result = mongo_db.claims_detail.insert_one(claim_detail)
             mongo_detail_id_obj = mongo_result.inserted_id
             mongo_detail_id_str = str(mongo_detail_id_obj)
 
         # 2. Sauvegarder les détails de la réclamation dans MySQL
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         cursor.execute(
             """INSERT INTO reclamations (id_objet_reclame, id_utilisateur_reclamant, motif_reclamation, statut_reclamation, id_mongo_preuve, date_soumission_reclamation)
                VALUES (%s, %s, %s, %s, %s, %s)""",
             (item_id, claimant_id, reason, 'pending', mongo_detail_id_str, datetime.datetime.now())
         ) 
 
-        mysql_connection.commit()
+        connection.commit()
         return True, "Réclamation soumise avec succès !"
 
     except Exception as e:
@@ -437,24 +1939,46 @@ def submit_claim(item_id, claimant_id, reason, evidence_image_data=None):
                 print(f"Nettoyage du détail de réclamation MongoDB {mongo_detail_id_str} en raison d'une erreur.")
             except Exception as mongo_del_err:
                 print(f"Erreur lors du nettoyage du détail de réclamation MongoDB {mongo_detail_id_str}: {mongo_del_err}")
+        release_image_blob(evidence_hash)
         try:
-            mysql_connection.rollback()
+            if connection:
+                connection.rollback()
         except Exception as rollback_err:
             print(f"Erreur lors de l'annulation de la transaction MySQL : {rollback_err}")
 
         return False, f"Échec de la soumission de la réclamation : {e}"
     finally:
         if cursor:
-            cursor.close() 
+            cursor.close()
+        if connection:
+            connection.close()
+
+def attach_claim_evidence(claims_mysql):
+    """Ajouter 'has_evidence' à chaque ligne de réclamation, résolu en une passe groupée sans charger les images.
+       Les cartes chargent les miniatures de preuve à la demande via get_claim_evidence_thumbnails.
+    """
+    try:
+        details_by_id, _ = fetch_details_by_ids(
+            mongo_db.claims_detail, [claim.get('id_mongo_preuve') for claim in claims_mysql], {"evidence_image": 0, "thumbnails": 0})
+    except Exception as e:
+        print(f"Erreur lors de la récupération groupée des détails de réclamation : {e}")
+        details_by_id = {}
+
+    for claim in claims_mysql:
+        claim['has_evidence'] = claim.get('id_mongo_preuve') in details_by_id
+    return claims_mysql
+
 def get_claims_for_item(item_id):
     """Récupérer toutes les réclamations pour un objet spécifique, en joignant avec les infos de l'utilisateur réclamant."""
     if not connect_to_mysql():
         print("Échec de la connexion à la base de données dans get_claims_for_item")
         return []
     claims = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
         query = """
         SELECT r.id_reclamation AS claim_id, r.id_objet_reclame, r.id_utilisateur_reclamant, r.motif_reclamation, r.statut_reclamation AS claim_status,
                r.id_mongo_preuve, r.date_soumission_reclamation AS claim_created_at,
@@ -467,19 +1991,8 @@ def get_claims_for_item(item_id):
         cursor.execute(query, (item_id,)) 
         claims_mysql = cursor.fetchall()
 
-        # Récupérer facultativement les données d'image de preuve de MongoDB pour chaque réclamation
-        for claim in claims_mysql:
-            mongo_detail_id_str = claim.get('id_mongo_preuve')
-            evidence_image_data = None
-            if mongo_detail_id_str:
-                try:
-                    claim_detail = mongo_db.claims_detail.find_one({"_id": ObjectId(mongo_detail_id_str)})
-                    if claim_detail:
-                        evidence_image_data = claim_detail.get('evidence_image')
-                except Exception as e:
-                    print(f"Erreur lors de la récupération du détail de la réclamation ({mongo_detail_id_str}): {e}")
-            claim['evidence_image_data'] = evidence_image_data
-            claims.append(claim)
+        # Vérifier la présence de preuves dans MongoDB en une passe groupée (images chargées à la demande)
+        claims = attach_claim_evidence(claims_mysql)
 
         return claims
     except mysql.connector.Error as e:
@@ -491,6 +2004,50 @@ def get_claims_for_item(item_id):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
+
+
+def get_claims_on_user_items(owner_id):
+    """Récupérer en une seule requête toutes les réclamations sur les objets non récupérés d'un propriétaire,
+       les plus récentes d'abord, avec les infos du réclamant et de l'objet. Les preuves sont résolues en une passe groupée.
+    """
+    if not connect_to_mysql() or not connect_to_mongodb():
+        print("Échec de la connexion à la base de données dans get_claims_on_user_items")
+        return []
+    claims = []
+    connection = None
+    cursor = None
+    try:
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
+        query = """
+        SELECT r.id_reclamation AS claim_id, r.id_objet_reclame, r.id_utilisateur_reclamant, r.motif_reclamation, r.statut_reclamation AS claim_status,
+               r.id_mongo_preuve, r.date_soumission_reclamation AS claim_created_at,
+               u.nom_utilisateur AS claimant_username, o.titre AS item_title
+        FROM reclamations r
+        JOIN objets o ON r.id_objet_reclame = o.id_objet
+        JOIN utilisateurs u ON r.id_utilisateur_reclamant = u.id_utilisateur
+        WHERE o.id_utilisateur_proprietaire = %s AND o.statut_objet != %s
+        ORDER BY r.date_soumission_reclamation DESC
+        """
+        cursor.execute(query, (owner_id, 'recovered'))
+        claims_mysql = cursor.fetchall()
+
+        claims = attach_claim_evidence(claims_mysql)
+
+        return claims
+    except mysql.connector.Error as e:
+        print(f"Erreur lors de la récupération des réclamations sur les objets de l'utilisateur depuis MySQL : {e}")
+        return []
+    except Exception as e:
+        print(f"Une erreur s'est produite lors de la récupération des réclamations sur les objets de l'utilisateur : {e}")
+        return claims 
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
 
 
 def get_claims_by_claimant(claimant_id):
@@ -499,9 +2056,11 @@ def get_claims_by_claimant(claimant_id):
         print("Échec de la connexion à la base de données dans get_claims_by_claimant")
         return []
     claims = []
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor(dictionary=True)
+        connection = get_mysql_connection()
+        cursor = connection.cursor(dictionary=True)
         query = """
         SELECT r.id_reclamation AS claim_id, r.id_objet_reclame, r.id_utilisateur_reclamant, r.motif_reclamation, r.statut_reclamation AS claim_status,
                r.id_mongo_preuve, r.date_soumission_reclamation AS claim_created_at,
@@ -514,32 +2073,8 @@ def get_claims_by_claimant(claimant_id):
         cursor.execute(query, (claimant_id,))
         claims_mysql = cursor.fetchall()
 
-        # Récupérer les détails (image de l'objet, image de preuve de la réclamation) de MongoDB
-        for claim in claims_mysql:
-            mongo_detail_id_str = claim.get('id_mongo_preuve')
-            evidence_image_data = None
-            if mongo_detail_id_str:
-                try:
-                    claim_detail = mongo_db.claims_detail.find_one({"_id": ObjectId(mongo_detail_id_str)})
-                    if claim_detail:
-                        evidence_image_data = claim_detail.get('evidence_image')
-                except Exception as e:
-                    print(f"Erreur lors de la récupération du détail de la réclamation ({mongo_detail_id_str}): {e}")
-            claim['evidence_image_data'] = evidence_image_data
-
-            # Récupérer l'image de l'objet
-            item_mongo_id_str = claim.get('item_mongo_id') 
-            item_image_data = None
-            if item_mongo_id_str:
-                 try:
-                     item_detail = mongo_db.items_detail.find_one({"_id": ObjectId(item_mongo_id_str)})
-                     if item_detail:
-                         item_image_data = item_detail.get('image')
-                 except Exception as e:
-                      print(f"Erreur lors de la récupération du détail de l'objet pour la réclamation ({item_mongo_id_str}): {e}")
-            claim['item_image_data'] = item_image_data 
-
-            claims.append(claim)
+        # Vérifier la présence de preuves dans MongoDB en une passe groupée (images chargées à la demande)
+        claims = attach_claim_evidence(claims_mysql)
 
         return claims
     except mysql.connector.Error as e:
@@ -551,30 +2086,38 @@ def get_claims_by_claimant(claimant_id):
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def update_claim_status(claim_id, new_status):
     """Mettre à jour le statut d'une réclamation spécifique."""
     if not connect_to_mysql():
         return False, "Échec de la connexion à la base de données"
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
         cursor.execute(
             "UPDATE reclamations SET statut_reclamation = %s WHERE id_reclamation = %s",
             (new_status, claim_id) 
         )
-        mysql_connection.commit()
+        connection.commit()
         # Traduire les statuts dans le message
         status_fr = {'pending': 'en attente', 'accepted': 'acceptée', 'rejected': 'rejetée', 'recovered': 'récupéré'}
         return True, f"Statut de la réclamation {claim_id} mis à jour à {status_fr.get(new_status, new_status)}"
     except mysql.connector.Error as err:
         print(f"Erreur lors de la mise à jour du statut de la réclamation : {err}")
-        mysql_connection.rollback()
+        if connection:
+            connection.rollback()
         return False, f"Échec de la mise à jour du statut de la réclamation : {err}"
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def accept_claim(claim_id, item_id):
@@ -586,9 +2129,12 @@ def accept_claim(claim_id, item_id):
 
     if not connect_to_mysql():
         return False, "Échec de la connexion à la base de données"
+    connection = None
     cursor = None
     try:
-        cursor = mysql_connection.cursor()
+        connection = get_mysql_connection()
+        connection.start_transaction()
+        cursor = connection.cursor()
 
         # 1. Mettre à jour le statut de la réclamation 'acceptée'
         cursor.execute("UPDATE reclamations SET statut_reclamation = %s WHERE id_reclamation = %s", ('accepted', claim_id))
@@ -607,16 +2153,21 @@ def accept_claim(claim_id, item_id):
         )
         rejected_count = cursor.rowcount 
 
-        mysql_connection.commit()
+        connection.commit()
+        image_similarity_index.record(item_id, 'recovered')
+        duplicate_post_index.forget(item_id)
         return True, f"Réclamation {claim_id} acceptée. Objet {item_id} marqué comme récupéré. {rejected_count} autres réclamations en attente rejetées."
 
     except Exception as err: 
         print(f"Erreur lors de l'acceptation de la réclamation : {err}")
-        mysql_connection.rollback()
+        if connection:
+            connection.rollback()
         return False, f"Échec de l'acceptation de la réclamation : {err}"
     finally:
         if cursor:
             cursor.close()
+        if connection:
+            connection.close()
 
 
 def reject_claim(claim_id):
@@ -632,7 +2183,6 @@ class ClaimDialog(QDialog):
         super().__init__(parent)
         self.item_id = item_id
         self.selected_evidence_path = None
-        self.evidence_image_data = None
 
         self.setWindowTitle("Soumettre une réclamation")
         self.setMinimumWidth(450)
@@ -690,40 +2240,589 @@ class ClaimDialog(QDialog):
                                                   "Images (*.png *.jpg *.jpeg *.bmp *.gif)", options=options)
         if file_path:
             try:
-                pixmap = QPixmap(file_path)
-                if pixmap.isNull():
+                preview_image = decode_image_scaled(file_path, QSize(40, 40))
+                if preview_image.isNull():
                     raise ValueError("Fichier image invalide")
 
-                with open(file_path, 'rb') as f:
-                    self.evidence_image_data = f.read()
-                    if len(self.evidence_image_data) > 16 * 1024 * 1024: # Vérifier la taille (16 Mo)
-                        QMessageBox.warning(self, "Image trop grande", "L'image de preuve doit faire moins de 16 Mo.")
-                        self.evidence_image_data = None
-                        self.selected_evidence_path = None
-                        self.evidence_preview_label.setText("Image trop grande.")
-                        self.evidence_preview_label.setPixmap(QPixmap()) 
-                        return
+                # Vérifier la limite de taille du stockage configuré (le fichier est lu à la soumission)
+                size_limit = image_size_limit()
+                if size_limit and os.path.getsize(file_path) > size_limit:
+                    QMessageBox.warning(self, "Image trop grande", f"L'image de preuve doit faire moins de {size_limit // (1024 * 1024)} Mo.")
+                    self.selected_evidence_path = None
+                    self.evidence_preview_label.setText("Image trop grande.")
+                    self.evidence_preview_label.setPixmap(QPixmap()) 
+                    return
 
                 self.selected_evidence_path = file_path 
-                preview_pixmap = pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                preview_pixmap = QPixmap.fromImage(preview_image)
                 self.evidence_preview_label.setPixmap(preview_pixmap)
                 self.evidence_preview_label.setToolTip(file_path)
 
             except Exception as e:
                 QMessageBox.warning(self, "Erreur d'image", f"Impossible de charger ou lire l'image : {e}")
                 self.selected_evidence_path = None
-                self.evidence_image_data = None
                 self.evidence_preview_label.setText("Erreur chargement image.")
                 self.evidence_preview_label.setPixmap(QPixmap()) 
 
     def get_claim_data(self):
-        """Retourner la raison de la réclamation et les données de l'image."""
+        """Retourner la raison de la réclamation et le chemin de l'image de preuve (ou None)."""
         reason = self.reason_edit.toPlainText().strip()
         if not reason:
             QMessageBox.warning(self, "Informations manquantes", "Veuillez fournir une raison pour votre réclamation.")
             return None
-        return reason, self.evidence_image_data 
+        return reason, self.selected_evidence_path
+
+
+class PixmapCache:
+    """Cache LRU de pixmaps prêts à afficher, indexé par id de document Mongo et taille cible en pixels physiques.
+       Évince les entrées les moins récemment utilisées dès que leur taille décodée dépasse max_bytes.
+       Les pixmaps sont des objets de l'interface : le cache n'est utilisé que depuis le thread de l'interface.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict() # (mongo_id, largeur, hauteur) -> (QPixmap, coût en octets)
+
+    @staticmethod
+    def key(mongo_id, size):
+        return (str(mongo_id), size.width(), size.height())
+
+    def get(self, mongo_id, size):
+        key = self.key(mongo_id, size)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, mongo_id, size, pixmap):
+        if pixmap is None or pixmap.isNull():
+            return
+        cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        if cost > self.max_bytes:
+            return
+        key = self.key(mongo_id, size)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= previous[1]
+        self._entries[key] = (pixmap, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_cost
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        """Compteurs servant à dimensionner PIXMAP_CACHE_MAX_BYTES."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries), 'bytes': self.total_bytes, 'max_bytes': self.max_bytes,
+            'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+pixmap_cache = PixmapCache(PIXMAP_CACHE_MAX_BYTES)
+
+class BrowsePageLoader(QObject):
+    """Exécute get_all_items dans un thread de travail et renvoie chaque page au thread de l'interface via page_loaded.
+       Chaque requête porte la génération courante ; cancel() en démarre une nouvelle afin que
+       les résultats des chargements dépassés soient ignorés au lieu d'être affichés.
+       Le thread de travail ne se connecte jamais et n'affiche aucun dialogue : le thread de l'interface vérifie
+       les connexions avant request_page, et les erreurs reviennent par page_failed.
+    """
+    page_loaded = pyqtSignal(int, object, bool) # génération, objets, première page
+    page_failed = pyqtSignal(int, str, bool) # génération, message d'erreur, première page
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """Abandonner le chargement en cours, s'il y en a un."""
+        self.cancel_event.set()
+        self.cancel_event = threading.Event()
+        self.generation += 1
+
+    def request_page(self, filters, after, first_page):
+        worker = threading.Thread(target=self.run_page_query,
+                                  args=(self.generation, self.cancel_event, filters, after, first_page),
+                                  daemon=True)
+        worker.start()
+
+    def run_page_query(self, generation, cancel_event, filters, after, first_page):
+        if cancel_event.is_set():
+            return
+        cat_to_send, loc_to_send, include_recovered, search_text = filters
+        try:
+            items = get_all_items(cat_to_send, loc_to_send, include_recovered, after=after, limit=BROWSE_PAGE_SIZE,
+                                  search_text=search_text, connect=False)
+        except Exception as e:
+            if not cancel_event.is_set():
+                self.page_failed.emit(generation, str(e), first_page)
+            return
+        if not cancel_event.is_set():
+            # Mis en file vers le thread de l'interface, puisque cet objet y réside
+            self.page_loaded.emit(generation, items, first_page)
+
+class ItemListModel(QAbstractListModel):
+    """Lignes de la liste de consultation : dicts d'objets de get_all_items et leurs miniatures chargées à la demande."""
+    IMAGE_STATE_ROLE = Qt.UserRole + 1 # 'loading', 'loaded' ou 'missing'
+    TITLE_FIELD = 'titre'
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+        self.images = {} # id_mongo_details -> QPixmap, ou None quand aucune image utilisable n'existe
+        self.rows_by_mongo_id = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        if role == Qt.UserRole:
+            return item
+        if role == Qt.DisplayRole:
+            return item.get(self.TITLE_FIELD)
+        if role == Qt.ToolTipRole:
+            description = item.get('description')
+            return f"{item.get(self.TITLE_FIELD)}\n\n{description}" if description else item.get(self.TITLE_FIELD)
+        mongo_id = self.image_id(item)
+        if role == Qt.DecorationRole:
+            return self.images.get(mongo_id)
+        if role == self.IMAGE_STATE_ROLE:
+            if not mongo_id or (mongo_id in self.images and self.images[mongo_id] is None):
+                return 'missing'
+            return 'loaded' if mongo_id in self.images else 'loading'
+        return None
 
+    def image_id(self, item):
+        """Id mongo sous lequel la miniature de la ligne est récupérée, ou None si elle n'a pas d'image."""
+        return item.get('id_mongo_details')
+
+    def clear(self):
+        self.beginResetModel()
+        self.items = []
+        self.images = {}
+        self.rows_by_mongo_id = {}
+        self.endResetModel()
+
+    def append_items(self, items):
+        if not items:
+            return
+        first_row = len(self.items)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(items) - 1)
+        for row, item in enumerate(items, first_row):
+            self.items.append(item)
+            mongo_id = self.image_id(item)
+            if mongo_id:
+                self.rows_by_mongo_id.setdefault(mongo_id, []).append(row)
+        self.endInsertRows()
+
+    def pending_image_ids(self, first_row, last_row):
+        """Ids mongo des lignes de [first_row, last_row] dont la miniature n'a pas encore été récupérée."""
+        pending = []
+        for item in self.items[first_row:last_row + 1]:
+            mongo_id = self.image_id(item)
+            if mongo_id and mongo_id not in self.images and mongo_id not in pending:
+                pending.append(mongo_id)
+        return pending
+
+    def set_images(self, pixmaps_by_id):
+        for mongo_id, pixmap in pixmaps_by_id.items():
+            self.images[mongo_id] = pixmap
+            for row in self.rows_by_mongo_id.get(mongo_id, []):
+                model_index = self.index(row)
+                self.dataChanged.emit(model_index, model_index, [Qt.DecorationRole])
+
+
+class ItemCardDelegate(QStyledItemDelegate):
+    """Dessine les cartes d'objet de la consultation, l'équivalent peint de create_item_widget.
+       Seules les lignes visibles sont dessinées ; le bouton de réclamation est détecté dans editorEvent.
+    """
+    claim_clicked = pyqtSignal(int)
+
+    CARD_HEIGHT = 200
+    CARD_SPACING = 18
+    MARGIN = 15
+    IMAGE_SIZE = ITEM_THUMBNAIL_SIZE
+    STATUS_COLORS = {'lost': "#ffb74d", 'found': "#81c784", 'recovered': "#78909c"}
+    STATUS_DISPLAY = {'lost': 'PERDU', 'found': 'TROUVÉ', 'recovered': 'RÉCUPÉRÉ', 'unknown': 'INCONNU'}
+
+    def __init__(self, can_claim, parent=None):
+        """can_claim(item) indique si le bouton de réclamation est affiché pour un objet."""
+        super().__init__(parent)
+        self.can_claim = can_claim
+        self.title_font = QFont(FONT_FAMILY)
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+        self.badge_font = QFont(FONT_FAMILY, 9, QFont.Bold)
+        self.text_font = QFont(FONT_FAMILY)
+        self.text_font.setPixelSize(12)
+        self.label_font = QFont(self.text_font)
+        self.label_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(400, self.CARD_HEIGHT + self.CARD_SPACING)
+
+    def card_rect(self, option):
+        return option.rect.adjusted(5, 0, -10, -self.CARD_SPACING)
+
+    def claim_button_rect(self, card):
+        return QRect(card.right() - self.MARGIN - 150, card.bottom() - self.MARGIN - 28, 150, 28)
+
+    def draw_wrapped_text(self, painter, rect, text, max_lines):
+        """Dessiner text replié aux mots sur au plus max_lines lignes depuis le haut de rect, en élidant la dernière
+           ligne quand le texte ne tient pas. Utilise la police courante du painter.
+        """
+        metrics = painter.fontMetrics()
+        utf16 = (text or '').replace('\n', '\u2028').encode('utf-16-le') # Les positions de QTextLayout comptent des unités UTF-16
+        layout = QTextLayout(utf16.decode('utf-16-le'), painter.font())
+        layout.beginLayout()
+        lines = []
+        while len(lines) < max_lines:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(rect.width())
+            lines.append(line)
+        layout.endLayout()
+        for i, line in enumerate(lines):
+            end = line.textStart() + line.textLength()
+            if i == len(lines) - 1 and 2 * end < len(utf16):
+                end = len(utf16) // 2 # Plus de texte que de lignes : élider le reste dans la dernière ligne
+            shown = utf16[2 * line.textStart():2 * end].decode('utf-16-le').replace('\u2028', ' ').rstrip()
+            if end != line.textStart() + line.textLength():
+                shown = metrics.elidedText(shown, Qt.ElideRight, rect.width())
+            painter.drawText(QRect(rect.left(), rect.top() + i * metrics.lineSpacing(), rect.width(), metrics.lineSpacing()),
+                             Qt.AlignLeft | Qt.AlignTop, shown)
+
+    def paint(self, painter, option, index):
+        item = index.data(Qt.UserRole)
+        card = self.card_rect(option)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        painter.setPen(QColor("#e0e0e0"))
+        painter.setBrush(QColor("#ffffff"))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        # --- Zone Image ---
+        image_rect = QRect(card.left() + self.MARGIN, card.top() + self.MARGIN, self.IMAGE_SIZE, self.IMAGE_SIZE)
+        painter.setPen(QColor("#dddddd"))
+        painter.setBrush(QColor("#f0f0f0"))
+        painter.drawRoundedRect(image_rect, 5, 5)
+        pixmap = index.data(Qt.DecorationRole)
+        if pixmap is not None and not pixmap.isNull():
+            target = QRect(QPoint(0, 0), pixmap.size() / pixmap.devicePixelRatio())
+            target.moveCenter(image_rect.center())
+            painter.drawPixmap(target, pixmap)
+        else:
+            painter.setFont(self.text_font)
+            painter.setPen(QColor("#888888"))
+            image_state = index.data(ItemListModel.IMAGE_STATE_ROLE)
+            painter.drawText(image_rect, Qt.AlignCenter, "Chargement..." if image_state == 'loading' else "Pas d'image")
+
+        # --- Zone Détails ---
+        left = image_rect.right() + self.MARGIN
+        details = QRect(left, card.top() + self.MARGIN, card.right() - self.MARGIN - left, card.height() - 2 * self.MARGIN)
+
+        # Ligne supérieure : Titre et Statut
+        item_status = item.get('statut_objet', 'unknown')
+        painter.setFont(self.badge_font)
+        status_text = self.STATUS_DISPLAY.get(item_status, item_status.lower())
+        badge_width = painter.fontMetrics().horizontalAdvance(status_text) + 12
+        badge = QRect(details.right() - badge_width, details.top(), badge_width, painter.fontMetrics().height() + 6)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.STATUS_COLORS.get(item_status, "#bdbdbd")))
+        painter.drawRoundedRect(badge, 4, 4)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignCenter, status_text)
+
+        painter.setFont(self.title_font)
+        painter.setPen(QColor(ACCENT_COLOR))
+        title_rect = QRect(details.left(), details.top(), badge.left() - 10 - details.left(), badge.height())
+        title = painter.fontMetrics().elidedText(item.get('titre', 'Sans Titre'), Qt.ElideRight, title_rect.width())
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+
+        # Section du milieu : Autres détails
+        rows = []
+        if 'proprietaire_nom_utilisateur' in item:
+            rows.append(("Publier par :", item['proprietaire_nom_utilisateur']))
+        rows.append(("Catégorie :", item.get('categorie', 'N/A')))
+        rows.append(("Lieu :", item.get('lieu', 'N/A')))
+        rows.append(("Date :", item.get('date_evenement', 'N/A')))
+        line_height = QFontMetrics(self.text_font).height() + 4
+        label_width = QFontMetrics(self.label_font).horizontalAdvance("Publier par :") + 8
+        y = badge.bottom() + 8
+        for label, value in rows:
+            painter.setFont(self.label_font)
+            painter.setPen(QColor("#333333"))
+            painter.drawText(QRect(details.left(), y, label_width, line_height), Qt.AlignLeft | Qt.AlignVCenter, label)
+            painter.setFont(self.text_font)
+            painter.setPen(QColor("#444444"))
+            value_rect = QRect(details.left() + label_width, y, details.width() - label_width, line_height)
+            painter.drawText(value_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                             painter.fontMetrics().elidedText(str(value), Qt.ElideRight, value_rect.width()))
+            y += line_height
+
+        # Description, élidée aux lignes qui tiennent au-dessus de la rangée de boutons
+        show_claim = self.can_claim(item)
+        button = self.claim_button_rect(card)
+        description_bottom = (button.top() - 4) if show_claim else details.bottom()
+        text_height = QFontMetrics(self.text_font).lineSpacing()
+        visible_lines = max(0, (description_bottom - y - 5) // text_height)
+        if visible_lines:
+            description_rect = QRect(details.left(), y + 5, details.width(), visible_lines * text_height)
+            painter.setFont(self.text_font)
+            painter.setPen(QColor("#555555"))
+            self.draw_wrapped_text(painter, description_rect, item.get('description', 'Aucune description.'), visible_lines)
+
+        # --- Zone Bouton d'Action ---
+        if show_claim:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(PRIMARY_COLOR))
+            painter.drawRoundedRect(button, 4, 4)
+            painter.setFont(self.label_font)
+            painter.setPen(QColor("white"))
+            painter.drawText(button, Qt.AlignCenter, "Réclamer cet objet")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            item = index.data(Qt.UserRole)
+            if self.can_claim(item) and self.claim_button_rect(self.card_rect(option)).contains(event.pos()):
+                self.claim_clicked.emit(item['id_objet'])
+                return True
+        return super().editorEvent(event, model, option, index)
+
+class ClaimListModel(ItemListModel):
+    """Lignes d'une liste de réclamations du profil : dicts de réclamations et leurs miniatures de preuve chargées à la demande."""
+    TITLE_FIELD = 'item_title'
+
+    def image_id(self, claim):
+        return claim.get('id_mongo_preuve') if claim.get('has_evidence') else None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.ToolTipRole and index.isValid():
+            claim = self.items[index.row()]
+            return (f"{claim.get('motif_reclamation', 'Aucune raison fournie.')}\n\n"
+                    f"ID Réclamation : {claim.get('claim_id')}, ID Réclamant : {claim.get('id_utilisateur_reclamant')}")
+        return super().data(index, role)
+
+
+class ClaimCardDelegate(QStyledItemDelegate):
+    """Dessine les cartes de réclamation de la page de profil.
+       Contexte : 'owner_view' (vue propriétaire) ou 'claimant_view' (vue réclamant). Accepter/Rejeter sont détectés dans editorEvent.
+    """
+    accept_clicked = pyqtSignal(int, int) # claim_id, id_objet
+    reject_clicked = pyqtSignal(int) # claim_id
+
+    CARD_HEIGHT = 180
+    CARD_SPACING = 10
+    MARGIN = 10
+    EVIDENCE_SIZE = EVIDENCE_THUMBNAIL_SIZE
+    CARD_COLORS = {'accepted': "#e8f5e9", 'rejected': "#ffebee"}
+    STATUS_COLORS = {'pending': "#ffc107", 'accepted': "#4caf50", 'rejected': "#f44336"}
+    STATUS_DISPLAY = {'pending': 'EN ATTENTE', 'accepted': 'ACCEPTÉE', 'rejected': 'REJETÉE'}
+    ITEM_STATUS_DISPLAY = {'lost': 'PERDU', 'found': 'TROUVÉ', 'recovered': 'RÉCUPÉRÉ', '?': '?'}
+
+    def __init__(self, context, parent=None):
+        super().__init__(parent)
+        self.context = context
+        self.info_font = QFont(FONT_FAMILY)
+        self.info_font.setPixelSize(13)
+        self.info_bold_font = QFont(self.info_font)
+        self.info_bold_font.setBold(True)
+        self.info_italic_font = QFont(self.info_font)
+        self.info_italic_font.setItalic(True)
+        self.badge_font = QFont(FONT_FAMILY, 9, QFont.Bold)
+        self.text_font = QFont(FONT_FAMILY)
+        self.text_font.setPixelSize(12)
+        self.label_font = QFont(self.text_font)
+        self.label_font.setBold(True)
+        self.note_font = QFont(FONT_FAMILY)
+        self.note_font.setPixelSize(11)
+        self.note_font.setItalic(True)
+        self.button_font = QFont(FONT_FAMILY)
+        self.button_font.setPixelSize(11)
+        self.accept_icon = QIcon.fromTheme("dialog-ok-apply")
+        self.reject_icon = QIcon.fromTheme("dialog-cancel")
+
+    REASON_FLAGS = Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap
+
+    def reason_height(self, claim, card_width):
+        """Hauteur de toute la raison de la réclamation repliée à la carte, au moins les deux lignes que CARD_HEIGHT lui laisse."""
+        metrics = QFontMetrics(self.text_font)
+        width = max(card_width - 2 * self.MARGIN - QFontMetrics(self.label_font).horizontalAdvance("Raison : "), 1)
+        text_height = metrics.boundingRect(QRect(0, 0, width, 0), self.REASON_FLAGS, claim.get('motif_reclamation', 'Aucune raison fournie.')).height()
+        return max(text_height, 2 * metrics.lineSpacing())
+
+    def sizeHint(self, option, index):
+        # Les cartes s'agrandissent avec leur raison, pour que le propriétaire la lise en entier avant d'accepter ou de rejeter
+        card_width = option.widget.viewport().width() if option.widget is not None else option.rect.width()
+        extra = self.reason_height(index.data(Qt.UserRole), card_width) - 2 * QFontMetrics(self.text_font).lineSpacing()
+        return QSize(300, self.CARD_HEIGHT + extra + self.CARD_SPACING)
+
+    def card_rect(self, option):
+        return option.rect.adjusted(0, 0, 0, -self.CARD_SPACING)
+
+    def bottom_row_rect(self, card):
+        """Ligne contenant l'aperçu de la preuve à gauche et les boutons du propriétaire à droite."""
+        return QRect(card.left() + self.MARGIN, card.bottom() - self.MARGIN - self.EVIDENCE_SIZE,
+                     card.width() - 2 * self.MARGIN, self.EVIDENCE_SIZE)
+
+    def reject_button_rect(self, card):
+        row = self.bottom_row_rect(card)
+        return QRect(row.right() - 90, row.center().y() - 13, 90, 26)
+
+    def accept_button_rect(self, card):
+        return self.reject_button_rect(card).translated(-96, 0)
+
+    def has_actions(self, claim):
+        return self.context == 'owner_view' and claim.get('claim_status', 'pending') == 'pending'
+
+    def info_segments(self, claim):
+        """La première ligne de la carte, en segments (texte, police)."""
+        if self.context == 'claimant_view':
+            item_status = claim.get('item_status', '?')
+            item_status_text = self.ITEM_STATUS_DISPLAY.get(item_status, item_status.upper())
+            return [("Votre réclamation sur : ", self.info_font),
+                    (claim.get('item_title', 'Objet inconnu'), self.info_bold_font),
+                    (f" (Statut objet : {item_status_text})", self.info_font)]
+        return [("Réclamation par ", self.info_font),
+                (claim.get('claimant_username', 'Utilisateur inconnu'), self.info_bold_font),
+                (" sur : ", self.info_font),
+                (claim.get('item_title', 'Votre Objet'), self.info_italic_font)]
+
+    def draw_segments(self, painter, rect, segments):
+        """Dessiner les segments de texte à la suite sur une seule ligne, en élidant celui qui déborde."""
+        x = rect.left()
+        for text, font in segments:
+            available = rect.right() - x
+            if available <= 0:
+                break
+            painter.setFont(font)
+            shown = painter.fontMetrics().elidedText(text, Qt.ElideRight, available)
+            painter.drawText(QRect(x, rect.top(), available, rect.height()), Qt.AlignLeft | Qt.AlignVCenter, shown)
+            if shown != text:
+                break
+            x += painter.fontMetrics().horizontalAdvance(shown)
+
+    def draw_button(self, painter, rect, color, icon, text):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setFont(self.button_font)
+        content_width = painter.fontMetrics().horizontalAdvance(text)
+        icon_size = 14 if not icon.isNull() else 0
+        if icon_size:
+            content_width += icon_size + 4
+        x = rect.center().x() - content_width // 2
+        if icon_size:
+            icon.paint(painter, QRect(x, rect.center().y() - icon_size // 2, icon_size, icon_size))
+            x += icon_size + 4
+        painter.setPen(QColor("white"))
+        painter.drawText(QRect(x, rect.top(), rect.right() - x, rect.height()), Qt.AlignLeft | Qt.AlignVCenter, text)
+
+    def paint(self, painter, option, index):
+        claim = index.data(Qt.UserRole)
+        card = self.card_rect(option)
+        claim_status = claim.get('claim_status', 'pending')
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        painter.setPen(QColor("#cccccc"))
+        painter.setBrush(QColor(self.CARD_COLORS.get(claim_status, "#ffffff")))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+        content = card.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+        # Ligne du haut : qui réclame quoi, et le statut de la réclamation
+        painter.setFont(self.badge_font)
+        status_text = self.STATUS_DISPLAY.get(claim_status, claim_status.upper())
+        badge_width = painter.fontMetrics().horizontalAdvance(status_text) + 12
+        badge = QRect(content.right() - badge_width, content.top(), badge_width, painter.fontMetrics().height() + 6)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(self.STATUS_COLORS.get(claim_status, "#bdbdbd")))
+        painter.drawRoundedRect(badge, 4, 4)
+        painter.setPen(QColor("white"))
+        painter.drawText(badge, Qt.AlignCenter, status_text)
+
+        painter.setPen(QColor("#222222"))
+        info_rect = QRect(content.left(), content.top(), badge.left() - 10 - content.left(), badge.height())
+        self.draw_segments(painter, info_rect, self.info_segments(claim))
+
+        # Raison de la réclamation, en entier (sizeHint lui a fait de la place)
+        y = badge.bottom() + 8
+        text_height = QFontMetrics(self.text_font).lineSpacing()
+        painter.setFont(self.label_font)
+        painter.setPen(QColor("#333333"))
+        label_width = painter.fontMetrics().horizontalAdvance("Raison : ")
+        painter.drawText(QRect(content.left(), y, label_width, text_height), Qt.AlignLeft | Qt.AlignTop, "Raison :")
+        painter.setFont(self.text_font)
+        reason_rect = QRect(content.left() + label_width, y, content.width() - label_width, self.reason_height(claim, card.width()))
+        painter.drawText(reason_rect, self.REASON_FLAGS, claim.get('motif_reclamation', 'Aucune raison fournie.'))
+
+        # Date de la réclamation
+        y = reason_rect.bottom() + 4
+        created_at_raw = claim.get('claim_created_at', '')
+        created_at_str = str(created_at_raw).split('.')[0] if created_at_raw else 'Date inconnue'
+        painter.setFont(self.note_font)
+        painter.setPen(QColor("#666666"))
+        painter.drawText(QRect(content.left(), y, content.width(), painter.fontMetrics().height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, f"Soumis le : {created_at_str}")
+
+        # Ligne du bas : aperçu de la preuve et actions du propriétaire
+        row = self.bottom_row_rect(card)
+        if claim.get('has_evidence'):
+            evidence_rect = QRect(row.left(), row.top(), self.EVIDENCE_SIZE, self.EVIDENCE_SIZE)
+            painter.setPen(QColor("#bbbbbb"))
+            painter.setBrush(QColor("#e0e0e0"))
+            painter.drawRoundedRect(evidence_rect, 4, 4)
+            pixmap = index.data(Qt.DecorationRole)
+            if pixmap is not None and not pixmap.isNull():
+                target = QRect(QPoint(0, 0), pixmap.size() / pixmap.devicePixelRatio())
+                target.moveCenter(evidence_rect.center())
+                painter.drawPixmap(target, pixmap)
+            else:
+                painter.setFont(self.button_font)
+                painter.setPen(QColor("#666666"))
+                image_state = index.data(ClaimListModel.IMAGE_STATE_ROLE)
+                painter.drawText(evidence_rect, Qt.AlignCenter, "..." if image_state == 'loading' else "Preuve\nInvalide")
+        else:
+            painter.setFont(self.note_font)
+            painter.setPen(QColor("#888888"))
+            painter.drawText(row, Qt.AlignLeft | Qt.AlignVCenter, "Aucune preuve fournie")
+
+        if self.has_actions(claim):
+            self.draw_button(painter, self.accept_button_rect(card), "#4caf50", self.accept_icon, "Accepter")
+            self.draw_button(painter, self.reject_button_rect(card), "#f44336", self.reject_icon, "Rejeter")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            claim = index.data(Qt.UserRole)
+            if self.has_actions(claim):
+                card = self.card_rect(option)
+                if self.accept_button_rect(card).contains(event.pos()):
+                    self.accept_clicked.emit(claim['claim_id'], claim['id_objet_reclame'])
+                    return True
+                if self.reject_button_rect(card).contains(event.pos()):
+                    self.reject_clicked.emit(claim['claim_id'])
+                    return True
+        return super().editorEvent(event, model, option, index)
 
 class TawdrlikApp(QMainWindow):
     def __init__(self):
@@ -733,10 +2832,26 @@ class TawdrlikApp(QMainWindow):
             self.databases_connected = False
         else: 
             self.databases_connected = True
+            threading.Thread(target=warm_search_indexes, daemon=True).start()
 
         self.current_user = None 
         self.selected_image_path = None
 
+        # État de pagination de la page de consultation (voir load_all_items / load_next_browse_page)
+        self.browse_filters = (None, None, False, None)
+        self.browse_next_key = None
+        self.browse_exhausted = True
+        self.browse_loading = False
+        self.browse_loader = BrowsePageLoader(self)
+        self.browse_loader.page_loaded.connect(self.handle_browse_page_loaded)
+        self.browse_loader.page_failed.connect(self.handle_browse_page_failed)
+
+        # Labels d'image en attente que leur carte défile dans la zone visible
+        self.pending_lazy_images = []
+        self.lazy_image_timer = QTimer(self)
+        self.lazy_image_timer.setSingleShot(True)
+        self.lazy_image_timer.timeout.connect(self.load_visible_images)
+
         self.setWindowTitle("Tawdrlik - App") 
         self.setWindowIcon(QIcon('icon.ico')) 
         self.setGeometry(100, 100, 950, 750) 
@@ -749,6 +2864,8 @@ class TawdrlikApp(QMainWindow):
         self.main_layout.setContentsMargins(0, 0, 0, 0) 
 
         self.stacked_widget = QStackedWidget()
+        self.stacked_widget.currentChanged.connect(self.schedule_lazy_image_load)
+        self.stacked_widget.currentChanged.connect(self.handle_page_changed)
         self.main_layout.addWidget(self.stacked_widget, 1) 
         
         # Créer différentes pages
@@ -1121,17 +3238,17 @@ class TawdrlikApp(QMainWindow):
                                                   "Images (*.png *.jpg *.jpeg *.bmp *.gif)", options=options)
         if file_path:
             try:
-                pixmap = QPixmap(file_path)
-                if pixmap.isNull():
+                preview_image = decode_image_scaled(file_path, self.image_preview_label.size())
+                if preview_image.isNull():
                     raise ValueError("Fichier image invalide")
 
-                with open(file_path, 'rb') as f:
-                     image_data_temp = f.read()
-                     if len(image_data_temp) > 16 * 1024 * 1024: # 16 Mo max
-                          QMessageBox.warning(self, "Image trop grande", "L'image de l'objet doit faire moins de 16 Mo.")
+                size_limit = image_size_limit()
+                if size_limit and os.path.getsize(file_path) > size_limit:
+                     QMessageBox.warning(self, "Image trop grande", f"L'image de l'objet doit faire moins de {size_limit // (1024 * 1024)} Mo.")
+                     return
 
                 self.selected_image_path = file_path
-                preview_pixmap = pixmap.scaled(self.image_preview_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                preview_pixmap = QPixmap.fromImage(preview_image)
                 self.image_preview_label.setPixmap(preview_pixmap)
                 self.image_preview_label.setToolTip(file_path) 
 
@@ -1190,6 +3307,14 @@ class TawdrlikApp(QMainWindow):
         self.location_filter.addItem("Tous les lieux") 
         self.location_filter.setStyleSheet(combo_style)
         self.location_filter.setCursor(Qt.PointingHandCursor)
+        self.location_filter.setEditable(True) # Les lieux saisis sont rapprochés avec tolérance (voir TrigramIndex)
+        self.location_filter.setInsertPolicy(QComboBox.NoInsert)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("ex. : portefeuille bleu")
+        self.search_input.setStyleSheet("QLineEdit { padding: 10px; min-width: 200px; font-size: 14px; background-color: white; }")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.returnPressed.connect(self.apply_item_filters)
 
         apply_filter_button = QPushButton(QIcon.fromTheme("edit-find"), " Appliquer le filtre") 
         apply_filter_button.setStyleSheet(f"QPushButton {{ background-color: {ACCENT_COLOR}; color: white; padding: 10px 20px; border-radius: 5px; font-weight: bold; font-size: 14px; border: none; }} QPushButton:hover {{ background-color: #162d40; }}")
@@ -1203,7 +3328,24 @@ class TawdrlikApp(QMainWindow):
         reset_filter_button.setIconSize(reset_filter_button.sizeHint() * 0.6)
         reset_filter_button.clicked.connect(self.reset_item_filters) 
 
+        save_search_button = QPushButton(QIcon.fromTheme("bookmark-new"), " Enregistrer la recherche")
+        save_search_button.setStyleSheet("QPushButton { background-color: #e0e0e0; color: #333; padding: 10px 20px; border-radius: 5px; font-weight: bold; font-size: 14px; border: none; } QPushButton:hover { background-color: #d5d5d5; }")
+        save_search_button.setCursor(Qt.PointingHandCursor)
+        save_search_button.setIconSize(save_search_button.sizeHint() * 0.6)
+        save_search_button.clicked.connect(self.handle_save_search)
+
+        # Objets dont une recherche enregistrée alerte ; la consultation elle-même liste toujours les deux
+        self.alert_status_filter = QComboBox()
+        self.alert_status_filter.addItem("Perdu ou trouvé", None)
+        self.alert_status_filter.addItem("Perdu", 'lost')
+        self.alert_status_filter.addItem("Trouvé", 'found')
+        self.alert_status_filter.setStyleSheet(combo_style.replace("min-width: 180px", "min-width: 130px"))
+        self.alert_status_filter.setCursor(Qt.PointingHandCursor)
+        self.alert_status_filter.setToolTip("M'alerter des objets perdus, trouvés, ou des deux")
+
         filter_layout.addWidget(filter_label)
+        filter_layout.addWidget(QLabel("Recherche :"))
+        filter_layout.addWidget(self.search_input)
         filter_layout.addWidget(QLabel("Catégorie :")) 
         filter_layout.addWidget(self.category_filter)
         filter_layout.addWidget(QLabel("Lieu :")) 
@@ -1211,24 +3353,38 @@ class TawdrlikApp(QMainWindow):
         filter_layout.addSpacing(10)
         filter_layout.addWidget(apply_filter_button)
         filter_layout.addWidget(reset_filter_button)
+        filter_layout.addWidget(self.alert_status_filter)
+        filter_layout.addWidget(save_search_button)
         filter_layout.addStretch()
 
         view_layout.addWidget(filter_container)
 
-        # Zone de liste des objets (Scrollable)
-        
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("border: none; background-color: transparent;")
-
-        scroll_content = QWidget() 
-        self.items_list_layout = QVBoxLayout(scroll_content)
-        self.items_list_layout.setAlignment(Qt.AlignTop)
-        self.items_list_layout.setSpacing(18)
-        self.items_list_layout.setContentsMargins(5, 5, 10, 5)
-
-        scroll_area.setWidget(scroll_content)
-        view_layout.addWidget(scroll_area)
+        # Message de chargement / liste vide, affiché à la place de la liste
+        self.items_status_label = QLabel()
+        self.items_status_label.setAlignment(Qt.AlignCenter)
+        self.items_status_label.setStyleSheet("color: #888; margin: 30px 0;")
+        self.items_status_label.hide()
+        view_layout.addWidget(self.items_status_label)
+
+        # Zone de liste des objets : une liste modèle/vue dont le délégué ne dessine que les cartes visibles
+        self.items_model = ItemListModel(self)
+        self.item_delegate = ItemCardDelegate(self.can_claim_item, self)
+        self.item_delegate.claim_clicked.connect(self.handle_claim_button_click)
+        self.items_view = QListView()
+        self.items_view.setModel(self.items_model)
+        self.items_view.setItemDelegate(self.item_delegate)
+        self.items_view.setUniformItemSizes(True)
+        self.items_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.items_view.verticalScrollBar().setSingleStep(20)
+        self.items_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.items_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.items_view.setFocusPolicy(Qt.NoFocus)
+        self.items_view.setStyleSheet("QListView { border: none; background-color: transparent; }")
+        self.items_view.verticalScrollBar().valueChanged.connect(self.schedule_lazy_image_load)
+        # Récupérer la page suivante à l'approche du bas, ou quand une page ne remplit pas la vue
+        self.items_view.verticalScrollBar().valueChanged.connect(self.check_browse_scroll_position)
+        self.items_view.verticalScrollBar().rangeChanged.connect(self.check_browse_scroll_position)
+        view_layout.addWidget(self.items_view)
 
         self.stacked_widget.addWidget(view_items_widget)
 
@@ -1301,6 +3457,7 @@ class TawdrlikApp(QMainWindow):
         self.user_items_layout.setSpacing(15)
         self.user_items_layout.setContentsMargins(10, 10, 10, 10)
         items_scroll_area.setWidget(items_scroll_content)
+        items_scroll_area.verticalScrollBar().valueChanged.connect(self.schedule_lazy_image_load)
         my_items_layout.addWidget(items_scroll_area)
         splitter_layout.addWidget(my_items_group)
 
@@ -1316,32 +3473,26 @@ class TawdrlikApp(QMainWindow):
         
         claims_on_my_items_group = QGroupBox("Réclamations Reçues sur Mes Objets") 
         claims_on_my_items_layout_outer = QVBoxLayout(claims_on_my_items_group)
-        claims_on_items_scroll = QScrollArea()
-        claims_on_items_scroll.setWidgetResizable(True)
-        claims_on_items_scroll.setStyleSheet("border: 1px solid #e0e0e0; border-radius: 5px; background-color: #f8f8f8;") 
-        claims_on_items_content = QWidget()
-        self.claims_on_my_items_layout = QVBoxLayout(claims_on_items_content) 
-        self.claims_on_my_items_layout.setAlignment(Qt.AlignTop)
-        self.claims_on_my_items_layout.setSpacing(10) 
-        self.claims_on_my_items_layout.setContentsMargins(8, 8, 8, 8) 
-        claims_on_items_scroll.setWidget(claims_on_items_content)
-        claims_on_my_items_layout_outer.addWidget(claims_on_items_scroll)
+        self.claims_on_my_items_status_label = self.create_claim_status_label()
+        claims_on_my_items_layout_outer.addWidget(self.claims_on_my_items_status_label)
+        self.claims_on_my_items_model = ClaimListModel(self)
+        self.claims_on_my_items_delegate = ClaimCardDelegate('owner_view', self)
+        self.claims_on_my_items_delegate.accept_clicked.connect(self.handle_accept_claim)
+        self.claims_on_my_items_delegate.reject_clicked.connect(self.handle_reject_claim)
+        self.claims_on_my_items_view = self.create_claim_list_view(self.claims_on_my_items_model, self.claims_on_my_items_delegate)
+        claims_on_my_items_layout_outer.addWidget(self.claims_on_my_items_view)
         claims_management_layout.addWidget(claims_on_my_items_group, 1) 
 
         # Mes Réclamations Soumises (pour les Réclamants)
         
         my_submitted_claims_group = QGroupBox("Mes Réclamations Soumises")
         my_submitted_claims_layout_outer = QVBoxLayout(my_submitted_claims_group)
-        my_claims_scroll = QScrollArea()
-        my_claims_scroll.setWidgetResizable(True)
-        my_claims_scroll.setStyleSheet("border: 1px solid #e0e0e0; border-radius: 5px; background-color: #f8f8f8;")
-        my_claims_content = QWidget()
-        self.my_claims_layout = QVBoxLayout(my_claims_content) 
-        self.my_claims_layout.setAlignment(Qt.AlignTop)
-        self.my_claims_layout.setSpacing(10)
-        self.my_claims_layout.setContentsMargins(8, 8, 8, 8)
-        my_claims_scroll.setWidget(my_claims_content)
-        my_submitted_claims_layout_outer.addWidget(my_claims_scroll)
+        self.my_claims_status_label = self.create_claim_status_label()
+        my_submitted_claims_layout_outer.addWidget(self.my_claims_status_label)
+        self.my_claims_model = ClaimListModel(self)
+        self.my_claims_delegate = ClaimCardDelegate('claimant_view', self)
+        self.my_claims_view = self.create_claim_list_view(self.my_claims_model, self.my_claims_delegate)
+        my_submitted_claims_layout_outer.addWidget(self.my_claims_view)
         claims_management_layout.addWidget(my_submitted_claims_group, 1) 
 
         splitter_layout.addWidget(claims_management_group)
@@ -1349,6 +3500,28 @@ class TawdrlikApp(QMainWindow):
 
         self.stacked_widget.addWidget(profile_widget)
 
+    def create_claim_list_view(self, model, delegate):
+        """Une liste de réclamations dont le délégué ne dessine que les cartes visibles."""
+        view = QListView()
+        view.setModel(model)
+        view.setItemDelegate(delegate)
+        view.setResizeMode(QListView.Adjust) # La hauteur des cartes dépend de la largeur à laquelle leur raison est repliée
+        view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        view.verticalScrollBar().setSingleStep(20)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view.setSelectionMode(QAbstractItemView.NoSelection)
+        view.setFocusPolicy(Qt.NoFocus)
+        view.setStyleSheet("QListView { border: 1px solid #e0e0e0; border-radius: 5px; background-color: #f8f8f8; padding: 8px; }")
+        view.verticalScrollBar().valueChanged.connect(self.schedule_lazy_image_load)
+        return view
+
+    def create_claim_status_label(self):
+        """Message de chargement / liste vide affiché au-dessus d'une liste de réclamations."""
+        status_label = QLabel()
+        status_label.setAlignment(Qt.AlignCenter)
+        status_label.hide()
+        return status_label
+
 
     # --- Méthodes de gestion d'événements ---
     
@@ -1439,8 +3612,8 @@ class TawdrlikApp(QMainWindow):
             self.profile_username_label.setText("Nom d'utilisateur : ")
             self.profile_email_label.setText("Email : ") 
             self.clear_layout(self.user_items_layout)
-            self.clear_layout(self.claims_on_my_items_layout)
-            self.clear_layout(self.my_claims_layout) 
+            self.claims_on_my_items_model.clear()
+            self.my_claims_model.clear()
             self.show_flash_message(f"{logged_out_user} déconnecté avec succès.")
 
 
@@ -1500,26 +3673,34 @@ class TawdrlikApp(QMainWindow):
             QMessageBox.warning(self, "Erreur de soumission", "Veuillez sélectionner une image pour l'objet.") 
             return
 
-        # Lire les données de l'image
-        image_data = None 
+        # Vérifier la taille de l'image ; elle est lue (ou écrite en flux dans GridFS) directement depuis le disque par save_item
         try:
-            with open(self.selected_image_path, 'rb') as f:
-                image_data = f.read()
-            if len(image_data) > 16 * 1024 * 1024: # 16 Mo max
-                 QMessageBox.warning(self, "Erreur d'image", "L'image sélectionnée est trop grande (max 16 Mo).")
+            size_limit = image_size_limit()
+            if size_limit and os.path.getsize(self.selected_image_path) > size_limit:
+                 QMessageBox.warning(self, "Erreur d'image", f"L'image sélectionnée est trop grande (max {size_limit // (1024 * 1024)} Mo).")
                  return
         except Exception as e:
             QMessageBox.warning(self, "Erreur d'image", f"Impossible de lire le fichier image : {e}")
             return 
 
+        # Republications et doubles envois : confirmer avant de sauvegarder une copie proche d'une annonce ouverte
+        duplicates = find_duplicate_posts(self.current_user['id_utilisateur'], category, title, description)
+        if duplicates:
+            reply = QMessageBox.question(self, "Doublon possible",
+                                         f"Cela ressemble à un objet que vous avez déjà publié : « {duplicates[0][2]} ».\n"
+                                         "Le publier quand même ?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+
         # Sauvegarder l'objet
         success, message = save_item( 
             self.current_user['id_utilisateur'], title, category, location, date,
-            self.current_item_status, description, image_data 
+            self.current_item_status, description, image_path=self.selected_image_path
         )
 
         if success:
-            self.show_flash_message(message) 
+            self.show_flash_message(message, duration=8000) # Assez long pour lire les correspondances suggérées
             self.show_view_items_page() 
         else:
             QMessageBox.critical(self, "Erreur lors de la sauvegarde de l'objet", message) 
@@ -1546,12 +3727,15 @@ class TawdrlikApp(QMainWindow):
         self.location_filter.addItems(get_unique_locations()) 
         loc_index = self.location_filter.findText(current_loc)
         self.location_filter.setCurrentIndex(loc_index if loc_index != -1 else 0)
+        if loc_index == -1 and current_loc:
+            self.location_filter.setEditText(current_loc)
 
         self.stacked_widget.setCurrentIndex(4)
         self.load_all_items(
              self.category_filter.currentText(),
              self.location_filter.currentText(),
-             include_recovered=False 
+             include_recovered=False,
+             search_text=self.search_input.text()
         )
 
 
@@ -1561,7 +3745,8 @@ class TawdrlikApp(QMainWindow):
         self.load_all_items(
             self.category_filter.currentText(),
             self.location_filter.currentText(),
-            include_recovered=False  
+            include_recovered=False,
+            search_text=self.search_input.text()
         )
 
     def reset_item_filters(self):
@@ -1569,39 +3754,131 @@ class TawdrlikApp(QMainWindow):
         if not self.current_user: return
         self.category_filter.setCurrentIndex(0) 
         self.location_filter.setCurrentIndex(0)
+        self.search_input.clear()
         self.load_all_items(include_recovered=False)  
 
+    def handle_save_search(self):
+        """Enregistrer la catégorie, le lieu, les mots-clés et le choix perdu/trouvé courants comme recherche à surveiller"""
+        if not self.current_user: return
+        category = self.category_filter.currentText()
+        location = self.location_filter.currentText().strip()
+        keywords = self.search_input.text().strip()
+        category = category if category != "Toutes les catégories" else None
+        location = location if location and location != "Tous les lieux" else None
+        if not category and not location and not get_search_words(keywords):
+            QMessageBox.warning(self, "Enregistrer la recherche", "Choisissez une catégorie, un lieu ou des mots-clés à enregistrer.")
+            return
+        success, message = save_search(self.current_user['id_utilisateur'], category, location, keywords or None,
+                                       status=self.alert_status_filter.currentData())
+        self.show_flash_message(message, is_error=not success)
+
 
-    def load_all_items(self, filter_category=None, filter_location=None, include_recovered=False):
+    def load_all_items(self, filter_category=None, filter_location=None, include_recovered=False, search_text=None):
         
-        """Charger et afficher les objets avec filtrage et statut de récupération optionnels"""
+        """Charger et afficher la première page d'objets avec filtrage et statut de récupération optionnels.
+           Les pages suivantes sont ajoutées par load_next_browse_page au fil du défilement.
+           Avec search_text, les objets correspondant à ses mots-clés sont listés par pertinence à la place.
+        """
         
         if not self.databases_connected: return 
-        self.clear_layout(self.items_list_layout)
+        self.cancel_browse_loading()
+        self.items_model.clear()
 
-        loading_label = QLabel("Chargement des objets...") 
-        loading_label.setAlignment(Qt.AlignCenter); 
-        loading_label.setStyleSheet("color: #888; margin: 30px 0;")
-        self.items_list_layout.addWidget(loading_label)
-        QApplication.processEvents() 
-
-        
         cat_to_send = filter_category if filter_category != "Toutes les catégories" else None
         loc_to_send = filter_location if filter_location != "Tous les lieux" else None
+        self.browse_filters = (cat_to_send, loc_to_send, include_recovered, search_text if get_search_words(search_text) else None)
+        self.browse_next_key = None
+        self.browse_exhausted = False
+
+        self.items_status_label.setText("Chargement des objets...")
+        self.items_status_label.show()
 
-        items = get_all_items(cat_to_send, loc_to_send, include_recovered) 
-        self.clear_layout(self.items_list_layout)            
+        self.load_next_browse_page(first_page=True)
 
+    def load_next_browse_page(self, first_page=False):
+        """Lancer la récupération de la page qui suit le dernier objet affiché ; ses cartes sont ajoutées
+           par handle_browse_page_loaded quand le thread de travail la livre.
+        """
+        if self.browse_loading or self.browse_exhausted: return
+        # Se connecter ici, dans le thread de l'interface, puisqu'un échec de connexion affiche un dialogue
+        if not connect_to_mysql() or not connect_to_mongodb():
+            self.browse_exhausted = True # Ne pas réessayer (et réafficher le dialogue) à chaque défilement
+            if first_page:
+                self.items_status_label.setText("Impossible de se connecter à la base de données.")
+                self.items_status_label.show()
+            return
+        self.browse_loading = True
+        self.browse_loader.request_page(self.browse_filters, self.browse_next_key, first_page)
+
+    def handle_browse_page_loaded(self, generation, items, first_page):
+        """Ajouter une page livrée par le thread de consultation, sauf si son chargement a été annulé entre-temps."""
+        if generation != self.browse_loader.generation: return # Périmée : filtres changés ou page quittée
+        self.browse_loading = False
+
+        if first_page:
+            self.items_status_label.hide()
+        if len(items) < BROWSE_PAGE_SIZE:
+            self.browse_exhausted = True
         if not items:
-            no_items_label = QLabel("Aucun objet trouvé correspondant à vos critères.") 
-            no_items_label.setAlignment(Qt.AlignCenter);
-            no_items_label.setStyleSheet("color: #666; margin: 30px 0;")
-            self.items_list_layout.addWidget(no_items_label)
+            if first_page:
+                self.items_status_label.setText("Aucun objet trouvé correspondant à vos critères.")
+                self.items_status_label.show()
             return 
 
-        for item in items:
-            item_widget = self.create_item_widget(item, context='view_all')
-            self.items_list_layout.addWidget(item_widget) 
+        if self.browse_filters[3]:
+            self.browse_next_key = (self.browse_next_key or 0) + len(items) # Les résultats de recherche sont paginés par décalage
+        else:
+            self.browse_next_key = browse_page_key(items[-1])
+        self.items_model.append_items(items)
+        self.schedule_lazy_image_load()
+
+    def handle_browse_page_failed(self, generation, message, first_page):
+        """Signaler un chargement de page de consultation qui a échoué dans le thread de travail. La liste n'est
+           pas marquée comme épuisée, donc défiler à nouveau réessaie la page.
+        """
+        if generation != self.browse_loader.generation: return
+        self.browse_loading = False
+        if first_page:
+            self.items_status_label.setText("Échec du chargement des objets.")
+            self.items_status_label.show()
+        self.show_flash_message(f"Échec du chargement des objets : {message}", is_error=True)
+
+    def cancel_browse_loading(self):
+        """Annuler le chargement de page en cours ; ses résultats seront ignorés à leur arrivée."""
+        if self.browse_loading:
+            self.browse_loader.cancel()
+            self.browse_loading = False
+
+    def handle_page_changed(self, index):
+        """Quitter la page de consultation abandonne son chargement en attente ; y revenir en relance un nouveau."""
+        if index != 4:
+            self.cancel_browse_loading()
+        if index == 2 and self.current_user:
+            self.show_search_alerts()
+
+    def show_search_alerts(self):
+        """Informer l'utilisateur des objets publiés depuis sa dernière visite qui correspondent à ses recherches enregistrées"""
+        alerts = get_search_alerts(self.current_user['id_utilisateur'])
+        if not alerts: return
+        lines = [f"• {alert['titre']} ({alert['statut_objet']}, {alert['lieu']})" for alert in alerts[:SEARCH_ALERTS_SHOWN]]
+        if len(alerts) > SEARCH_ALERTS_SHOWN:
+            lines.append(f"... et {len(alerts) - SEARCH_ALERTS_SHOWN} autres")
+        mark_search_alerts_seen(self.current_user['id_utilisateur'], [alert['alert_id'] for alert in alerts])
+        QMessageBox.information(self, "Alertes de recherche",
+                                "De nouveaux objets correspondent à vos recherches enregistrées :\n\n" + "\n".join(lines))
+
+    def check_browse_scroll_position(self, *args):
+        """Charger la page suivante dès que la position de défilement approche du bas."""
+        if self.browse_exhausted or self.stacked_widget.currentIndex() != 4: return
+        scroll_bar = self.items_view.verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.value() <= BROWSE_PREFETCH_MARGIN_PX:
+            self.load_next_browse_page()
+
+    def can_claim_item(self, item_data):
+        """Indique si l'utilisateur connecté peut réclamer un objet affiché sur la page de consultation."""
+        return (self.current_user is not None and
+                item_data.get('statut_objet') in ['found', 'lost'] and
+                item_data.get('id_utilisateur_proprietaire') != self.current_user['id_utilisateur'])
 
 
     def show_profile_page(self):
@@ -1652,66 +3929,46 @@ class TawdrlikApp(QMainWindow):
     def load_claims_on_my_items(self):
         """Charger les réclamations faites par d'autres sur les objets appartenant à l'utilisateur actuel."""
         if not self.current_user or not self.databases_connected: return
-        self.clear_layout(self.claims_on_my_items_layout)
+        self.claims_on_my_items_model.clear()
 
-        loading_label = QLabel("Chargement des réclamations reçues..."); loading_label.setAlignment(Qt.AlignCenter); loading_label.setStyleSheet("color: #888; margin: 15px 0;") # "Loading received claims..." -> "Chargement des réclamations reçues..."
-        self.claims_on_my_items_layout.addWidget(loading_label)
+        self.claims_on_my_items_status_label.setText("Chargement des réclamations reçues...")
+        self.claims_on_my_items_status_label.setStyleSheet("color: #888; margin: 15px 0;")
+        self.claims_on_my_items_status_label.show()
         QApplication.processEvents()
 
-        # Besoin d'obtenir d'abord les objets appartenant à l'utilisateur, puis obtenir les réclamations pour chaque objet
-        
-        my_items = get_user_items(self.current_user['id_utilisateur']) 
-        
-        all_claims_on_my_items = []
-        for item in my_items:
-            # Afficher uniquement les réclamations pour les objets qui ne sont PAS encore récupérés
-            if item.get('status') != 'recovered':
-                claims_for_this_item = get_claims_for_item(item['id_objet'])
-                for claim in claims_for_this_item:
-                    claim['item_title'] = item['titre'] 
-                    all_claims_on_my_items.append(claim) 
-
-        # Trier les réclamations (par ex., par date, ou grouper par objet) - tri simple par date pour l'instant
-        all_claims_on_my_items.sort(key=lambda x: x['claim_created_at'], reverse=True)
-
-        self.clear_layout(self.claims_on_my_items_layout) 
+        # Une seule requête : réclamations sur les objets non récupérés de l'utilisateur, déjà triées par date
+        all_claims_on_my_items = get_claims_on_user_items(self.current_user['id_utilisateur'])
 
         if not all_claims_on_my_items:
-            no_claims_label = QLabel("Aucune réclamation en attente sur vos objets.") 
-            no_claims_label.setAlignment(Qt.AlignCenter)
-            no_claims_label.setStyleSheet("color: #666; margin: 15px 0;") 
-            self.claims_on_my_items_layout.addWidget(no_claims_label)
+            self.claims_on_my_items_status_label.setText("Aucune réclamation en attente sur vos objets.")
+            self.claims_on_my_items_status_label.setStyleSheet("color: #666; margin: 15px 0;")
             return
 
-        for claim in all_claims_on_my_items:
-            claim_widget = self.create_claim_widget(claim, context='owner_view')
-            self.claims_on_my_items_layout.addWidget(claim_widget)
+        self.claims_on_my_items_status_label.hide()
+        self.claims_on_my_items_model.append_items(all_claims_on_my_items)
+        self.schedule_lazy_image_load()
 
 
     def load_my_submitted_claims(self):
         """Charger les réclamations soumises par l'utilisateur actuel."""
         if not self.current_user or not self.databases_connected: return
-        self.clear_layout(self.my_claims_layout)
+        self.my_claims_model.clear()
 
-        loading_label = QLabel("Chargement de vos réclamations soumises...");
-        loading_label.setAlignment(Qt.AlignCenter); 
-        loading_label.setStyleSheet("color: #888; margin: 15px 0;") 
-        self.my_claims_layout.addWidget(loading_label)
+        self.my_claims_status_label.setText("Chargement de vos réclamations soumises...")
+        self.my_claims_status_label.setStyleSheet("color: #888; margin: 15px 0;")
+        self.my_claims_status_label.show()
         QApplication.processEvents()
 
         my_claims = get_claims_by_claimant(self.current_user['id_utilisateur'])
-        self.clear_layout(self.my_claims_layout)
 
         if not my_claims:
-            no_claims_label = QLabel("Vous n'avez pas encore soumis de réclamations.");
-            no_claims_label.setAlignment(Qt.AlignCenter);
-            no_claims_label.setStyleSheet("color: #666; margin: 15px 0;") 
-            self.my_claims_layout.addWidget(no_claims_label)
+            self.my_claims_status_label.setText("Vous n'avez pas encore soumis de réclamations.")
+            self.my_claims_status_label.setStyleSheet("color: #666; margin: 15px 0;")
             return
 
-        for claim in my_claims:
-            claim_widget = self.create_claim_widget(claim, context='claimant_view')
-            self.my_claims_layout.addWidget(claim_widget)
+        self.my_claims_status_label.hide()
+        self.my_claims_model.append_items(my_claims)
+        self.schedule_lazy_image_load()
 
 
     def create_item_widget(self, item_data, context='view_all'):
@@ -1733,11 +3990,10 @@ class TawdrlikApp(QMainWindow):
         image_label.setAlignment(Qt.AlignCenter)
         image_label.setStyleSheet("background-color: #f0f0f0; border-radius: 5px; border: 1px solid #ddd;")
 
-        pixmap = self.load_pixmap_from_data(item_data.get('image_data')) 
-        if pixmap:
-            scaled_pixmap = pixmap.scaled(image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            image_label.setPixmap(scaled_pixmap)
-            image_label.setToolTip("Image de l'objet") 
+        if item_data.get('id_mongo_details'):
+            image_label.setText("Chargement...")
+            self.register_lazy_image(image_label, get_item_thumbnails, item_data['id_mongo_details'],
+                                     "Image de l'objet", "Pas d'image", "Aucune image fournie")
         else:
             image_label.setText("Pas d'image") 
             image_label.setToolTip("Aucune image fournie")
@@ -1844,122 +4100,6 @@ class TawdrlikApp(QMainWindow):
         return item_widget
 
 
-    def create_claim_widget(self, claim_data, context='owner_view'):
-        """Crée un widget pour afficher une réclamation.
-           Contexte : 'owner_view' (vue propriétaire) ou 'claimant_view' (vue réclamant).
-           Inclut les détails de la réclamation, l'aperçu des preuves et les boutons spécifiques au contexte.
-           Attend un dictionnaire claim_data.
-        """
-        claim_widget = QWidget()
-        base_style = "border-radius: 6px; border: 1px solid #ccc; padding: 10px;"
-        claim_status = claim_data.get('claim_status', 'pending')
-        bg_color = "#ffffff" 
-        if claim_status == 'accepted': 
-            bg_color = "#e8f5e9" 
-        elif claim_status == 'rejected': 
-            bg_color = "#ffebee" 
-
-        claim_widget.setStyleSheet(f"background-color: {bg_color}; {base_style}")
-
-        main_layout = QVBoxLayout(claim_widget)
-        main_layout.setSpacing(8)
-
-        top_line_layout = QHBoxLayout() 
-        top_line_layout.setContentsMargins(0,0,0,0)
-
-        info_label = QLabel()
-        info_label.setStyleSheet("font-size: 13px;")
-        info_label.setWordWrap(True)
-        # Traduire les textes
-        if context == 'claimant_view':
-             item_title = claim_data.get('item_title', 'Objet inconnu') 
-             item_status_for_claim = claim_data.get('item_status', '?')
-             status_display_item = {'lost': 'PERDU', 'found': 'TROUVÉ', 'recovered': 'RÉCUPÉRÉ', '?':'?'} 
-             info_label.setText(f"Votre réclamation sur : <b>{item_title}</b> (Statut objet : {status_display_item.get(item_status_for_claim, item_status_for_claim.upper())})") 
-             info_label.setToolTip(f"Réclamation sur l'objet ID : {claim_data.get('id_objet_reclame')}") 
-        else: # owner_view
-             claimant_name = claim_data.get('claimant_username', 'Utilisateur inconnu') 
-             item_title_for_owner = claim_data.get('item_title', 'Votre Objet') 
-             info_label.setText(f"Réclamation par <b>{claimant_name}</b> sur : <i>{item_title_for_owner}</i>")
-             info_label.setToolTip(f"ID Réclamation : {claim_data.get('claim_id')}, ID Réclamant : {claim_data.get('id_utilisateur_reclamant')}")
-
-
-        # Traduire les statuts de réclamation pour l'affichage
-        status_display_claim = {'pending': 'EN ATTENTE', 'accepted': 'ACCEPTÉE', 'rejected': 'REJETÉE'}
-        status_label = QLabel(status_display_claim.get(claim_status, claim_status.upper()))
-        status_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        status_label.setFont(QFont(FONT_FAMILY, 9, QFont.Bold))
-        status_style = "color: white; padding: 3px 6px; border-radius: 4px; font-weight: bold;"
-        if claim_status == 'pending': status_label.setStyleSheet(f"background-color: #ffc107; {status_style}") 
-        elif claim_status == 'accepted': status_label.setStyleSheet(f"background-color: #4caf50; {status_style}") 
-        elif claim_status == 'rejected': status_label.setStyleSheet(f"background-color: #f44336; {status_style}") 
-        else: status_label.setStyleSheet(f"background-color: #bdbdbd; {status_style}") 
-        
-        top_line_layout.addWidget(info_label, 1) 
-        top_line_layout.addWidget(status_label)
-        main_layout.addLayout(top_line_layout)
-
-        # Raison de la réclamation
-        reason_label = QLabel(f"<b>Raison :</b> {claim_data.get('motif_reclamation', 'Aucune raison fournie.')}") 
-        reason_label.setStyleSheet("font-size: 12px; color: #333;") 
-        reason_label.setWordWrap(True)
-        main_layout.addWidget(reason_label) 
-
-        # Date de la réclamation
-        created_at_raw = claim_data.get('claim_created_at', '')
-        created_at_str = str(created_at_raw).split('.')[0] if created_at_raw else 'Date inconnue' 
-        date_label = QLabel(f"<i>Soumis le : {created_at_str}</i>") 
-        date_label.setStyleSheet("font-size: 11px; color: #666;") 
-        main_layout.addWidget(date_label)
-
-
-        # Image de preuve 
-        bottom_layout = QHBoxLayout()
-        bottom_layout.setContentsMargins(0, 5, 0, 0)
-
-        evidence_data = claim_data.get('evidence_image_data')
-        if evidence_data:
-             evidence_img_label = QLabel()
-             evidence_img_size = 60
-             evidence_img_label.setFixedSize(evidence_img_size, evidence_img_size)
-             evidence_img_label.setAlignment(Qt.AlignCenter)
-             evidence_img_label.setStyleSheet("background-color: #e0e0e0; border-radius: 4px; border: 1px solid #bbb;")
-             pixmap = self.load_pixmap_from_data(evidence_data)
-             if pixmap:
-                  scaled_pixmap = pixmap.scaled(evidence_img_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                  evidence_img_label.setPixmap(scaled_pixmap)
-                  evidence_img_label.setToolTip("Image de preuve fournie") 
-             else:
-                  evidence_img_label.setText("Preuve\nInvalide") 
-                  evidence_img_label.setToolTip("Impossible de charger l'image de preuve") 
-             bottom_layout.addWidget(evidence_img_label) 
-        else:
-             no_evidence_label = QLabel("<i>Aucune preuve fournie</i>") 
-             no_evidence_label.setStyleSheet("font-size: 11px; color: #888;")
-             bottom_layout.addWidget(no_evidence_label)
-
-
-        bottom_layout.addStretch() 
-
-        # Boutons d'action (Accepter/Rejeter pour le propriétaire sur les réclamations en attente)
-        if context == 'owner_view' and claim_status == 'pending':
-            accept_button = QPushButton(QIcon.fromTheme("dialog-ok-apply"), " Accepter") 
-            accept_button.setStyleSheet("background-color: #4caf50; color: white; padding: 5px 10px; border-radius: 4px; font-size: 11px; border: none;")
-            accept_button.setCursor(Qt.PointingHandCursor)
-            accept_button.clicked.connect(lambda checked, cid=claim_data['claim_id'], iid=claim_data['id_objet_reclame']: self.handle_accept_claim(cid, iid))
-            bottom_layout.addWidget(accept_button) 
-
-            reject_button = QPushButton(QIcon.fromTheme("dialog-cancel"), " Rejeter") 
-            reject_button.setStyleSheet("background-color: #f44336; color: white; padding: 5px 10px; border-radius: 4px; font-size: 11px; border: none;")
-            reject_button.setCursor(Qt.PointingHandCursor)
-            reject_button.clicked.connect(lambda checked, cid=claim_data['claim_id']: self.handle_reject_claim(cid))
-            bottom_layout.addWidget(reject_button)
-
-        main_layout.addLayout(bottom_layout)
-
-        return claim_widget
-
-
     def handle_claim_button_click(self, item_id):
         """Ouvre le dialogue de réclamation lorsque 'Réclamer cet objet' est cliqué."""
         if not self.current_user:
@@ -1979,8 +4119,8 @@ class TawdrlikApp(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             claim_data = dialog.get_claim_data()
             if claim_data:
-                reason, evidence_data = claim_data
-                success, message = submit_claim(item_id, self.current_user['id_utilisateur'], reason, evidence_data)
+                reason, evidence_path = claim_data
+                success, message = submit_claim(item_id, self.current_user['id_utilisateur'], reason, evidence_image_path=evidence_path)
                 if success:
                     self.show_flash_message(message) 
                     if self.stacked_widget.currentIndex() == 5: 
@@ -2028,11 +4168,123 @@ class TawdrlikApp(QMainWindow):
                   self.show_flash_message(f"Échec du rejet de la réclamation : {message}", is_error=True) 
 
 
-    def load_pixmap_from_data(self, image_data):
-        """Charger en toute sécurité un QPixmap à partir de données binaires."""
+    def register_lazy_image(self, label, fetch_images, mongo_id, tooltip, missing_text, missing_tooltip):
+        """Mettre en file un label d'image à remplir dès qu'il est réellement visible à l'écran.
+           fetch_images prend une liste d'identifiants mongo et une échelle de miniature, et retourne un dict identifiant -> octets de l'image.
+        """
+        self.pending_lazy_images.append({
+            'label': label, 'fetch_images': fetch_images, 'mongo_id': mongo_id, 'tooltip': tooltip,
+            'missing_text': missing_text, 'missing_tooltip': missing_tooltip
+        })
+        self.schedule_lazy_image_load()
+
+    def schedule_lazy_image_load(self, *args):
+        """Regrouper les événements de défilement/page/redimensionnement en une seule vérification de visibilité."""
+        if not self.lazy_image_timer.isActive():
+            self.lazy_image_timer.start(LAZY_IMAGE_DELAY_MS)
+
+    def load_visible_images(self):
+        """Récupérer et afficher les images des labels en attente actuellement visibles.
+           Les images d'un même type sont récupérées ensemble en une requête groupée.
+        """
+        visible_by_fetcher = {}
+        still_pending = []
+        for entry in self.pending_lazy_images:
+            label = entry['label']
+            try:
+                on_screen = label.isVisible() and not label.visibleRegion().isEmpty()
+            except RuntimeError:
+                continue # La carte a été supprimée avant d'être affichée
+            if on_screen:
+                group = (entry['fetch_images'], label.width(), label.height())
+                visible_by_fetcher.setdefault(group, []).append(entry)
+            else:
+                still_pending.append(entry)
+        self.pending_lazy_images = still_pending
+
+        # Utiliser les miniatures 2x sur les écrans HiDPI pour garder des aperçus nets
+        pixel_ratio = self.devicePixelRatioF()
+        scale = "2x" if pixel_ratio > 1 else "1x"
+        for (fetch_images, width, height), entries in visible_by_fetcher.items():
+            pixmaps = self.load_cached_pixmaps([entry['mongo_id'] for entry in entries], fetch_images,
+                                               QSize(width, height), scale, pixel_ratio)
+            for entry in entries:
+                label = entry['label']
+                pixmap = pixmaps.get(entry['mongo_id'])
+                try:
+                    if pixmap:
+                        label.setPixmap(pixmap)
+                        label.setToolTip(entry['tooltip'])
+                    else:
+                        label.setText(entry['missing_text'])
+                        label.setToolTip(entry['missing_tooltip'])
+                except RuntimeError:
+                    pass # La carte a été supprimée pendant le chargement de son image
+
+        current_page = self.stacked_widget.currentIndex()
+        if current_page == 4:
+            self.load_visible_list_images(self.items_view, get_item_thumbnails, ItemCardDelegate.IMAGE_SIZE, scale, pixel_ratio)
+        elif current_page == 5:
+            for claims_view in (self.claims_on_my_items_view, self.my_claims_view):
+                self.load_visible_list_images(claims_view, get_claim_evidence_thumbnails, ClaimCardDelegate.EVIDENCE_SIZE, scale, pixel_ratio)
+
+    def load_visible_list_images(self, view, fetch_images, size, scale, pixel_ratio):
+        """Récupérer les miniatures des lignes visibles d'une liste de cartes, en une seule requête groupée."""
+        model = view.model()
+        if not view.isVisible() or not model.rowCount():
+            return
+        viewport = view.viewport().rect()
+        first_index = view.indexAt(viewport.topLeft())
+        if not first_index.isValid():
+            return
+        last_index = view.indexAt(viewport.bottomLeft())
+        last_row = last_index.row() if last_index.isValid() else model.rowCount() - 1
+        mongo_ids = model.pending_image_ids(first_index.row(), last_row)
+        if not mongo_ids:
+            return
+
+        model.set_images(self.load_cached_pixmaps(mongo_ids, fetch_images, QSize(size, size), scale, pixel_ratio))
+
+    def load_cached_pixmaps(self, mongo_ids, fetch_images, size, scale, pixel_ratio):
+        """Pixmaps prêts à afficher pour mongo_ids à la taille size (pixels logiques), None si aucune image utilisable.
+           Servis depuis pixmap_cache si possible ; seuls les absents sont récupérés, en une requête groupée.
+        """
+        target_size = size * pixel_ratio
+        pixmaps = {}
+        missing_ids = []
+        for mongo_id in mongo_ids:
+            pixmap = pixmap_cache.get(mongo_id, target_size)
+            if pixmap is None:
+                missing_ids.append(mongo_id)
+            else:
+                pixmaps[mongo_id] = pixmap
+        if not missing_ids:
+            return pixmaps
+
+        images = fetch_images(missing_ids, scale)
+        for mongo_id in missing_ids:
+            pixmap = self.load_pixmap_from_data(images.get(mongo_id), target_size)
+            if pixmap:
+                pixmap.setDevicePixelRatio(pixel_ratio)
+                pixmap_cache.put(mongo_id, target_size, pixmap)
+            pixmaps[mongo_id] = pixmap
+        return pixmaps
+
+    def resizeEvent(self, event):
+        """Agrandir la fenêtre peut révéler des cartes dont l'image n'est pas encore chargée."""
+        super().resizeEvent(event)
+        self.schedule_lazy_image_load()
+
+    def load_pixmap_from_data(self, image_data, size=None):
+        """Charger en toute sécurité un QPixmap à partir de données binaires.
+           Avec size (pixels physiques), l'image est décodée directement à une taille qui y tient.
+        """
         if not image_data:
             return None 
         try:
+            if size is not None:
+                image = decode_image_scaled(image_data, size)
+                return QPixmap.fromImage(image) if not image.isNull() else None
             pixmap = QPixmap() 
             buffer = QBuffer()
             buffer.setData(bytes(image_data)) 
@@ -2068,10 +4320,13 @@ def main():
     window.show()
 
     def cleanup():
-        global mysql_connection, mongo_client
-        if mysql_connection and mysql_connection.is_connected():
+        global mongo_client
+        stats = pixmap_cache.stats()
+        print(f"Cache de pixmaps : {stats['hits']} succès, {stats['misses']} échecs ({stats['hit_rate']:.0%} de réussite), "
+              f"{stats['evictions']} évictions, {stats['bytes'] // 1024} Ko dans {stats['entries']} entrées.")
+        if mysql_pool is not None:
             try:
-                mysql_connection.close()
+                close_mysql_pool()
                 print("Connexion MySQL fermée.") 
             except Exception as e:
                  print(f"Erreur lors de la fermeture de la connexion MySQL : {e}") 
@@ -2081,6 +4336,10 @@ def main():
                 print("Connexion MongoDB fermée.") 
             except Exception as e:
                  print(f"Erreur lors de la fermeture de la connexion MongoDB : {e}")
+        try:
+            close_thumbnail_disk_cache()
+        except OSError as e:
+            print(f"Erreur lors de la fermeture du cache disque des miniatures : {e}")
 
     app.aboutToQuit.connect(cleanup)
     sys.exit(app.exec_())
@@ -0,0 +1,837 @@
+import sys
+import os
+import json
+import hashlib
+import time
+import argparse
+import io
+import multiprocessing
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import DuplicateKeyError
+import gridfs
+import mysql.connector
+from bson.objectid import ObjectId
+from bson.binary import Binary
+
+from PyQt5.QtGui import QImage, QImageReader
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice, QSize, QCoreApplication
+
+# Maintenance commands for Tawdrlik. They talk to the databases directly and never
+# go through the desktop application, so they can be run against the full corpus
+# while the app is in use.
+#
+#   python "twadrlik maintenance.py" backfill-thumbnails [--collection items_detail] [--workers 4]
+#   python "twadrlik maintenance.py" migrate-gridfs [--collection items_detail] [--batch-size 50]
+#   python "twadrlik maintenance.py" dedup-images [--collection items_detail] [--batch-size 50]
+#   python "twadrlik maintenance.py" backfill-image-hashes [--batch-size 50]
+#   python "twadrlik maintenance.py" migrate-schema --schema en [--dry-run] [--target 1]
+#   python "twadrlik maintenance.py" explain-queries --schema en
+
+# Database configuration (keep in sync with the application scripts)
+MONGODB_URI = "mongodb://localhost:27017/"
+MONGODB_DB = "tawdrlikDB"
+MYSQL_HOST = "localhost"
+MYSQL_USER = "root"
+MYSQL_PASSWORD = "Mohamed@mysql"
+# The English and French builds keep their tables in different databases
+MYSQL_DATABASES = {'en': 'tawdrlik_DB', 'fr': 'tawdrlikDB'}
+
+# Thumbnail settings (keep in sync with make_thumbnails in the application scripts)
+ITEM_THUMBNAIL_SIZE = 100
+EVIDENCE_THUMBNAIL_SIZE = 60
+THUMBNAIL_SCALES = (1, 2)
+THUMBNAIL_JPEG_QUALITY = 85
+
+# GridFS settings (keep in sync with the image storage functions in the application scripts)
+GRIDFS_BUCKET = "images"
+GRIDFS_CHUNK_SIZE = 255 * 1024
+IMAGE_BLOBS_COLLECTION = "image_blobs"
+
+# Collection -> (original image field, thumbnail box size)
+THUMBNAIL_SOURCES = {
+    'items_detail': ('image', ITEM_THUMBNAIL_SIZE),
+    'claims_detail': ('evidence_image', EVIDENCE_THUMBNAIL_SIZE),
+}
+
+DEFAULT_CHECKPOINT_FILE = "backfill_thumbnails.checkpoint.json"
+# Collection -> original image field, for every collection that can hold originals
+IMAGE_SOURCES = {
+    'items_detail': 'image',
+    'claims_detail': 'evidence_image',
+    IMAGE_BLOBS_COLLECTION: 'data',
+}
+IMAGE_KINDS = {'items_detail': 'item', 'claims_detail': 'claim_evidence', IMAGE_BLOBS_COLLECTION: 'blob'}
+
+DEFAULT_GRIDFS_CHECKPOINT_FILE = "migrate_gridfs.checkpoint.json"
+DEFAULT_DEDUP_CHECKPOINT_FILE = "dedup_images.checkpoint.json"
+
+# Secondary indexes behind the browse, profile and claim queries (schema version 1).
+# Schema -> [(table, index name, key parts)]. The DESC parts match the ORDER BY of each query so rows
+# are read back already sorted instead of going through a filesort (descending indexes need MySQL 8.0).
+SCHEMA_INDEXES = {
+    'en': [
+        ('items', 'idx_items_browse', "status, date DESC, created_at DESC, id DESC"),
+        ('items', 'idx_items_category_browse', "category, status, date DESC, created_at DESC, id DESC"),
+        ('items', 'idx_items_location_browse', "location, status, date DESC, created_at DESC, id DESC"),
+        ('items', 'idx_items_owner', "user_id, created_at DESC"),
+        ('claims', 'idx_claims_item', "item_id, created_at DESC"),
+        ('claims', 'idx_claims_claimant', "claimant_id, created_at DESC"),
+    ],
+    'fr': [
+        ('objets', 'idx_objets_consultation', "statut_objet, date_evenement DESC, date_signalement DESC, id_objet DESC"),
+        ('objets', 'idx_objets_categorie_consultation', "categorie, statut_objet, date_evenement DESC, date_signalement DESC, id_objet DESC"),
+        ('objets', 'idx_objets_lieu_consultation', "lieu, statut_objet, date_evenement DESC, date_signalement DESC, id_objet DESC"),
+        ('objets', 'idx_objets_proprietaire', "id_utilisateur_proprietaire, date_signalement DESC"),
+        ('reclamations', 'idx_reclamations_objet', "id_objet_reclame, date_soumission_reclamation DESC"),
+        ('reclamations', 'idx_reclamations_reclamant', "id_utilisateur_reclamant, date_soumission_reclamation DESC"),
+    ],
+}
+
+# Saved-search tables, created by migration 3 (CREATE TABLE IF NOT EXISTS, so rerunning is harmless)
+SAVED_SEARCH_TABLES = {
+    'en': [
+        """CREATE TABLE IF NOT EXISTS saved_searches (
+           id INT AUTO_INCREMENT PRIMARY KEY,
+           user_id INT NOT NULL,
+           category VARCHAR(100) NULL,
+           location VARCHAR(255) NULL,
+           keywords VARCHAR(255) NULL,
+           status ENUM('lost', 'found') NULL,
+           created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+           FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+       ) ENGINE=InnoDB""",
+        """CREATE TABLE IF NOT EXISTS search_alerts (
+           id INT AUTO_INCREMENT PRIMARY KEY,
+           user_id INT NOT NULL,
+           saved_search_id INT NOT NULL,
+           item_id INT NOT NULL,
+           seen BOOLEAN NOT NULL DEFAULT FALSE,
+           created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+           FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+           FOREIGN KEY (saved_search_id) REFERENCES saved_searches(id) ON DELETE CASCADE,
+           FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE,
+           -- One alert per search and item
+           UNIQUE KEY uq_search_alerts (saved_search_id, item_id),
+           -- A user's unseen alerts, newest first
+           INDEX idx_search_alerts_user (user_id, seen, created_at DESC)
+       ) ENGINE=InnoDB""",
+    ],
+    'fr': [
+        """CREATE TABLE IF NOT EXISTS recherches_enregistrees (
+           id_recherche INT AUTO_INCREMENT PRIMARY KEY,
+           id_utilisateur INT NOT NULL,
+           categorie VARCHAR(100) NULL,
+           lieu VARCHAR(255) NULL,
+           mots_cles VARCHAR(255) NULL,
+           statut_objet ENUM('lost', 'found') NULL,
+           date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+           CONSTRAINT fk_recherches_utilisateurs FOREIGN KEY (id_utilisateur) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE
+       ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci""",
+        """CREATE TABLE IF NOT EXISTS alertes_recherche (
+           id_alerte INT AUTO_INCREMENT PRIMARY KEY,
+           id_utilisateur INT NOT NULL,
+           id_recherche INT NOT NULL,
+           id_objet INT NOT NULL,
+           vue BOOLEAN NOT NULL DEFAULT FALSE,
+           date_alerte TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+           CONSTRAINT fk_alertes_utilisateurs FOREIGN KEY (id_utilisateur) REFERENCES utilisateurs(id_utilisateur) ON DELETE CASCADE,
+           CONSTRAINT fk_alertes_recherches FOREIGN KEY (id_recherche) REFERENCES recherches_enregistrees(id_recherche) ON DELETE CASCADE,
+           CONSTRAINT fk_alertes_objets FOREIGN KEY (id_objet) REFERENCES objets(id_objet) ON DELETE CASCADE,
+           -- Une alerte par recherche et par objet
+           UNIQUE KEY uq_alertes_recherche (id_recherche, id_objet),
+           -- Alertes non vues d'un utilisateur, les plus récentes d'abord
+           INDEX idx_alertes_utilisateur (id_utilisateur, vue, date_alerte DESC)
+       ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci""",
+    ],
+}
+
+# Versioned schema migrations, applied in order by migrate-schema and recorded in SCHEMA_MIGRATIONS_TABLE.
+# Schema -> [(version, description, steps)]. A step is ('add_index', table, name, key parts),
+# ('add_fulltext_index', table, name, columns), ('add_column', table, column, definition) or ('sql', statement). The add_* steps are skipped when their
+# index/column already exists, so a migration interrupted halfway can simply be run again.
+# Never edit a released migration: append a new version instead, to both schemas, and mirror the end
+# state in the .sql schema files (which record the version they correspond to).
+SCHEMA_MIGRATIONS_TABLE = "schema_migrations"
+SCHEMA_MIGRATIONS = {
+    schema: [
+        (1, "Browse, profile and claim indexes",
+         [('add_index', table, index_name, key_parts) for table, index_name, key_parts in SCHEMA_INDEXES[schema]]),
+        (2, "Keyword search index", [
+            {'en': ('add_fulltext_index', 'items', 'ft_items_search', "title, description"),
+             'fr': ('add_fulltext_index', 'objets', 'ft_objets_recherche', "titre, description_meta")}[schema],
+        ]),
+        (3, "Saved searches and alerts", [('sql', statement) for statement in SAVED_SEARCH_TABLES[schema]]),
+    ]
+    for schema in ('en', 'fr')
+}
+# Index builds and column additions run online: concurrent reads and writes continue while they are built
+ONLINE_DDL_OPTIONS = "ALGORITHM=INPLACE, LOCK=NONE"
+# InnoDB cannot build a FULLTEXT index with LOCK=NONE: reads continue, but writes wait for the build
+FULLTEXT_DDL_OPTIONS = "ALGORITHM=INPLACE, LOCK=SHARED"
+
+# The hot queries as the application scripts issue them (keep in sync with get_all_items, get_user_items,
+# get_claims_for_item and get_claims_by_claimant). Schema -> [(name, query, sample parameters)].
+BROWSE_SELECT = {
+    'en': """SELECT i.id, i.user_id, i.title, i.category, i.location, i.date, i.status, i.mongo_id, i.created_at,
+                    u.username AS owner_username
+             FROM items i JOIN users u ON i.user_id = u.id""",
+    'fr': """SELECT o.id_objet, o.id_utilisateur_proprietaire, o.titre, o.categorie, o.lieu, o.date_evenement, o.statut_objet,
+                    o.id_mongo_details, o.date_signalement, u.nom_utilisateur AS proprietaire_nom_utilisateur
+             FROM objets o JOIN utilisateurs u ON o.id_utilisateur_proprietaire = u.id_utilisateur""",
+}
+HOT_QUERIES = {
+    'en': [
+        ('browse', BROWSE_SELECT['en'] + """
+             WHERE i.status != %s ORDER BY i.status, i.date DESC, i.created_at DESC, i.id DESC LIMIT %s""",
+         ('recovered', 50)),
+        ('browse by category', BROWSE_SELECT['en'] + """
+             WHERE i.status != %s AND i.category = %s ORDER BY i.status, i.date DESC, i.created_at DESC, i.id DESC LIMIT %s""",
+         ('recovered', 'Electronics', 50)),
+        ('browse by location', BROWSE_SELECT['en'] + """
+             WHERE i.status != %s AND i.location = %s ORDER BY i.status, i.date DESC, i.created_at DESC, i.id DESC LIMIT %s""",
+         ('recovered', 'Library', 50)),
+        ('user items', BROWSE_SELECT['en'] + """
+             WHERE i.user_id = %s ORDER BY i.created_at DESC""",
+         (1,)),
+        ('claims for item', """SELECT c.id AS claim_id, c.item_id, c.claimant_id, c.reason, c.status AS claim_status,
+                    c.mongo_detail_id, c.created_at AS claim_created_at, u.username AS claimant_username
+             FROM claims c JOIN users u ON c.claimant_id = u.id
+             WHERE c.item_id = %s ORDER BY c.created_at DESC""",
+         (1,)),
+        ('claims by claimant', """SELECT c.id AS claim_id, c.item_id, c.claimant_id, c.reason, c.status AS claim_status,
+                    c.mongo_detail_id, c.created_at AS claim_created_at,
+                    i.title AS item_title, i.status AS item_status, i.mongo_id AS item_mongo_id
+             FROM claims c JOIN items i ON c.item_id = i.id
+             WHERE c.claimant_id = %s ORDER BY c.created_at DESC""",
+         (1,)),
+    ],
+    'fr': [
+        ('browse', BROWSE_SELECT['fr'] + """
+             WHERE o.statut_objet != %s ORDER BY o.statut_objet, o.date_evenement DESC, o.date_signalement DESC, o.id_objet DESC LIMIT %s""",
+         ('recovered', 50)),
+        ('browse by category', BROWSE_SELECT['fr'] + """
+             WHERE o.statut_objet != %s AND o.categorie = %s
+             ORDER BY o.statut_objet, o.date_evenement DESC, o.date_signalement DESC, o.id_objet DESC LIMIT %s""",
+         ('recovered', 'Électronique', 50)),
+        ('browse by location', BROWSE_SELECT['fr'] + """
+             WHERE o.statut_objet != %s AND o.lieu = %s
+             ORDER BY o.statut_objet, o.date_evenement DESC, o.date_signalement DESC, o.id_objet DESC LIMIT %s""",
+         ('recovered', 'Bibliothèque', 50)),
+        ('user items', BROWSE_SELECT['fr'] + """
+             WHERE o.id_utilisateur_proprietaire = %s ORDER BY o.date_signalement DESC""",
+         (1,)),
+        ('claims for item', """SELECT r.id_reclamation AS claim_id, r.id_objet_reclame, r.id_utilisateur_reclamant, r.motif_reclamation,
+                    r.statut_reclamation AS claim_status, r.id_mongo_preuve, r.date_soumission_reclamation AS claim_created_at,
+                    u.nom_utilisateur AS claimant_username
+             FROM reclamations r JOIN utilisateurs u ON r.id_utilisateur_reclamant = u.id_utilisateur
+             WHERE r.id_objet_reclame = %s ORDER BY r.date_soumission_reclamation DESC""",
+         (1,)),
+        ('claims by claimant', """SELECT r.id_reclamation AS claim_id, r.id_objet_reclame, r.id_utilisateur_reclamant, r.motif_reclamation,
+                    r.statut_reclamation AS claim_status, r.id_mongo_preuve, r.date_soumission_reclamation AS claim_created_at,
+                    o.titre AS item_title, o.statut_objet AS item_status, o.id_mongo_details AS item_mongo_id
+             FROM reclamations r JOIN objets o ON r.id_objet_reclame = o.id_objet
+             WHERE r.id_utilisateur_reclamant = %s ORDER BY r.date_soumission_reclamation DESC""",
+         (1,)),
+    ],
+}
+
+
+def connect_to_mongodb(uri, db_name):
+    client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+    client.admin.command('ismaster')
+    return client, client[db_name]
+
+def get_gridfs_bucket(db):
+    return gridfs.GridFSBucket(db, bucket_name=GRIDFS_BUCKET, chunk_size_bytes=GRIDFS_CHUNK_SIZE)
+
+def read_stored_image(bucket, doc, image_field):
+    """Return the original image bytes of a document, whether embedded or stored in GridFS."""
+    if doc.get(image_field):
+        return doc[image_field]
+    file_id = doc.get(f"{image_field}_file_id")
+    if file_id is None:
+        return None
+    data = bytearray()
+    with bucket.open_download_stream(file_id) as stream:
+        while True:
+            chunk = stream.readchunk()
+            if not chunk:
+                break
+            data.extend(chunk)
+    return bytes(data)
+
+def read_document_image(db, bucket, doc, image_field):
+    """Original image of a document, from the shared blob store (see dedup-images) or from the document itself."""
+    if doc.get(f"{image_field}_hash"):
+        blob = db[IMAGE_BLOBS_COLLECTION].find_one({"_id": doc[f"{image_field}_hash"]}, {"data": 1, "data_file_id": 1})
+        return read_stored_image(bucket, blob, "data") if blob else None
+    return read_stored_image(bucket, doc, image_field)
+
+
+# --- Checkpointing ---
+
+def load_checkpoint(path):
+    """Return the {collection: last processed _id string} mapping saved by a previous run."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_checkpoint(path, checkpoint):
+    """Write the checkpoint atomically so an interrupted run never leaves a corrupt file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+# --- Thumbnail generation (runs in worker processes) ---
+
+_worker_app = None
+
+def init_worker():
+    # Image format plugins are located through the core application
+    global _worker_app
+    if QCoreApplication.instance() is None:
+        _worker_app = QCoreApplication([])
+
+def decode_image_scaled(image_data, box_size):
+    """Same as decode_image_scaled in the application: decode straight to a size fitting in box_size."""
+    buffer = QBuffer()
+    buffer.setData(bytes(image_data))
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    original_size = reader.size()
+    if original_size.isValid() and (original_size.width() > box_size.width() or original_size.height() > box_size.height()):
+        reader.setScaledSize(original_size.scaled(box_size, Qt.KeepAspectRatio).expandedTo(QSize(1, 1)))
+    image = reader.read()
+    if not image.isNull() and (image.width() > box_size.width() or image.height() > box_size.height()):
+        image = image.scaled(box_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+def make_thumbnails(image_data, box_size):
+    """Same encoding as make_thumbnails in the application. Returns {"1x": bytes, "2x": bytes} or None."""
+    largest_side = box_size * max(THUMBNAIL_SCALES)
+    image = decode_image_scaled(image_data, QSize(largest_side, largest_side))
+    if image.isNull():
+        return None
+    thumbnails = {}
+    for scale in THUMBNAIL_SCALES:
+        side = box_size * scale
+        if image.width() > side or image.height() > side:
+            thumb = image.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        else:
+            thumb = image
+        encoded = QByteArray()
+        buffer = QBuffer(encoded)
+        buffer.open(QIODevice.WriteOnly)
+        if thumb.hasAlphaChannel():
+            saved = thumb.save(buffer, "PNG")
+        else:
+            saved = thumb.save(buffer, "JPEG", THUMBNAIL_JPEG_QUALITY)
+        buffer.close()
+        if not saved:
+            return None
+        thumbnails[f"{scale}x"] = bytes(encoded)
+    return thumbnails
+
+def compute_image_dhash(image_data):
+    """Same as compute_image_dhash in the application: 64-bit difference hash, or None if undecodable."""
+    image = decode_image_scaled(image_data, QSize(64, 64))
+    if image.isNull():
+        return None
+    image = image.convertToFormat(QImage.Format_Grayscale8).scaled(9, 8, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    dhash = 0
+    for y in range(8):
+        for x in range(8):
+            dhash = (dhash << 1) | (image.pixelColor(x, y).red() > image.pixelColor(x + 1, y).red())
+    return dhash
+
+def thumbnail_job(job):
+    """Worker entry point: job is (document id, image bytes, box size)."""
+    doc_id, image_data, box_size = job
+    try:
+        return doc_id, make_thumbnails(image_data, box_size)
+    except Exception as e:
+        print(f"Error generating thumbnails for {doc_id}: {e}")
+        return doc_id, None
+
+
+# --- Backfill ---
+
+def iter_batches(cursor, batch_size):
+    batch = []
+    for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def backfill_collection(pool, db, collection_name, batch_size, checkpoint, checkpoint_file, limit=None):
+    """Generate thumbnails for every document of a collection that has an original image but no thumbnails.
+       Documents are streamed in _id order, so the run can resume after the last checkpointed _id.
+    """
+    image_field, box_size = THUMBNAIL_SOURCES[collection_name]
+    collection = db[collection_name]
+    file_id_field = f"{image_field}_file_id"
+    hash_field = f"{image_field}_hash"
+    bucket = get_gridfs_bucket(db)
+    size_key = str(box_size)
+
+    # Originals are embedded, stored in GridFS (see migrate-gridfs) or shared through image_blobs (see dedup-images)
+    query = {"$or": [{image_field: {"$ne": None}}, {file_id_field: {"$exists": True}}, {hash_field: {"$exists": True}}],
+             "thumbnails": None}
+    last_id = checkpoint.get(collection_name)
+    if last_id:
+        query["_id"] = {"$gt": ObjectId(last_id)}
+        print(f"[{collection_name}] Resuming after _id {last_id}")
+
+    cursor = collection.find(query, {image_field: 1, file_id_field: 1, hash_field: 1}).sort("_id", 1).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    processed = failed = 0
+    started = time.time()
+    for batch in iter_batches(cursor, batch_size):
+        # GridFS files and blobs are read here so workers only deal with bytes
+        jobs = [(doc['_id'], read_document_image(db, bucket, doc, image_field), box_size) for doc in batch]
+        hashes = {doc['_id']: doc[hash_field] for doc in batch if doc.get(hash_field)}
+        updates = []
+        blob_updates = []
+        for doc_id, thumbnails in pool.imap_unordered(thumbnail_job, jobs):
+            if thumbnails is None:
+                # Store an empty set so undecodable images are not retried; the app falls back to the original
+                failed += 1
+                thumbnails = {}
+            else:
+                thumbnails = {scale: Binary(data) for scale, data in thumbnails.items()}
+                if doc_id in hashes:
+                    # Later uploads of the same content reuse them (see acquire_image_blob in the application)
+                    blob_updates.append(UpdateOne({"_id": hashes[doc_id], f"thumbnails.{size_key}": {"$exists": False}},
+                                                  {"$set": {f"thumbnails.{size_key}": thumbnails}}))
+            # The application reads thumbnails from the document itself, blob-backed or not
+            updates.append(UpdateOne({"_id": doc_id, "thumbnails": None}, {"$set": {"thumbnails": thumbnails}}))
+        if updates:
+            collection.bulk_write(updates, ordered=False)
+        if blob_updates:
+            db[IMAGE_BLOBS_COLLECTION].bulk_write(blob_updates, ordered=False)
+
+        processed += len(batch)
+        checkpoint[collection_name] = str(batch[-1]['_id'])
+        save_checkpoint(checkpoint_file, checkpoint)
+
+        elapsed = time.time() - started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        print(f"[{collection_name}] {processed} images ({failed} undecodable), {rate:.1f} images/sec")
+
+    elapsed = time.time() - started
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    print(f"[{collection_name}] Done: {processed} images in {elapsed:.1f}s ({rate:.1f} images/sec)")
+    return processed
+
+def command_backfill_thumbnails(args):
+    collections = list(THUMBNAIL_SOURCES) if args.collection == 'all' else [args.collection]
+    checkpoint = {} if args.restart else load_checkpoint(args.checkpoint_file)
+
+    client, db = connect_to_mongodb(args.mongodb_uri, args.mongodb_db)
+    try:
+        with multiprocessing.Pool(args.workers, initializer=init_worker) as pool:
+            for collection_name in collections:
+                backfill_collection(pool, db, collection_name, args.batch_size,
+                                    checkpoint, args.checkpoint_file, args.limit)
+    finally:
+        client.close()
+    return 0
+
+
+# --- GridFS migration ---
+
+def migrate_collection_to_gridfs(db, collection_name, batch_size, checkpoint, checkpoint_file, limit=None):
+    """Move embedded original images of a collection into the GridFS bucket.
+       Each document keeps '<image field>_file_id' and its embedded Binary is cleared. The update only
+       applies if the document was not migrated in the meantime; otherwise the uploaded file is removed.
+    """
+    image_field = IMAGE_SOURCES[collection_name]
+    collection = db[collection_name]
+    file_id_field = f"{image_field}_file_id"
+    bucket = get_gridfs_bucket(db)
+    kind = IMAGE_KINDS[collection_name]
+
+    query = {image_field: {"$ne": None}, file_id_field: {"$exists": False}}
+    last_id = checkpoint.get(collection_name)
+    if last_id:
+        query["_id"] = {"$gt": ObjectId(last_id)}
+        print(f"[{collection_name}] Resuming after _id {last_id}")
+
+    # Small batches: every document carries a full-size image
+    cursor = collection.find(query, {image_field: 1}).sort("_id", 1).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    migrated = skipped = total_bytes = 0
+    started = time.time()
+    for batch in iter_batches(cursor, batch_size):
+        for doc in batch:
+            image_data = bytes(doc[image_field])
+            file_id = bucket.upload_from_stream(image_field, io.BytesIO(image_data),
+                                                metadata={"kind": kind, "source_id": doc['_id']})
+            result = collection.update_one(
+                {"_id": doc['_id'], file_id_field: {"$exists": False}},
+                {"$set": {file_id_field: file_id, image_field: None}}
+            )
+            if result.modified_count:
+                migrated += 1
+                total_bytes += len(image_data)
+            else:
+                bucket.delete(file_id)
+                skipped += 1
+
+        checkpoint[collection_name] = str(batch[-1]['_id'])
+        save_checkpoint(checkpoint_file, checkpoint)
+
+        elapsed = time.time() - started
+        rate = total_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+        print(f"[{collection_name}] {migrated} images migrated ({skipped} skipped), {rate:.1f} MB/sec")
+
+    elapsed = time.time() - started
+    print(f"[{collection_name}] Done: {migrated} images, {total_bytes / (1024 * 1024):.1f} MB in {elapsed:.1f}s")
+    return migrated
+
+def command_migrate_gridfs(args):
+    collections = list(IMAGE_SOURCES) if args.collection == 'all' else [args.collection]
+    checkpoint = {} if args.restart else load_checkpoint(args.checkpoint_file)
+
+    client, db = connect_to_mongodb(args.mongodb_uri, args.mongodb_db)
+    try:
+        for collection_name in collections:
+            migrate_collection_to_gridfs(db, collection_name, args.batch_size,
+                                         checkpoint, args.checkpoint_file, args.limit)
+    finally:
+        client.close()
+    return 0
+
+
+# --- Image deduplication ---
+
+def reference_image_blob(db, content_hash, doc, image_field, box_size):
+    """Take a reference on the blob for content_hash, creating it from the document's own storage if needed.
+       Returns True when the blob already existed (the document's copy is then redundant).
+    """
+    blobs = db[IMAGE_BLOBS_COLLECTION]
+    while True:
+        if blobs.find_one_and_update({"_id": content_hash}, {"$inc": {"refcount": 1}}, projection={"_id": 1}):
+            return True
+        blob = {"_id": content_hash, "refcount": 1, "data": None}
+        file_id = doc.get(f"{image_field}_file_id")
+        if file_id is not None:
+            # The GridFS file simply changes owner, nothing is copied
+            blob["data_file_id"] = file_id
+        else:
+            blob["data"] = Binary(bytes(doc[image_field]))
+        if doc.get("thumbnails") is not None:
+            blob["thumbnails"] = {str(box_size): doc["thumbnails"]}
+        try:
+            blobs.insert_one(blob)
+            return False
+        except DuplicateKeyError:
+            continue
+
+def dedup_collection(db, collection_name, batch_size, checkpoint, checkpoint_file, limit=None):
+    """Point every document that still owns its original image at the shared, reference-counted blob
+       for that content (see acquire_image_blob in the application) and drop redundant copies.
+       Run a single instance at a time.
+    """
+    image_field, box_size = THUMBNAIL_SOURCES[collection_name]
+    collection = db[collection_name]
+    file_id_field = f"{image_field}_file_id"
+    hash_field = f"{image_field}_hash"
+    bucket = get_gridfs_bucket(db)
+
+    query = {"$or": [{image_field: {"$ne": None}}, {file_id_field: {"$exists": True}}],
+             hash_field: {"$exists": False}}
+    last_id = checkpoint.get(collection_name)
+    if last_id:
+        query["_id"] = {"$gt": ObjectId(last_id)}
+        print(f"[{collection_name}] Resuming after _id {last_id}")
+
+    cursor = collection.find(query, {image_field: 1, file_id_field: 1, "thumbnails": 1}).sort("_id", 1).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    processed = duplicates = freed_bytes = 0
+    started = time.time()
+    for batch in iter_batches(cursor, batch_size):
+        for doc in batch:
+            image_data = read_stored_image(bucket, doc, image_field)
+            if not image_data:
+                continue
+            content_hash = hashlib.sha256(bytes(image_data)).hexdigest()
+            existed = reference_image_blob(db, content_hash, doc, image_field, box_size)
+            collection.update_one({"_id": doc['_id']},
+                                  {"$set": {hash_field: content_hash, image_field: None},
+                                   "$unset": {file_id_field: ""}})
+            processed += 1
+            if existed:
+                duplicates += 1
+                freed_bytes += len(image_data)
+                if doc.get(file_id_field) is not None:
+                    bucket.delete(doc[file_id_field])
+
+        checkpoint[collection_name] = str(batch[-1]['_id'])
+        save_checkpoint(checkpoint_file, checkpoint)
+        print(f"[{collection_name}] {processed} images, {duplicates} duplicates, "
+              f"{freed_bytes / (1024 * 1024):.1f} MB freed")
+
+    elapsed = time.time() - started
+    print(f"[{collection_name}] Done: {processed} images, {duplicates} duplicates in {elapsed:.1f}s")
+    return processed
+
+def command_dedup_images(args):
+    collections = list(THUMBNAIL_SOURCES) if args.collection == 'all' else [args.collection]
+    checkpoint = {} if args.restart else load_checkpoint(args.checkpoint_file)
+
+    client, db = connect_to_mongodb(args.mongodb_uri, args.mongodb_db)
+    try:
+        for collection_name in collections:
+            dedup_collection(db, collection_name, args.batch_size,
+                             checkpoint, args.checkpoint_file, args.limit)
+    finally:
+        client.close()
+    return 0
+
+
+# --- MySQL indexes ---
+
+def connect_to_mysql(args):
+    return mysql.connector.connect(host=args.mysql_host, user=args.mysql_user, password=args.mysql_password,
+                                   database=args.mysql_database or MYSQL_DATABASES[args.schema])
+
+def get_index_names(cursor, table):
+    cursor.execute(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,)
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+def get_column_names(cursor, table):
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,)
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+def migration_step_statement(cursor, step):
+    """SQL for one migration step, or None when the step's change is already in place."""
+    kind = step[0]
+    if kind == 'add_index':
+        _, table, index_name, key_parts = step
+        if index_name in get_index_names(cursor, table):
+            return None
+        return f"ALTER TABLE `{table}` ADD INDEX `{index_name}` ({key_parts}), {ONLINE_DDL_OPTIONS}"
+    if kind == 'add_fulltext_index':
+        _, table, index_name, columns = step
+        if index_name in get_index_names(cursor, table):
+            return None
+        return f"ALTER TABLE `{table}` ADD FULLTEXT INDEX `{index_name}` ({columns}), {FULLTEXT_DDL_OPTIONS}"
+    if kind == 'add_column':
+        _, table, column, definition = step
+        if column in get_column_names(cursor, table):
+            return None
+        return f"ALTER TABLE `{table}` ADD COLUMN `{column}` {definition}, {ONLINE_DDL_OPTIONS}"
+    if kind == 'sql':
+        return step[1]
+    raise ValueError(f"Unknown migration step {kind!r}")
+
+def get_applied_versions(cursor):
+    """Versions recorded in SCHEMA_MIGRATIONS_TABLE, or None when the table does not exist yet."""
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (SCHEMA_MIGRATIONS_TABLE,)
+    )
+    if not cursor.fetchone()[0]:
+        return None
+    cursor.execute(f"SELECT version FROM `{SCHEMA_MIGRATIONS_TABLE}`")
+    return {row[0] for row in cursor.fetchall()}
+
+def command_migrate_schema(args):
+    """Apply the pending SCHEMA_MIGRATIONS up to --target, recording each version once all its steps ran.
+       MySQL commits DDL implicitly, so a failed migration is not rolled back; its steps are idempotent and
+       the version stays pending, so rerunning the command picks up where it stopped.
+    """
+    connection = connect_to_mysql(args)
+    connection.autocommit = True
+    cursor = connection.cursor()
+    try:
+        applied = get_applied_versions(cursor)
+        if applied is None:
+            create_table = (f"CREATE TABLE `{SCHEMA_MIGRATIONS_TABLE}` ("
+                            "version INT PRIMARY KEY, description VARCHAR(255) NOT NULL, "
+                            "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP) ENGINE=InnoDB")
+            print(("Would run: " if args.dry_run else "") + create_table)
+            if not args.dry_run:
+                cursor.execute(create_table)
+            applied = set()
+
+        pending = [migration for migration in SCHEMA_MIGRATIONS[args.schema]
+                   if migration[0] not in applied and (args.target is None or migration[0] <= args.target)]
+        if not pending:
+            print(f"Schema '{args.schema}' is up to date (version {max(applied, default=0)})")
+            return 0
+
+        for version, description, steps in pending:
+            print(f"Migration {version}: {description}")
+            for step in steps:
+                statement = migration_step_statement(cursor, step)
+                if statement is None:
+                    print(f"  Already applied: {step[:3]}")
+                elif args.dry_run:
+                    print(f"  Would run: {statement}")
+                else:
+                    started = time.time()
+                    cursor.execute(statement)
+                    print(f"  Ran in {time.time() - started:.1f}s: {statement}")
+            if not args.dry_run:
+                cursor.execute(f"INSERT INTO `{SCHEMA_MIGRATIONS_TABLE}` (version, description) VALUES (%s, %s)",
+                               (version, description))
+    finally:
+        cursor.close()
+        connection.close()
+    return 0
+
+def explain_problems(plan_row):
+    """Reasons the EXPLAIN row for one table looks like it does not use an index properly."""
+    problems = []
+    if plan_row.get('type') == 'ALL':
+        problems.append("full table scan")
+    extra = plan_row.get('Extra') or ''
+    if 'Using filesort' in extra:
+        problems.append("filesort")
+    if 'Using temporary' in extra:
+        problems.append("temporary table")
+    return problems
+
+def command_explain_queries(args):
+    """EXPLAIN each hot query and report scans and sorts that an index should have removed.
+       The optimizer prefers full scans on near-empty tables, so run this against representative data.
+    """
+    connection = connect_to_mysql(args)
+    cursor = connection.cursor(dictionary=True)
+    flagged = 0
+    try:
+        for name, query, params in HOT_QUERIES[args.schema]:
+            cursor.execute("EXPLAIN " + query, params)
+            print(f"{name}:")
+            for plan_row in cursor.fetchall():
+                problems = explain_problems(plan_row)
+                flagged += bool(problems)
+                print(f"  {plan_row.get('table')}: type={plan_row.get('type')} key={plan_row.get('key')} "
+                      f"rows={plan_row.get('rows')} extra={plan_row.get('Extra') or ''}"
+                      + (f"  <-- {', '.join(problems)}" if problems else ""))
+    finally:
+        cursor.close()
+        connection.close()
+    print(f"{flagged} plan rows flagged")
+    return 1 if flagged else 0
+
+
+# --- Image hashes ---
+
+def command_backfill_image_hashes(args):
+    """Store the dHash of item photos saved before save_item computed it. Documents are picked by the missing
+       image_dhash field, so an interrupted run just resumes; undecodable or missing images get None.
+    """
+    init_worker()
+    client, db = connect_to_mongodb(args.mongodb_uri, args.mongodb_db)
+    bucket = get_gridfs_bucket(db)
+    started = time.time()
+    processed = 0
+    try:
+        query = {"image_dhash": {"$exists": False}}
+        projection = {"image": 1, "image_file_id": 1, "image_hash": 1}
+        while args.limit is None or processed < args.limit:
+            batch_size = args.batch_size if args.limit is None else min(args.batch_size, args.limit - processed)
+            docs = list(db.items_detail.find(query, projection).sort("_id", 1).limit(batch_size))
+            if not docs:
+                break
+            updates = []
+            for doc in docs:
+                image_data = read_document_image(db, bucket, doc, "image")
+                dhash = compute_image_dhash(image_data) if image_data else None
+                updates.append(UpdateOne({"_id": doc["_id"]},
+                                         {"$set": {"image_dhash": f"{dhash:016x}" if dhash is not None else None}}))
+            db.items_detail.bulk_write(updates, ordered=False)
+            processed += len(docs)
+            print(f"[items_detail] {processed} images hashed ({processed / max(time.time() - started, 1e-6):.1f}/s)")
+    finally:
+        client.close()
+    print(f"[items_detail] Done: {processed} images in {time.time() - started:.1f}s")
+    return 0
+
+
+# --- Entry point ---
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Tawdrlik maintenance commands")
+    parser.add_argument('--mongodb-uri', default=MONGODB_URI)
+    parser.add_argument('--mongodb-db', default=MONGODB_DB)
+    parser.add_argument('--mysql-host', default=MYSQL_HOST)
+    parser.add_argument('--mysql-user', default=MYSQL_USER)
+    parser.add_argument('--mysql-password', default=MYSQL_PASSWORD)
+    parser.add_argument('--mysql-database', default=None, help="Defaults to the database of the chosen --schema")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    backfill = subparsers.add_parser('backfill-thumbnails',
+                                     help="Generate thumbnails for images stored before upload-time thumbnails existed")
+    backfill.add_argument('--collection', choices=['all'] + list(THUMBNAIL_SOURCES), default='all')
+    backfill.add_argument('--workers', type=int, default=os.cpu_count() or 2)
+    backfill.add_argument('--batch-size', type=int, default=200)
+    backfill.add_argument('--limit', type=int, default=None, help="Process at most this many images per collection")
+    backfill.add_argument('--checkpoint-file', default=DEFAULT_CHECKPOINT_FILE)
+    backfill.add_argument('--restart', action='store_true', help="Ignore the saved checkpoint and start from the beginning")
+    backfill.set_defaults(func=command_backfill_thumbnails)
+
+    migrate = subparsers.add_parser('migrate-gridfs',
+                                    help="Move embedded original images into GridFS (set IMAGE_STORAGE = \"gridfs\" in the app)")
+    migrate.add_argument('--collection', choices=['all'] + list(IMAGE_SOURCES), default='all')
+    migrate.add_argument('--batch-size', type=int, default=50)
+    migrate.add_argument('--limit', type=int, default=None, help="Migrate at most this many images per collection")
+    migrate.add_argument('--checkpoint-file', default=DEFAULT_GRIDFS_CHECKPOINT_FILE)
+    migrate.add_argument('--restart', action='store_true', help="Ignore the saved checkpoint and start from the beginning")
+    migrate.set_defaults(func=command_migrate_gridfs)
+
+    dedup = subparsers.add_parser('dedup-images',
+                                  help="Move existing originals into the shared content-addressed image store")
+    dedup.add_argument('--collection', choices=['all'] + list(THUMBNAIL_SOURCES), default='all')
+    dedup.add_argument('--batch-size', type=int, default=50)
+    dedup.add_argument('--limit', type=int, default=None, help="Process at most this many images per collection")
+    dedup.add_argument('--checkpoint-file', default=DEFAULT_DEDUP_CHECKPOINT_FILE)
+    dedup.add_argument('--restart', action='store_true', help="Ignore the saved checkpoint and start from the beginning")
+    dedup.set_defaults(func=command_dedup_images)
+
+    image_hashes = subparsers.add_parser('backfill-image-hashes',
+                                         help="Compute the look-alike photo hash of item images saved before it existed")
+    image_hashes.add_argument('--batch-size', type=int, default=50)
+    image_hashes.add_argument('--limit', type=int, default=None, help="Process at most this many images")
+    image_hashes.set_defaults(func=command_backfill_image_hashes)
+
+    migrate_schema = subparsers.add_parser('migrate-schema',
+                                           help="Apply pending MySQL schema migrations (indexes are built online)")
+    migrate_schema.add_argument('--schema', choices=list(SCHEMA_MIGRATIONS), required=True)
+    migrate_schema.add_argument('--target', type=int, default=None, help="Stop after this migration version")
+    migrate_schema.add_argument('--dry-run', action='store_true', help="Print the statements without running them")
+    migrate_schema.set_defaults(func=command_migrate_schema)
+
+    explain = subparsers.add_parser('explain-queries',
+                                    help="EXPLAIN the hot queries and flag full scans, filesorts and temporary tables")
+    explain.add_argument('--schema', choices=list(HOT_QUERIES), required=True)
+    explain.set_defaults(func=command_explain_queries)
+    return parser
+
+def main():
+    args = build_parser().parse_args()
+    sys.exit(args.func(args))
+
+if __name__ == "__main__":
+    main()